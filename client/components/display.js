@@ -1,3 +1,10 @@
+// Degrees the molecule turns per pixel it is dragged
+const dragDegrees = 0.5;
+// Mouse position while the molecule is dragged, null otherwise
+var drag = null;
+// Rotation stream of the displayed molecule ({ name, source, id, atomBonds, sending, pending }), null if there is none
+var rotationStream = null;
+
 $(document).ready(
     function () {
         // GET request to get list of molecules in database and add molecules to sidebar
@@ -14,6 +21,7 @@ $(document).ready(
         $("#rotate-button").attr("disabled", true)
         $("#rotate-button").click( () => {
             if (isFieldEmpty() == false) {
+                closeRotationStream();
                 // POST request to rotate molecule and get new svg
                 $.ajax( {
                     url: "/rotate-svg",
@@ -35,6 +43,43 @@ $(document).ready(
                 alert("There are empty fields! Ensure that all fields are filled in correctly before rotating the molecule")
             }
         })
+
+        // Play button handling
+        $("#play-button").attr("disabled", true)
+        $("#play-button").click( () => {
+            if (isFieldEmpty() == false) {
+                closeRotationStream();
+                playFrames($("#molecule-svg-image").attr("value"));
+            } else {
+                alert("There are empty fields! Ensure that all fields are filled in correctly before playing the frames")
+            }
+        })
+
+        // Drag rotation handling. Horizontal drags turn the molecule about the y-axis and vertical drags about the x-axis
+        $("#molecule-svg-image").on("mousedown", (event) => {
+            if ($("#molecule-svg-image").attr("value") !== "" && isFieldEmpty() == false) {
+                drag = { x: event.pageX, y: event.pageY };
+                openRotationStream($("#molecule-svg-image").attr("value"));
+                event.preventDefault();
+            }
+        })
+        $(document).on("mousemove", (event) => {
+            if (drag !== null) {
+                var yaw = Math.round((event.pageX - drag.x) * dragDegrees);
+                var pitch = Math.round((drag.y - event.pageY) * dragDegrees);
+                if (yaw != 0 || pitch != 0) {
+                    // Keep the rest of the distance dragged for the next move
+                    drag.x += yaw / dragDegrees;
+                    drag.y -= pitch / dragDegrees;
+                    $("#x-value").val(addAngle($("#x-value").val(), pitch));
+                    $("#y-value").val(addAngle($("#y-value").val(), yaw));
+                    sendRotation();
+                }
+            }
+        })
+        $(document).on("mouseup", () => {
+            drag = null;
+        })
     }
 );
 
@@ -42,13 +87,13 @@ $(document).ready(
 // Creates the molecules list in the sidebar
 function addSidebarMolecules(moleculeList) {
     for (let i = 0; i < moleculeList.length; i++) {
-        var molData = moleculeList[i];
+        let molData = moleculeList[i];
         var listItem = $(
             '<a class="molecule-list-item"></a>'
         )
         listItem.append(
-            '<label class="molecule-name">' + molData.name + ' (' + molData.atomNum + ' atoms, ' + molData.bondNum + ' bonds) </label>'
-        ).attr('onClick', "displayMolecule(\'" + molData.name + "\')")
+            $('<label class="molecule-name"></label>').text(molData.name + ' (' + molData.atomNum + ' atoms, ' + molData.bondNum + ' bonds) ')
+        ).on('click', () => displayMolecule(molData.name))
         
         listItem.appendTo("#molecule-list");
     }
@@ -57,6 +102,7 @@ function addSidebarMolecules(moleculeList) {
 
 // POST request to get svg string of molecule and display the svg of the selected molecule
 function displayMolecule(molName) {
+    closeRotationStream();
     $.post("/get-svg",
     {
         name: molName
@@ -69,12 +115,180 @@ function displayMolecule(molName) {
             $("#molecule-svg-image").attr("value", molName);
             $("#molecule-name").text("Molecule: " + molName)
             $("#rotate-button").attr("disabled", false)
+            $("#play-button").attr("disabled", false)
         } else {
             alert("Display failed... Problem with code");
         }
     });
 }
 
+// POST request to stream the frames (conformers or trajectory snapshots) of a molecule and display them in turn.
+// The server sends one JSON object per line, frames are shown as they arrive
+function playFrames(molName) {
+    var frames = [];
+    var streamDone = false;
+    var timer = setInterval(() => {
+        if (frames.length > 0) {
+            $("#molecule-svg-image").html(frames.shift().svg);
+        } else if (streamDone) {
+            clearInterval(timer);
+        }
+    }, 100);
+
+    fetch("/play-frames", {
+        method: "POST",
+        body: new URLSearchParams({
+            name: molName,
+            xRot: $("#x-value").val(),
+            yRot: $("#y-value").val(),
+            zRot: $("#z-value").val()
+        })
+    }).then(async (response) => {
+        if (!response.ok) {
+            throw new Error(response.status);
+        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        var buffer = "";
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) {
+                break;
+            }
+            // Keep the last, possibly incomplete, line for the next read
+            buffer += decoder.decode(value, { stream: true });
+            var lines = buffer.split("\n");
+            buffer = lines.pop();
+            for (let i = 0; i < lines.length; i++) {
+                if (lines[i] !== "") {
+                    frames.push(JSON.parse(lines[i]));
+                }
+            }
+        }
+        streamDone = true;
+    }).catch(() => {
+        streamDone = true;
+        alert("Play failed... Ensure that the pitch/yaw/roll angles are valid (non-negative integers only)");
+    });
+}
+
+// Open a stream of the rotations of the molecule <molName> (server-sent events), starting at the angles in the fields.
+// The server sends the compact svg of the molecule once, then only the atoms that moved and the atoms and bonds that
+// changed places in the z-order
+function openRotationStream(molName) {
+    if (rotationStream !== null && rotationStream.name == molName) {
+        return;
+    }
+    closeRotationStream();
+
+    var source = new EventSource("/rotate-stream?" + new URLSearchParams({
+        name: molName,
+        xRot: $("#x-value").val(),
+        yRot: $("#y-value").val(),
+        zRot: $("#z-value").val()
+    }));
+    var stream = { name: molName, source: source, id: null, atomBonds: {}, sending: false, pending: false };
+    rotationStream = stream;
+
+    source.addEventListener("session", (event) => {
+        var session = JSON.parse(event.data);
+        stream.id = session.id;
+        // Bonds at each atom, with the end of the bond at that atom
+        for (let i = 0; i < session.bonds.length; i++) {
+            for (let end = 1; end <= 2; end++) {
+                var atomId = "a" + session.bonds[i][end - 1];
+                stream.atomBonds[atomId] = (stream.atomBonds[atomId] || []).concat([{ id: "b" + i, end: end }]);
+            }
+        }
+        if (stream.pending) {
+            sendRotation();
+        }
+    });
+    source.addEventListener("frame", (event) => {
+        $("#molecule-svg-image").html(event.data);
+    });
+    source.addEventListener("diff", (event) => {
+        applyRotationDiff(stream, JSON.parse(event.data));
+    });
+    // The server ends idle streams; the next drag opens a new one
+    source.addEventListener("end", () => {
+        if (rotationStream === stream) {
+            closeRotationStream();
+        }
+    });
+    source.onerror = () => {
+        if (rotationStream === stream) {
+            closeRotationStream();
+        }
+    };
+}
+
+// Close the rotation stream, if there is one
+function closeRotationStream() {
+    if (rotationStream !== null) {
+        rotationStream.source.close();
+        rotationStream = null;
+    }
+}
+
+// POST request to send the angles in the fields to the rotation stream. Only one request is sent at a time, and angles
+// that change while it is sent are sent together once it finishes
+function sendRotation() {
+    var stream = rotationStream;
+    if (stream === null) {
+        return;
+    }
+    if (stream.id === null || stream.sending) {
+        stream.pending = true;
+        return;
+    }
+
+    stream.sending = true;
+    stream.pending = false;
+    fetch("/rotate-update", {
+        method: "POST",
+        body: new URLSearchParams({
+            session: stream.id,
+            xRot: $("#x-value").val(),
+            yRot: $("#y-value").val(),
+            zRot: $("#z-value").val()
+        })
+    }).catch(() => {}).finally(() => {
+        stream.sending = false;
+        if (stream.pending && rotationStream === stream) {
+            sendRotation();
+        }
+    });
+}
+
+// Move the atoms ("a<index>": [x, y]) of the displayed svg of the rotation stream <stream> and the ends of their bonds,
+// then move atoms and bonds to their new places in the z-order ([id, id of the element it goes before or null])
+function applyRotationDiff(stream, diff) {
+    var svg = $("#molecule-svg-image svg")[0];
+    if (svg === undefined) {
+        return;
+    }
+
+    for (const id in diff.move || {}) {
+        let position = diff.move[id];
+        document.getElementById(id).setAttribute("x", position[0]);
+        document.getElementById(id).setAttribute("y", position[1]);
+        for (const bond of stream.atomBonds[id] || []) {
+            document.getElementById(bond.id).setAttribute("x" + bond.end, position[0]);
+            document.getElementById(bond.id).setAttribute("y" + bond.end, position[1]);
+        }
+    }
+
+    for (const [id, before] of diff.order || []) {
+        svg.insertBefore(document.getElementById(id), before === null ? null : document.getElementById(before));
+    }
+}
+
+// Add <degrees> to the angle field value <value>, keeping it between 0 and 359
+function addAngle(value, degrees) {
+    return (((parseInt(value) || 0) + degrees) % 360 + 360) % 360;
+}
+
 // Check if there are empty fields. Return true is at least one field empty and false if not 
 function isFieldEmpty() {
     if ($("#x-value").val() === "" ||
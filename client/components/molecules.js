@@ -51,22 +51,47 @@ function getMoleculeList() {
 function refreshMoleculesTable(molecules) {
     // Empty current table and add header row
     $("#molecule-table").empty().append(
-        '<tr> <th> Molecule ID </th> <th> Molecule Name </th> <th> Number of Atoms </th> <th> Number of Bonds </th> </tr>'
+        '<tr> <th> Molecule ID </th> <th> Molecule Name </th> <th> Number of Atoms </th> <th> Number of Bonds </th> <th> Delete Molecule </th> </tr>'
     );
 
     // Append molecule rows
     for (let i = 0; i < molecules.length; i++) {
-        var mol = molecules[i];
+        let mol = molecules[i];
         var tableRow = $('<tr>');
-        tableRow.attr('id', mol.code);
+        tableRow.attr('id', 'molecule-' + mol.id);
+        // Molecule names are set as text so they are never parsed as html
         tableRow.append(
-            '<td> ' + mol.id + ' </td> <td> ' + mol.name + ' </td> <td> ' + mol.atomNum + ' </td> <td> ' + mol.bondNum + ' </td> '
+            $('<td>').text(mol.id),
+            $('<td>').text(mol.name),
+            $('<td>').text(mol.atomNum),
+            $('<td>').text(mol.bondNum)
         );
+        // Delete molecule button
+        var deleteButton = $('<td> <button class="delete-molecule-button"> Delete </button> </td>');
+        deleteButton.on('click', () => removeMolecule(mol.name, mol.id));
 
+        tableRow.append(deleteButton)
         tableRow.appendTo("#molecule-table");
     }
 }
 
+// POST request to remove molecule from database
+function removeMolecule(molName, molId) {
+    $.ajax({
+        url: "/remove-molecule",
+        type: "POST",
+        data: {
+            name: molName
+        },
+        success: function () {
+            $("#molecule-" + molId).remove();
+        },
+        error: function () {
+            alert("Failed to remove molecule. It may have already been removed.");
+        }
+    });
+}
+
 // Check if there are empty fields. Return true is at least one field empty and false if not
 function isFieldEmpty() {
     if ($("#molecule-name").val() === "" ||
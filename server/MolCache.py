@@ -0,0 +1,76 @@
+import collections
+import threading
+import molecule
+import MolDisplay
+import MolFlight
+
+# Bytes counted for each cached molecule on top of its molsize(), for the Python objects that hold it (the
+# Molecule proxy, its name and the cache entry)
+entry_overhead = 512
+
+# MolCache Class: Memory-bounded LRU cache of loaded, unsorted and unrotated molecules keyed by name.
+# Molecules are handed out as copies (molcopy in the C core) so callers can sort and rotate them freely.
+# Safe to use from several request handler threads. Molecules are loaded without holding the lock, so a miss does
+# not hold up the other lookups, and concurrent misses for the same name share one load (see MolFlight.SingleFlight)
+# Members: loader - Function that loads a molecule by name on a cache miss
+#          max_bytes - Maximum number of bytes held, as counted by molsize() plus entry_overhead for each molecule
+#          hits, misses - Number of get() calls served from the cache / the loader
+# Methods: get() - Get a copy of a molecule
+#          invalidate() - Drop a molecule that was removed or replaced
+class MolCache ():
+    def __init__(self, loader, max_bytes=64 * 1024 * 1024):
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.loads = MolFlight.SingleFlight()
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        # Incremented by invalidate(), so a load that started before a molecule changed is not cached
+        self.version = 0
+
+    def get(self, name):
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None:
+                self.hits += 1
+                self.entries.move_to_end(name)
+            else:
+                self.misses += 1
+            version = self.version
+
+        if entry is not None:
+            cachedMol = entry[0]
+        else:
+            cachedMol = self.loads.do((name, version), lambda: self.load(name, version))
+
+        # Cached molecules are never changed, so they can be copied outside the lock
+        newMol = MolDisplay.Molecule()
+        newMol.copy_from(cachedMol)
+        return newMol
+
+    def invalidate(self, name):
+        with self.lock:
+            self.version += 1
+            entry = self.entries.pop(name, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    # Load the molecule <name> and cache it, unless a molecule was invalidated since <version>. Empty molecules (the
+    # loader finds no atoms for names that are not in the database) are not cached
+    def load(self, name, version):
+        cachedMol = self.loader(name)
+        if cachedMol.atom_no == 0:
+            return cachedMol
+        molSize = molecule.molsize(cachedMol) + entry_overhead
+
+        with self.lock:
+            if version == self.version and name not in self.entries and molSize <= self.max_bytes:
+                self.entries[name] = (cachedMol, molSize)
+                self.size += molSize
+                # Evict least recently used molecules
+                while self.size > self.max_bytes:
+                    _, (_, evictedSize) = self.entries.popitem(last=False)
+                    self.size -= evictedSize
+        return cachedMol
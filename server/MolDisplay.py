@@ -1,4 +1,9 @@
 import molecule
+import array
+import hashlib
+import math
+import struct
+import zlib
 from MolExceptions import InvalidSdf
 
 '''
@@ -16,6 +21,9 @@ offsety = 500
 
 radius = {}
 element_name = {}
+# Gradient colours (colour1, colour2, colour3 as hex strings) of each element code, used for png images
+colours = {}
+default_colours = ("E2E8F0", "718096", "1A202C")
 
 '''
 ******************
@@ -59,6 +67,32 @@ class Atom ():
 
         return '  <circle cx="%.2f" cy="%.2f" r="%d" fill="url(#%s)"/>\n' % (x, y, atomRadius, atomColour)
 
+    # Compact svg: place the element's symbol (see compact_header()) at integer pixel coordinates
+    def compact_svg(self):
+        x = round(self.cAtom.x * 100.0 + offsetx)
+        y = round(self.cAtom.y * 100.0 + offsety)
+
+        return '<use href="#%s" x="%d" y="%d"/>' % (self.cAtom.element, x, y)
+
+    # Whether the circles of the Atom and the atom <other> overlap
+    def covers(self, other):
+        distance = math.hypot(self.cAtom.x - other.cAtom.x, self.cAtom.y - other.cAtom.y) * 100.0
+        return distance < radius.get(self.cAtom.element, 30) + radius.get(other.cAtom.element, 30)
+
+    # Whether the circle of the Atom overlaps the 20 pixel wide line of the bond <bond> (see Bond.svg())
+    def overlaps(self, bond):
+        x = self.cAtom.x * 100.0
+        y = self.cAtom.y * 100.0
+        x1 = bond.cBond.x1 * 100.0
+        y1 = bond.cBond.y1 * 100.0
+        dx = bond.cBond.x2 * 100.0 - x1
+        dy = bond.cBond.y2 * 100.0 - y1
+
+        # Distance from the centre of the Atom to the closest point of the bond
+        lengthSquared = dx * dx + dy * dy
+        t = 0.0 if lengthSquared == 0 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / lengthSquared))
+        return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy)) < radius.get(self.cAtom.element, 30) + 10
+
 # Bond Class: Wrapper class for the bond structure in mol.h
 # Members: bond - The c_bond structure
 #          z - The z-coordinate of the Bond
@@ -82,6 +116,12 @@ class Bond ():
         return '  <polygon points="%.2f,%.2f %.2f,%.2f %.2f,%.2f %.2f,%.2f" fill="green"/>\n' \
             % (bottomA1.x, bottomA1.y, topA1.x, topA1.y, topA2.x, topA2.y, bottomA2.x, bottomA2.y)
 
+    # Compact svg: end points of the bond at integer pixel coordinates. Stroked 20 pixels wide with butt ends
+    # (see compact_header()), the line between them covers the same quad as the polygon of svg()
+    def compact_points(self):
+        return (Point(round(self.cBond.x1 * 100 + offsetx), round(self.cBond.y1 * 100 + offsety)),
+                Point(round(self.cBond.x2 * 100 + offsetx), round(self.cBond.y2 * 100 + offsety)))
+
 # Molecule Class: Wrapper class for the molecule structure in mol.h
 # Methods: svg() - Creates an svg object string for the Molecule
 #          parse() - Parses a .sdf file and populates the Molecule class
@@ -102,34 +142,67 @@ class Molecule (molecule.molecule):
         return printStr
         
     def svg(self):
-        svgStr = header
+        return "".join(self.svg_chunks())
+
+    # Generator version of svg(): yields the header, each atom/bond in ascending z-order, then the footer
+    def svg_chunks(self):
+        yield header
         atomIndex = 0
         bondIndex = 0
         # Merge atoms and bonds by ascending z-value
         while atomIndex < self.atom_no and bondIndex < self.bond_no:
             if self.get_atom(atomIndex).z < self.get_bond(bondIndex).z:
-                newAtom = Atom(self.get_atom(atomIndex))
-                svgStr += newAtom.svg()
+                yield Atom(self.get_atom(atomIndex)).svg()
                 atomIndex += 1
             else:
-                newBond = Bond(self.get_bond(bondIndex))
-                svgStr += newBond.svg()
+                yield Bond(self.get_bond(bondIndex)).svg()
                 bondIndex += 1
 
-        # Append all remaining atoms (if any)
+        # Yield all remaining atoms (if any)
         while atomIndex < self.atom_no:
-            newAtom = Atom(self.get_atom(atomIndex))
-            svgStr += newAtom.svg()
+            yield Atom(self.get_atom(atomIndex)).svg()
             atomIndex += 1
-        # Append all remaining bonds (if any)
+        # Yield all remaining bonds (if any)
         while bondIndex < self.bond_no:
-            newBond = Bond(self.get_bond(bondIndex))
-            svgStr += newBond.svg()
+            yield Bond(self.get_bond(bondIndex)).svg()
             bondIndex += 1
-        
-        svgStr += footer
-        
-        return svgStr
+
+        yield footer
+
+    # Compact version of svg_chunks(): atoms are <use> references to the element symbols and bonds are merged into
+    # paths stroked by the root element. A bond is added to the current path, drawing it under the atoms that come
+    # before it in z-order, as long as it does not overlap any of those atoms
+    def compact_svg_chunks(self):
+        yield header
+        atomIndex = 0
+        bondIndex = 0
+        pathBonds = []
+        pathAtoms = []
+        while atomIndex < self.atom_no or bondIndex < self.bond_no:
+            if bondIndex >= self.bond_no or (atomIndex < self.atom_no and self.get_atom(atomIndex).z < self.get_bond(bondIndex).z):
+                atom = Atom(self.get_atom(atomIndex))
+                if any(atom.overlaps(bond) for bond in pathBonds) or any(atom.covers(other) for other in pathAtoms):
+                    pathAtoms.append(atom)
+                else:
+                    yield atom.compact_svg()
+                atomIndex += 1
+            else:
+                bond = Bond(self.get_bond(bondIndex))
+                if any(atom.overlaps(bond) for atom in pathAtoms):
+                    yield '<path d="%s"/>' % path_data(pathBonds)
+                    for atom in pathAtoms:
+                        yield atom.compact_svg()
+                    pathBonds = []
+                    pathAtoms = []
+                pathBonds.append(bond)
+                bondIndex += 1
+
+        if pathBonds:
+            yield '<path d="%s"/>' % path_data(pathBonds)
+        for atom in pathAtoms:
+            yield atom.compact_svg()
+
+        yield footer
 
     def parse(self, filePtr):
         i = 1
@@ -145,6 +218,7 @@ class Molecule (molecule.molecule):
                 if i == 4:
                     numAtoms = int(lineContent[0])
                     numBonds = int(lineContent[1])
+                    self.reserve(numAtoms, numBonds)
                 # Atom information
                 elif i <= (4 + numAtoms):
                     self.append_atom(lineContent[3], float(lineContent[0]), float(lineContent[1]), float(lineContent[2]))
@@ -162,6 +236,154 @@ class Molecule (molecule.molecule):
 
             i += 1
 
+    # Parse the remaining records of a multi-record sdf file (conformers or trajectory frames of the molecule
+    # read by parse()), stopping at the end of the file or at a multipart form boundary.
+    # Returns a list of frames, each a list of (x, y, z) coordinates in atom order
+    def parse_frames(self, filePtr):
+        elements = [self.get_atom(i).element for i in range(self.atom_no)]
+        frames = []
+        coords = []
+        i = 0   # Line number within the current record, 0 while skipping to the next record
+        for line in filePtr:
+            if line.startswith("--"):
+                break
+            if line.startswith("$$$$"):
+                i = 1
+                continue
+            if i == 0:
+                continue
+
+            lineContent = line.split()
+            try:
+                # Atom number information, the topology must be the same as the first record
+                if i == 4:
+                    if int(lineContent[0]) != self.atom_no:
+                        raise Exception
+                    coords = []
+                # Atom information
+                elif i > 4:
+                    if lineContent[3] != elements[i - 5]:
+                        raise Exception
+                    coords.append((float(lineContent[0]), float(lineContent[1]), float(lineContent[2])))
+            except:
+                raise InvalidSdf("Record %d of the SDF file does not have the same atoms as the first record" % (len(frames) + 2))
+
+            # Bonds and properties are shared with the first record, skip to the next record
+            if i == 4 + self.atom_no:
+                frames.append(coords)
+                i = 0
+            else:
+                i += 1
+
+        return frames
+
+    # Set the coordinates of the atoms (in the order they were appended) to the frame <coords>, a list of (x, y, z)
+    def set_frame(self, coords):
+        self.set_coord_records(array.array("d", [c for xyz in coords for c in xyz]))
+
+    # Get the coordinates of the atoms (in the order they were appended) as a list of (x, y, z), like set_frame() takes
+    def get_frame(self):
+        coords = array.array("d")
+        coords.frombytes(self.coord_records())
+        return list(zip(coords[0::3], coords[1::3], coords[2::3]))
+
+    # Canonical order of the atoms: by element and coordinates (rounded to the precision stored in the database).
+    # Returns a list of (element, coordinates, atom index) in that order. Molecules with the same structure list
+    # the same atoms, whatever order their sdf files had the atoms in
+    def canonical_atoms(self):
+        atomKeys = []
+        for i in range(self.atom_no):
+            cAtom = self.get_atom(i)
+            coords = tuple(round(c, 4) + 0.0 for c in (cAtom.x, cAtom.y, cAtom.z))
+            atomKeys.append((cAtom.element, coords, i))
+        atomKeys.sort()
+        return atomKeys
+
+    # Canonical content hash of the molecule's structure (elements, coordinates and bonds).
+    # Atoms are taken in canonical order (see canonical_atoms()), so the same structure gives the same hash
+    # regardless of the atom order in the sdf file
+    def content_hash(self):
+        atomKeys = self.canonical_atoms()
+
+        # Map original atom indices to canonical indices
+        canonIndex = {}
+        for newIndex, (_, _, oldIndex) in enumerate(atomKeys):
+            canonIndex[oldIndex] = newIndex
+
+        bondKeys = []
+        for i in range(self.bond_no):
+            cBond = self.get_bond(i)
+            a1 = canonIndex[cBond.a1]
+            a2 = canonIndex[cBond.a2]
+            bondKeys.append((min(a1, a2), max(a1, a2), cBond.epairs))
+        bondKeys.sort()
+
+        contentHash = hashlib.sha256()
+        for element, coords, _ in atomKeys:
+            contentHash.update(b"A %s %.4f %.4f %.4f\n" % ((element.encode(),) + coords))
+        for bondKey in bondKeys:
+            contentHash.update(b"B %d %d %d\n" % bondKey)
+
+        return contentHash.hexdigest()
+
+    # Summary data of the molecule: bounding box, centroid, radius of gyration, extent (largest distance of an
+    # atom from the origin, which bounds the molecule for any rotation), chemical formula and set of elements
+    def stats(self):
+        xs = []
+        ys = []
+        zs = []
+        elementCounts = {}
+        for i in range(self.atom_no):
+            cAtom = self.get_atom(i)
+            xs.append(cAtom.x)
+            ys.append(cAtom.y)
+            zs.append(cAtom.z)
+            elementCounts[cAtom.element] = elementCounts.get(cAtom.element, 0) + 1
+
+        if self.atom_no == 0:
+            xs = ys = zs = [0.0]
+        count = len(xs)
+        centroid = (sum(xs) / count, sum(ys) / count, sum(zs) / count)
+        rgyr = math.sqrt(sum((x - centroid[0]) ** 2 + (y - centroid[1]) ** 2 + (z - centroid[2]) ** 2
+                             for x, y, z in zip(xs, ys, zs)) / count)
+        extent = max(math.sqrt(x * x + y * y + z * z) for x, y, z in zip(xs, ys, zs))
+
+        return {
+            "atomNum": self.atom_no,
+            "bondNum": self.bond_no,
+            "min": (min(xs), min(ys), min(zs)),
+            "max": (max(xs), max(ys), max(zs)),
+            "centroid": centroid,
+            "rgyr": rgyr,
+            "extent": extent,
+            "formula": formula(elementCounts),
+            "elements": sorted(elementCounts),
+            "elementCounts": elementCounts
+        }
+
+    # Render the molecule as a <size> x <size> png image using the rasterizer in the C core.
+    # The molecule is centred on and scaled to fit its bounding box from <minCoords> to <maxCoords> (the "min" and
+    # "max" of stats())
+    def png(self, size, minCoords, maxCoords):
+        elements = set(self.get_atom(i).element for i in range(self.atom_no))
+        maxRadius = max([radius.get(code, 30) for code in elements], default=0)
+        # Atom radii and bond widths are in pixels at 100 pixels per Angstrom, as in the svg
+        halfExtent = max(maxCoords[0] - minCoords[0], maxCoords[1] - minCoords[1]) / 2.0 + maxRadius / 100.0
+        scale = (size / 2.0 - 1) / halfExtent if halfExtent > 0 else 100.0
+        offsetx = size / 2.0 - (minCoords[0] + maxCoords[0]) / 2.0 * scale
+        offsety = size / 2.0 - (minCoords[1] + maxCoords[1]) / 2.0 * scale
+
+        image = molecule.raster(size, size)
+        for i in range(self.atom_no):
+            cAtom = self.get_atom(i)
+            atomColours = colours.get(cAtom.element, default_colours)
+            molecule.raster_atom(image, cAtom, scale, offsetx, offsety, radius.get(cAtom.element, 30) * scale / 100.0,
+                                 int(atomColours[0], 16), int(atomColours[1], 16), int(atomColours[2], 16))
+        for i in range(self.bond_no):
+            molecule.raster_bond(image, self.get_bond(i), scale, offsetx, offsety, 10.0 * scale / 100.0, 0x008000)
+
+        return encode_png(size, size, image.rgba())
+
     def rotate(self, pitch, yaw, roll):
         if (pitch != 0):
             mx = molecule.mx_wrapper(pitch, 0, 0)
@@ -172,3 +394,124 @@ class Molecule (molecule.molecule):
         if (roll != 0):
             mx = molecule.mx_wrapper(0, 0, roll)
             self.xform( mx.xform_matrix )
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create a chemical formula in Hill order (carbon, hydrogen, then the other elements alphabetically)
+# from a dictionary of element counts
+def formula(elementCounts):
+    if "C" in elementCounts:
+        order = ["C"] + (["H"] if "H" in elementCounts else [])
+    else:
+        order = []
+    order += sorted(code for code in elementCounts if code not in order)
+
+    formulaStr = ""
+    for code in order:
+        formulaStr += code
+        if elementCounts[code] > 1:
+            formulaStr += str(elementCounts[code])
+
+    return formulaStr
+
+# Create the root element and definitions of a compact svg of <size> x <size> pixels, with its top-left corner at
+# (<originx>, <originy>) pixels, for the element codes in <elements>. The root element strokes the bond paths, and each
+# element has one symbol (its circle, centred on the symbol's origin and sharing the gradient geometry through href)
+# that atoms reference with <use>
+def compact_header(originx, originy, size, elements):
+    headerStr = '<svg viewBox="%d %d %d %d" width="%d" height="%d" stroke="green" stroke-width="20" xmlns="http://www.w3.org/2000/svg">' \
+        % (originx, originy, size, size, size, size)
+    headerStr += '<defs><radialGradient id="g" cx="-.5" cy="-.5" r="2.2" fx=".2" fy=".2"/>'
+
+    gradientIds = {}
+    for code in elements:
+        name = element_name.get(code, "default")
+        if name not in gradientIds:
+            gradientIds[name] = "g%d" % len(gradientIds)
+            headerStr += '<radialGradient id="%s" href="#g"><stop stop-color="%s"/><stop offset=".5" stop-color="%s"/>' \
+                '<stop offset="1" stop-color="%s"/></radialGradient>' \
+                % ((gradientIds[name],) + tuple(short_colour(colour) for colour in colours.get(code, default_colours)))
+        headerStr += '<symbol id="%s" overflow="visible"><circle r="%d" fill="url(#%s)" stroke="none"/></symbol>' \
+            % (code, radius.get(code, 30), gradientIds[name])
+
+    return headerStr + "</defs>"
+
+# Create the shortest svg form of the hex colour <colour> ("#RGB" when each channel is a repeated digit, else "#RRGGBB")
+def short_colour(colour):
+    colour = colour.upper()
+    if colour[0::2] == colour[1::2]:
+        return "#" + colour[0::2]
+    return "#" + colour
+
+# Create the path data of the compact svg lines of the bonds <bonds>. Each bond is its own subpath (a move then one
+# relative line), so bonds that share an atom are not joined and their ends look as in svg(). A bond is started from
+# the atom where the last one ended when that atom has another bond, so most moves between bonds are "m0 0"
+def path_data(bonds):
+    # Bonds at each atom and pixel coordinates of each atom, by atom index
+    atomBonds = {}
+    points = {}
+    for bond in bonds:
+        atomBonds.setdefault(bond.cBond.a1, []).append(bond)
+        atomBonds.setdefault(bond.cBond.a2, []).append(bond)
+        points[bond.cBond.a1], points[bond.cBond.a2] = bond.compact_points()
+
+    pathStr = ""
+    drawn = set()
+    current = None      # Atom index of the end of the last bond drawn
+    remaining = iter(bonds)
+    while len(drawn) < len(bonds):
+        # Continue from the atom where the last bond ended, otherwise take the next bond that was not drawn
+        bond = None
+        if current is not None:
+            bond = next((bond for bond in atomBonds[current] if id(bond) not in drawn), None)
+        if bond is None:
+            bond = next(bond for bond in remaining if id(bond) not in drawn)
+        drawn.add(id(bond))
+
+        startIndex, endIndex = bond.cBond.a1, bond.cBond.a2
+        if endIndex == current:
+            startIndex, endIndex = endIndex, startIndex
+        start = points[startIndex]
+        end = points[endIndex]
+
+        # Move with whichever of the absolute or relative move is shorter
+        moveStr = "M" + path_numbers([start.x, start.y])
+        if current is not None:
+            relativeStr = "m" + path_numbers([start.x - points[current].x, start.y - points[current].y])
+            if len(relativeStr) < len(moveStr):
+                moveStr = relativeStr
+
+        pathStr += moveStr + "l" + path_numbers([end.x - start.x, end.y - start.y])
+        current = endIndex
+
+    return pathStr
+
+# Format the integers <values> as path data numbers, only separating them where the next one has no minus sign
+def path_numbers(values):
+    numbersStr = ""
+    for value in values:
+        if numbersStr and value >= 0:
+            numbersStr += " "
+        numbersStr += str(value)
+
+    return numbersStr
+
+# Encode <width> x <height> RGBA pixel data (row by row from the top-left corner) as a png file
+def encode_png(width, height, pixels):
+    def chunk(chunkType, data):
+        return struct.pack(">I", len(data)) + chunkType + data + struct.pack(">I", zlib.crc32(chunkType + data))
+
+    # Each row of the image data starts with its filter type (0: none)
+    rowSize = width * 4
+    imageData = bytearray()
+    for row in range(height):
+        imageData += b"\x00" + pixels[row * rowSize:(row + 1) * rowSize]
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(bytes(imageData)))
+            + chunk(b"IEND", b""))
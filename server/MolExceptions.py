@@ -9,3 +9,21 @@ class DuplicateEntry (Exception):
     def __init__(self, message):
         self.message = "ERROR: " + message
         super().__init__(self.message)
+
+# Exception raised when trying to access an entry that does not exist in database
+class MissingEntry (Exception):
+    def __init__(self, message):
+        self.message = "ERROR: " + message
+        super().__init__(self.message)
+
+# Exception raised when waiting for a result computed by another request takes too long
+class FlightTimeout (Exception):
+    def __init__(self, message):
+        self.message = "ERROR: " + message
+        super().__init__(self.message)
+
+# Exception raised when the database cannot be used yet because another thread is migrating its schema
+class SchemaBusy (Exception):
+    def __init__(self, message):
+        self.message = "ERROR: " + message
+        super().__init__(self.message)
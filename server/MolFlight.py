@@ -0,0 +1,185 @@
+import threading
+from MolExceptions import FlightTimeout
+
+# Flight Class: One in-flight computation and the requests waiting for it
+# Members: done - Event set when the computation finished
+#          result - Value returned by the computation
+#          error - Exception raised by the computation, if any
+class Flight ():
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+# StreamFlight Class: One in-flight streamed computation and the requests following it
+# Members: chunks - Chunks produced so far. Only kept once a follower joined
+#          followers - Number of requests following the computation
+#          finished - Whether the computation finished
+#          error - Exception raised by the computation, if any
+#          changed - Condition notified when a chunk was added or the computation finished
+class StreamFlight ():
+    def __init__(self, lock):
+        self.chunks = []
+        self.followers = 0
+        self.finished = False
+        self.error = None
+        self.changed = threading.Condition(lock)
+
+# SingleFlight Class: Coalesces concurrent computations of the same key. The first request for a key (the leader)
+# runs the computation, and requests for that key that arrive while it runs (the followers) wait for it and share
+# its result or exception instead of computing it again. Nothing is kept once the computation finished
+# Members: timeout - Seconds a follower waits for the leader before giving up with FlightTimeout
+#          leaders - Number of computations run
+#          coalesced - Number of requests served by another request's computation
+#          timeouts - Number of followers that gave up waiting
+#          errors - Number of computations that raised an exception
+# Methods: do() - Get the result of the computation of a key
+#          stream() - Get the chunks of the streamed computation of a key
+#          stats() - Get the counters as a dictionary
+class SingleFlight ():
+    def __init__(self, timeout=30.0):
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.streams = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    # Get the result of <function>() for <key>, joining the computation of <key> that is in flight if there is one
+    def do(self, key, function):
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is None:
+                flight = self.flights[key] = Flight()
+                leader = True
+                self.leaders += 1
+            else:
+                leader = False
+                self.coalesced += 1
+
+        if leader:
+            try:
+                flight.result = function()
+            except Exception as err:
+                flight.error = err
+                with self.lock:
+                    self.errors += 1
+            finally:
+                with self.lock:
+                    del self.flights[key]
+                flight.done.set()
+        elif not flight.done.wait(self.timeout):
+            with self.lock:
+                self.timeouts += 1
+            raise FlightTimeout("Timed out waiting for a computation in flight")
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    # Get the chunks of <function>() (an iterable) for <key> as an iterator, following the streamed computation of
+    # <key> that is in flight if there is one. The leader passes each chunk on as soon as it is produced and only keeps
+    # the chunks for its followers once one joined: requests can join until the leader produced its first chunk without
+    # followers, so a request that is not coalesced streams without buffering. Returns once the first chunk is ready,
+    # so an error before it (or FlightTimeout) is raised before the caller starts its response
+    def stream(self, key, function):
+        with self.lock:
+            flight = self.streams.get(key)
+            if flight is None:
+                flight = self.streams[key] = StreamFlight(self.lock)
+                self.leaders += 1
+                leader = True
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+                leader = False
+
+        chunks = self.lead(key, flight, function) if leader else self.follow(flight)
+        try:
+            first = next(chunks)
+        except StopIteration:
+            return iter(())
+        return prepend(first, chunks)
+
+    # Run the streamed computation <function>() of <key> for the flight <flight>, yielding its chunks
+    def lead(self, key, flight, function):
+        try:
+            chunks = iter(function())
+            for chunk in chunks:
+                self.add_chunk(key, flight, chunk)
+                yield chunk
+        except GeneratorExit:
+            # The leader stopped reading (e.g. its client went away), so finish the computation for its followers
+            with self.lock:
+                self.close_stream(key, flight)
+                following = flight.followers > 0
+            if following:
+                try:
+                    for chunk in chunks:
+                        self.add_chunk(key, flight, chunk)
+                except Exception as err:
+                    with self.lock:
+                        flight.error = err
+                        self.errors += 1
+            raise
+        except Exception as err:
+            with self.lock:
+                flight.error = err
+                self.errors += 1
+            raise
+        finally:
+            with self.lock:
+                self.close_stream(key, flight)
+                flight.finished = True
+                flight.changed.notify_all()
+
+    # Keep the chunk <chunk> of the flight <flight> of <key> for its followers, or stop further requests from
+    # joining it if it has none
+    def add_chunk(self, key, flight, chunk):
+        with self.lock:
+            if flight.followers > 0:
+                flight.chunks.append(chunk)
+                flight.changed.notify_all()
+            else:
+                self.close_stream(key, flight)
+
+    # Stop requests for <key> from joining the flight <flight>. Must be called with the lock held
+    def close_stream(self, key, flight):
+        if self.streams.get(key) is flight:
+            del self.streams[key]
+
+    # Yield the chunks of the flight <flight> as the leader produces them, waiting at most timeout seconds for each
+    def follow(self, flight):
+        sent = 0
+        while True:
+            with self.lock:
+                if not flight.changed.wait_for(lambda: sent < len(flight.chunks) or flight.finished, self.timeout):
+                    self.timeouts += 1
+                    raise FlightTimeout("Timed out waiting for a computation in flight")
+                chunks = flight.chunks[sent:]
+                if not chunks:
+                    if flight.error is not None:
+                        raise flight.error
+                    return
+            sent += len(chunks)
+            yield from chunks
+
+    def stats(self):
+        with self.lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+                "errors": self.errors,
+                "inFlight": len(self.flights) + len(self.streams)
+            }
+
+# Yield <first>, then the chunks of the generator <chunks>. Closing this generator closes <chunks>
+def prepend(first, chunks):
+    try:
+        yield first
+        yield from chunks
+    finally:
+        chunks.close()
@@ -0,0 +1,105 @@
+import collections
+import os
+import sys
+import threading
+import time
+
+# Profiler Class: Sampling profiler that records the call stacks of the threads handling requests.
+# While it is off, the server only checks the active flag once per request.
+# Stacks are collapsed ("frame;frame;frame count" per line) for flame graph tools. Frames of the SWIG wrappers
+# (the molecule and _molecule modules) are named "_molecule:<function>", so time spent inside the C core is
+# grouped under _molecule
+# Members: interval - Seconds between samples
+#          active - Whether requests are being profiled
+# Methods: start() - Profile the next <requests> requests and/or the next <seconds> seconds
+#          stop() - Stop profiling and wait for the sampler thread to exit
+#          begin_request(), end_request() - Mark the current thread as handling a request
+#          collapsed() - Get the samples as collapsed stacks
+class Profiler ():
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.active = False
+        self.lock = threading.Lock()
+        # Held by start() and stop(), which wait for the sampler thread without holding the lock it takes
+        self.controlLock = threading.Lock()
+        self.sampler = None
+        self.requestsLeft = None
+        self.deadline = None
+        self.threads = set()
+        self.stacks = collections.Counter()
+
+    # Returns False, without changing the running profile, if requests are already being profiled
+    def start(self, requests=None, seconds=None):
+        with self.controlLock:
+            if self.active:
+                return False
+            # The sampler of a profile that ended on its own may not have exited yet
+            self.join_sampler()
+            with self.lock:
+                self.stacks = collections.Counter()
+                self.requestsLeft = requests
+                self.deadline = None if seconds is None else time.monotonic() + seconds
+                self.active = True
+            self.sampler = threading.Thread(target=self.sample, daemon=True)
+            self.sampler.start()
+            return True
+
+    def stop(self):
+        with self.controlLock:
+            self.active = False
+            self.join_sampler()
+
+    # Wait for the sampler thread to exit once it sees that the profiler is off
+    def join_sampler(self):
+        if self.sampler is not None:
+            self.sampler.join()
+            self.sampler = None
+
+    def begin_request(self):
+        with self.lock:
+            self.threads.add(threading.get_ident())
+
+    def end_request(self):
+        with self.lock:
+            self.threads.discard(threading.get_ident())
+            if self.requestsLeft is not None:
+                self.requestsLeft -= 1
+                if self.requestsLeft <= 0:
+                    self.active = False
+
+    def collapsed(self):
+        with self.lock:
+            return "".join("%s %d\n" % (stack, count) for stack, count in self.stacks.most_common())
+
+    # Sampler thread: record the stack of every thread that is handling a request
+    def sample(self):
+        while self.active:
+            time.sleep(self.interval)
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                self.active = False
+                break
+
+            frames = sys._current_frames()
+            with self.lock:
+                for ident in self.threads:
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        self.stacks[collapse(frame)] += 1
+
+# Create the collapsed stack string of <frame>, from the request handler down to <frame>
+def collapse(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "")
+        if module == "__main__":
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        # The SWIG wrappers, proxy methods and helpers in molecule.py call straight into the C core
+        if module in ("molecule", "_molecule"):
+            module = "_molecule"
+        names.append("%s:%s" % (module, code.co_name))
+        if code.co_name == "handle_one_request":
+            break
+        frame = frame.f_back
+
+    return ";".join(reversed(names))
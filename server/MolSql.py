@@ -1,120 +1,355 @@
 import sqlite3
 import MolDisplay
+import array
+import math
 import os
+import sys
+import threading
+import time
+import zlib
 # import molecule
-from MolExceptions import DuplicateEntry
+from MolExceptions import DuplicateEntry, MissingEntry, SchemaBusy
+
+# Coordinates of frames are stored as integers in units of 1/coord_precision Angstroms (the precision of the Atoms table)
+coord_precision = 10000
+# Every keyframe_interval-th frame is stored whole instead of as a delta, to bound the cost of seeking
+keyframe_interval = 16
+# Frames read from the database at a time by get_frames()
+frame_batch_size = 64
+# Criteria matching fewer molecules than this are collected whole to start a search from (see search_molecules())
+search_probe_limit = 5000
+# Molecules filled in by each transaction of a migration (see create_tables())
+migration_batch_size = 500
+# Seconds a migration waits between its batches, long enough for connections waiting to write to take the lock
+# (SQLite retries a busy lock every 100 ms at most)
+migration_batch_pause = 0.1
 
 class Database:
-    # Initialise connection to database. Reset database if reset=True
-    def __init__(self, reset=False):
+    # Initialise connection to database. Reset database if reset=True. Up to <pool_size> connections handed back
+    # with release() are kept open for the next threads. Threads that need the database while another thread brings
+    # its schema up to date wait <setup_wait> seconds (None for as long as it takes) before raising SchemaBusy
+    def __init__(self, reset=False, pool_size=8, setup_wait=None):
         if (reset and os.path.exists( 'molecules.db' )):
             os.remove("molecules.db")
-        self.conn = sqlite3.connect("molecules.db")
+        self.local = threading.local()
+        self.setupLock = threading.Lock()
+        self.ready = False
+        self.pool_size = pool_size
+        self.setup_wait = setup_wait
+        self.poolLock = threading.Lock()
+        self.pool = []
+
+    # Connection to the database of the calling thread, taken from the pool (or opened) on its first use. Each
+    # request handler thread has its own connection until it calls release(), so their transactions do not
+    # interleave. The first connection also brings the schema up to date (see create_tables()), so opening the
+    # database costs nothing until it is used
+    @property
+    def conn(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            with self.poolLock:
+                conn = self.pool.pop() if self.pool else None
+            if conn is None:
+                # Pooled connections move between threads, but only one thread uses a connection at a time
+                conn = sqlite3.connect("molecules.db", check_same_thread=False)
+            self.local.conn = conn
+            if not self.ready:
+                if not self.setupLock.acquire(timeout=-1 if self.setup_wait is None else self.setup_wait):
+                    self.release()
+                    raise SchemaBusy("Database schema is being migrated")
+                try:
+                    if not self.ready:
+                        try:
+                            self.create_tables()
+                        except:
+                            # Try again on the next use
+                            self.local.conn = None
+                            conn.close()
+                            raise
+                        self.ready = True
+                finally:
+                    self.setupLock.release()
+        return conn
+
+    # Hand the connection of the calling thread back to the pool, e.g. when the thread finished a request, so
+    # the next thread does not open a new one. A transaction left open is rolled back
+    def release(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            return
+        self.local.conn = None
+        if conn.in_transaction:
+            conn.rollback()
 
-    # Create the tables of molecules.db
+        with self.poolLock:
+            if len(self.pool) < self.pool_size:
+                self.pool.append(conn)
+                return
+        conn.close()
+
+    # Bring the schema of molecules.db up to date by applying the migrations it has not had yet (see migrations).
+    # Runs on the first use of the database, so it only needs calling directly to set up a database without using it.
+    # Each migration creates its tables in one transaction, then fills them from the existing molecules (see backfills)
+    # in batches of migration_batch_size molecules, each in its own transaction, so other connections can write
+    # between the batches (see migration_batch_pause). The version is only set once a migration is complete, so an
+    # interrupted one is resumed
     def create_tables(self):
-        # Elements table
-        # Check if table exists
-        tableExists = self.conn.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type = 'table'
-            AND name = 'Elements';
-        ''').fetchall()
-        # Create table if doesnt exist
-        if (tableExists == []):
-            self.conn.execute('''
-                CREATE TABLE Elements
-                (   ELEMENT_NO       INTEGER                   NOT NULL,
-                    ELEMENT_CODE     VARCHAR(3)   PRIMARY KEY  NOT NULL,
-                    ELEMENT_NAME     VARCHAR(32)               NOT NULL,
-                    COLOUR1          CHAR(6)                   NOT NULL,
-                    COLOUR2          CHAR(6)                   NOT NULL,
-                    COLOUR3          CHAR(6)                   NOT NULL,
-                    RADIUS           DECIMAL(3)                NOT NULL
-                );
-            ''')
+        version = self.conn.execute("PRAGMA user_version;").fetchone()[0]
+        if version >= len(self.migrations):
+            # Migration 6 leaves the name index out if the SQLite it ran with has no FTS5, so it is created on the first
+            # start with one
+            if not self.has_name_index():
+                self.write_transaction(self.create_name_index)
+            return
 
-        # Atoms table
-        tableExists = self.conn.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type = 'table'
-            AND name = 'Atoms';
-        ''').fetchall()
-        if (tableExists == []):
-            self.conn.execute('''
-                CREATE TABLE Atoms
-                (   ATOM_ID         INTEGER         PRIMARY KEY   AUTOINCREMENT   NOT NULL,
-                    ELEMENT_CODE    VARCHAR(3)                                    NOT NULL,
-                    X               DECIMAL(7, 4)                                 NOT NULL,
-                    Y               DECIMAL(7, 4)                                 NOT NULL,
-                    Z               DECIMAL(7, 4)                                 NOT NULL,
-                    FOREIGN KEY (ELEMENT_CODE) REFERENCES Elements(ELEMENT_CODE)
-                );
-            ''')
-        
-        # Bonds table
-        tableExists = self.conn.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type = 'table'
-            AND name = 'Bonds';
-        ''').fetchall()
-        if (tableExists == []):
-            self.conn.execute('''
-                CREATE TABLE Bonds
-                (   BOND_ID INTEGER   PRIMARY KEY   AUTOINCREMENT   NOT NULL,
-                    A1      INTEGER                                 NOT NULL,
-                    A2      INTEGER                                 NOT NULL,
-                    EPAIRS  INTEGER                                 NOT NULL
-                );
-            ''')
-        
-        # Molecules table
-        tableExists = self.conn.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type = 'table'
-            AND name = 'Molecules';
-        ''').fetchall()
-        if (tableExists == []):
-            self.conn.execute('''
-                CREATE TABLE Molecules
-                (   MOLECULE_ID INTEGER   PRIMARY KEY   AUTOINCREMENT   NOT NULL,
-                    NAME        TEXT      UNIQUE                        NOT NULL    
-                );
-            ''')
+        for number in range(version + 1, len(self.migrations) + 1):
+            migration = self.migrations[number - 1]
+            backfill = self.backfills.get(migration)
 
-        # MoleculeAtom table
-        tableExists = self.conn.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type = 'table'
-            AND name = 'MoleculeAtom';
-        ''').fetchall()
-        if (tableExists == []):
-            self.conn.execute('''
-                CREATE TABLE MoleculeAtom
-                (   MOLECULE_ID INTEGER     NOT NULL,
-                    ATOM_ID     INTEGER     NOT NULL,
-                    PRIMARY KEY (MOLECULE_ID, ATOM_ID),
-                    FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID),
-                    FOREIGN KEY (ATOM_ID)     REFERENCES Atoms(ATOM_ID)
-                );
-            ''')
-        
-        # MoleculeBond table
-        tableExists = self.conn.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type = 'table'
-            AND name = 'MoleculeBond';
-        ''').fetchall()
-        if (tableExists == []):
+            if not self.migration_step(number, lambda: migration(self)):
+                continue
+            if backfill is not None:
+                while self.migration_step(number, lambda: backfill(self, migration_batch_size)) == migration_batch_size:
+                    time.sleep(migration_batch_pause)
+
+            # Set the version together with the last molecules added while the batches ran
+            def finish():
+                if backfill is not None:
+                    backfill(self)
+                self.conn.execute("PRAGMA user_version = %d;" % number)
+            self.migration_step(number, finish)
+
+    # Run <step>() in a write transaction if the schema is older than version <number>. Returns what <step>()
+    # returned, or False if another connection finished the migration first
+    def migration_step(self, number, step):
+        # Check the version after taking the write lock, so processes starting together migrate once
+        def checked():
+            if self.conn.execute("PRAGMA user_version;").fetchone()[0] >= number:
+                return False
+            result = step()
+            return True if result is None else result
+        return self.write_transaction(checked)
+
+    # Run <step>() in a write transaction, taking the write lock first, and return what it returned
+    def write_transaction(self, step):
+        self.conn.execute("BEGIN IMMEDIATE;")
+        try:
+            result = step()
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        return result
+
+    # Migration 1: Elements, atoms, bonds and molecules
+    def create_base_tables(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS Elements
+            (   ELEMENT_NO       INTEGER                   NOT NULL,
+                ELEMENT_CODE     VARCHAR(3)   PRIMARY KEY  NOT NULL,
+                ELEMENT_NAME     VARCHAR(32)               NOT NULL,
+                COLOUR1          CHAR(6)                   NOT NULL,
+                COLOUR2          CHAR(6)                   NOT NULL,
+                COLOUR3          CHAR(6)                   NOT NULL,
+                RADIUS           DECIMAL(3)                NOT NULL
+            );
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS Atoms
+            (   ATOM_ID         INTEGER         PRIMARY KEY   AUTOINCREMENT   NOT NULL,
+                ELEMENT_CODE    VARCHAR(3)                                    NOT NULL,
+                X               DECIMAL(7, 4)                                 NOT NULL,
+                Y               DECIMAL(7, 4)                                 NOT NULL,
+                Z               DECIMAL(7, 4)                                 NOT NULL,
+                FOREIGN KEY (ELEMENT_CODE) REFERENCES Elements(ELEMENT_CODE)
+            );
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS Bonds
+            (   BOND_ID INTEGER   PRIMARY KEY   AUTOINCREMENT   NOT NULL,
+                A1      INTEGER                                 NOT NULL,
+                A2      INTEGER                                 NOT NULL,
+                EPAIRS  INTEGER                                 NOT NULL
+            );
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS Molecules
+            (   MOLECULE_ID INTEGER   PRIMARY KEY   AUTOINCREMENT   NOT NULL,
+                NAME        TEXT      UNIQUE                        NOT NULL    
+            );
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS MoleculeAtom
+            (   MOLECULE_ID INTEGER     NOT NULL,
+                ATOM_ID     INTEGER     NOT NULL,
+                PRIMARY KEY (MOLECULE_ID, ATOM_ID),
+                FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID),
+                FOREIGN KEY (ATOM_ID)     REFERENCES Atoms(ATOM_ID)
+            );
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS MoleculeBond
+            (   MOLECULE_ID INTEGER     NOT NULL,
+                BOND_ID     INTEGER     NOT NULL,
+                PRIMARY KEY (MOLECULE_ID, BOND_ID),
+                FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID),
+                FOREIGN KEY (BOND_ID)     REFERENCES Bonds(BOND_ID)
+            );
+        ''')
+        # Indexes used to check if an atom or bond is shared with other molecules when removing a molecule
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS MoleculeAtomIndex ON MoleculeAtom (ATOM_ID);
+        ''')
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS MoleculeBondIndex ON MoleculeBond (BOND_ID);
+        ''')
+
+    # Migration 2: Structures table, one row per distinct molecule structure identified by its content hash
+    def create_structures(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS Structures
+            (   STRUCTURE_ID    INTEGER     PRIMARY KEY   AUTOINCREMENT   NOT NULL,
+                HASH            CHAR(64)    UNIQUE                        NOT NULL,
+                REFCOUNT        INTEGER                                   NOT NULL
+            );
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS MoleculeStructure
+            (   MOLECULE_ID     INTEGER     PRIMARY KEY   NOT NULL,
+                STRUCTURE_ID    INTEGER                   NOT NULL,
+                FOREIGN KEY (MOLECULE_ID)  REFERENCES Molecules(MOLECULE_ID),
+                FOREIGN KEY (STRUCTURE_ID) REFERENCES Structures(STRUCTURE_ID)
+            );
+        ''')
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS MoleculeStructureIndex ON MoleculeStructure (STRUCTURE_ID);
+        ''')
+
+    # Backfill of migration 2: Hash up to <limit> molecules that were added before structures were tracked
+    def backfill_structures(self, limit=None):
+        molNames = self.unindexed_molecules("MoleculeStructure", limit)
+        for molName in molNames:
+            self.link_structure(molName, self.load_mol(molName).content_hash())
+        return len(molNames)
+
+    # Migration 3: MoleculeStats table, summary data computed once when a molecule is added
+    def create_stats(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS MoleculeStats
+            (   MOLECULE_ID     INTEGER     PRIMARY KEY   NOT NULL,
+                ATOM_NO         INTEGER                   NOT NULL,
+                BOND_NO         INTEGER                   NOT NULL,
+                MIN_X           REAL                      NOT NULL,
+                MIN_Y           REAL                      NOT NULL,
+                MIN_Z           REAL                      NOT NULL,
+                MAX_X           REAL                      NOT NULL,
+                MAX_Y           REAL                      NOT NULL,
+                MAX_Z           REAL                      NOT NULL,
+                CENTROID_X      REAL                      NOT NULL,
+                CENTROID_Y      REAL                      NOT NULL,
+                CENTROID_Z      REAL                      NOT NULL,
+                RGYR            REAL                      NOT NULL,
+                EXTENT          REAL                      NOT NULL,
+                FORMULA         TEXT                      NOT NULL,
+                ELEMENTS        TEXT                      NOT NULL,
+                FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID)
+            );
+        ''')
+
+    # Backfill of migration 3: Compute the stats of up to <limit> molecules that were added before stats were stored
+    def backfill_stats(self, limit=None):
+        molNames = self.unindexed_molecules("MoleculeStats", limit)
+        for molName in molNames:
+            self.add_stats(molName, self.load_mol(molName).stats())
+        return len(molNames)
+
+    # Migration 4: Frames table, extra coordinate sets (conformers or trajectory frames) of a molecule. Frame 0 is the
+    # molecule's own atoms; the other frames are quantized, delta-encoded against the previous frame (except for
+    # keyframes) and compressed
+    def create_frames(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS Frames
+            (   MOLECULE_ID     INTEGER     NOT NULL,
+                FRAME_NO        INTEGER     NOT NULL,
+                KEYFRAME        INTEGER     NOT NULL,
+                COORDS          BLOB        NOT NULL,
+                PRIMARY KEY (MOLECULE_ID, FRAME_NO),
+                FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID)
+            );
+        ''')
+
+    # Migration 5: MoleculeElement table, inverted index of the number of atoms of each element in each molecule, for
+    # searches
+    def create_element_index(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS MoleculeElement
+            (   ELEMENT_CODE    VARCHAR(3)  NOT NULL,
+                COUNT           INTEGER     NOT NULL,
+                MOLECULE_ID     INTEGER     NOT NULL,
+                PRIMARY KEY (ELEMENT_CODE, COUNT, MOLECULE_ID),
+                FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID)
+            ) WITHOUT ROWID;
+        ''')
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS MoleculeElementIndex ON MoleculeElement (MOLECULE_ID, ELEMENT_CODE, COUNT);
+        ''')
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS MoleculeStatsAtomIndex ON MoleculeStats (ATOM_NO);
+        ''')
+
+    # Backfill of migration 5: Count the elements of up to <limit> molecules that were added before they were indexed
+    def backfill_element_counts(self, limit=None):
+        molNames = self.unindexed_molecules("MoleculeElement", limit)
+        for molName in molNames:
+            self.add_element_counts(molName, self.load_mol(molName).stats()["elementCounts"])
+        return len(molNames)
+
+    # Migration 6: MoleculeName table, full-text index of molecule names (trigrams, so any substring of 3 or more
+    # characters can be matched). Searches fall back to scanning names if this SQLite was built without FTS5 (see
+    # create_tables())
+    def create_name_index(self):
+        try:
             self.conn.execute('''
-                CREATE TABLE MoleculeBond
-                (   MOLECULE_ID INTEGER     NOT NULL,
-                    BOND_ID     INTEGER     NOT NULL,
-                    PRIMARY KEY (MOLECULE_ID, BOND_ID),
-                    FOREIGN KEY (MOLECULE_ID) REFERENCES Molecules(MOLECULE_ID),
-                    FOREIGN KEY (BOND_ID)     REFERENCES Bonds(BOND_ID)
-                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS MoleculeName USING fts5(NAME, tokenize = 'trigram');
             ''')
+        except sqlite3.OperationalError:
+            return
+
+        self.conn.execute('''
+            INSERT INTO MoleculeName (rowid, NAME)
+            SELECT MOLECULE_ID, NAME FROM Molecules
+            WHERE MOLECULE_ID NOT IN (SELECT rowid FROM MoleculeName);
+        ''')
+
+    # Schema migrations in the order they are applied. Migration n brings the schema from version n - 1 to version n,
+    # stored in PRAGMA user_version. Databases created before the schema was versioned are at version 0 and may already
+    # have some of the tables, so migrations only create what is missing. Add new migrations at the end
+    migrations = [
+        create_base_tables,
+        create_structures,
+        create_stats,
+        create_frames,
+        create_element_index,
+        create_name_index
+    ]
+
+    # Functions that fill the tables of a migration for the molecules that were added before it, by migration. Each
+    # takes the largest number of molecules to fill (None for all of them) and returns how many it filled
+    backfills = {
+        create_structures: backfill_structures,
+        create_stats: backfill_stats,
+        create_element_index: backfill_element_counts
+    }
+
+    # Get the names of the first <limit> (or all) molecules that have no rows in the table <table> (a table with a
+    # MOLECULE_ID column)
+    def unindexed_molecules(self, table, limit=None):
+        return [row[0] for row in self.conn.execute('''
+            SELECT NAME FROM Molecules
+            WHERE MOLECULE_ID NOT IN (SELECT MOLECULE_ID FROM %s)
+            ORDER BY MOLECULE_ID ASC
+            LIMIT ?;
+        ''' % (table), (-1 if limit is None else limit,)).fetchall()]
     
     # Redefine the __setitem__ method to insert rows with values <values> in the table <table>
     def __setitem__(self, table, values):
@@ -163,14 +398,57 @@ class Database:
         # Insert linking data in MoleculeBond table
         self["MoleculeBond"] = (molID[0], bondID[0])
     
-    # Add a molecule <mol> called <name> into the relevant tables
-    def add_molecule(self, name, newMol):
+    # Get the STRUCTURE_ID and the name of a molecule with the structure <structureHash>. Returns None if the structure is new
+    def find_structure(self, structureHash):
+        return self.conn.execute('''
+            SELECT Structures.STRUCTURE_ID, Molecules.NAME
+            FROM Structures INNER JOIN MoleculeStructure, Molecules
+            ON (MoleculeStructure.STRUCTURE_ID = Structures.STRUCTURE_ID) AND (MoleculeStructure.MOLECULE_ID = Molecules.MOLECULE_ID)
+            WHERE Structures.HASH = ?
+            LIMIT 1;
+        ''', (structureHash,)).fetchone()
+
+    # Link the molecule <molname> to the structure <structureHash>, creating the structure or incrementing its reference count
+    def link_structure(self, molname, structureHash):
+        self.conn.execute('''
+            INSERT INTO Structures (HASH, REFCOUNT)
+            VALUES (?, 1)
+            ON CONFLICT (HASH) DO UPDATE SET REFCOUNT = REFCOUNT + 1;
+        ''', (structureHash,))
+        self.conn.execute('''
+            INSERT INTO MoleculeStructure (MOLECULE_ID, STRUCTURE_ID)
+            SELECT Molecules.MOLECULE_ID, Structures.STRUCTURE_ID
+            FROM Molecules, Structures
+            WHERE Molecules.NAME = ? AND Structures.HASH = ?;
+        ''', (molname, structureHash))
+
+    # Add a molecule <mol> called <name> into the relevant tables.
+    # If the same structure is already stored, the new name shares its atoms and bonds (alias=True) or
+    # DuplicateEntry is raised (alias=False). Returns the name of the molecule it was aliased to, or None
+    def add_molecule(self, name, newMol, alias=True):
+        structureHash = newMol.content_hash()
+        existing = self.find_structure(structureHash)
+        if (existing is not None and not alias):
+            raise DuplicateEntry("Structure already exists in database as " + existing[1])
+
         try:
             # Insert new molecule into Molecules table
             self["Molecules"] = (None, name)
         except:
+            # End the transaction the failed insert opened, so it does not hold the database lock
+            self.conn.rollback()
             raise DuplicateEntry("Entry already exists in database")
 
+        self.add_name(name)
+        stats = newMol.stats()
+        self.add_stats(name, stats)
+        self.add_element_counts(name, stats["elementCounts"])
+
+        if (existing is not None):
+            self.add_alias(name, existing[1])
+            self.link_structure(name, structureHash)
+            return existing[1]
+
         # Insert each atom using add_atom()
         for i in range(newMol.atom_no):
             atom = MolDisplay.Atom(newMol.get_atom(i))
@@ -181,11 +459,219 @@ class Database:
             bond = MolDisplay.Bond(newMol.get_bond(i))
             self.add_bond(name, bond)
 
+        self.link_structure(name, structureHash)
+        return None
+
+    # Add the summary data <stats> (from MolDisplay.Molecule.stats()) of the molecule <molname> to the MoleculeStats table
+    def add_stats(self, molname, stats):
+        self.conn.execute('''
+            INSERT INTO MoleculeStats
+            SELECT MOLECULE_ID, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            FROM Molecules
+            WHERE NAME = ?;
+        ''', (stats["atomNum"], stats["bondNum"]) + tuple(stats["min"]) + tuple(stats["max"]) + tuple(stats["centroid"])
+            + (stats["rgyr"], stats["extent"], stats["formula"], ",".join(stats["elements"]), molname))
+
+    # Add the number of atoms of each element <elementCounts> (from MolDisplay.Molecule.stats()) of the molecule
+    # <molname> to the MoleculeElement table
+    def add_element_counts(self, molname, elementCounts):
+        molID = self.conn.execute('''
+            SELECT MOLECULE_ID FROM Molecules
+            WHERE NAME = ?;
+        ''', (molname,)).fetchone()[0]
+        self.conn.executemany('''
+            INSERT INTO MoleculeElement
+            VALUES (?, ?, ?);
+        ''', [(code, count, molID) for code, count in elementCounts.items()])
+
+    # Add the name of the molecule <molname> to the full-text index of names, if there is one
+    def add_name(self, molname):
+        if self.has_name_index():
+            self.conn.execute('''
+                INSERT INTO MoleculeName (rowid, NAME)
+                SELECT MOLECULE_ID, NAME FROM Molecules
+                WHERE NAME = ?;
+            ''', (molname,))
+
+    # Check whether the full-text index of names exists
+    def has_name_index(self):
+        return self.conn.execute('''
+            SELECT name FROM sqlite_master
+            WHERE type = 'table'
+            AND name = 'MoleculeName';
+        ''').fetchone() is not None
+
+    # Get the MOLECULE_ID of the molecule <name>. Returns None if not found
+    def molecule_id(self, name):
+        row = self.conn.execute('''
+            SELECT MOLECULE_ID FROM Molecules
+            WHERE NAME = ?;
+        ''', (name,)).fetchone()
+        return None if row is None else row[0]
+
+    # Get the summary data of the molecule <name> in the same form as MolDisplay.Molecule.stats(), without the element
+    # counts. Returns None if not found
+    def get_stats(self, name):
+        row = self.conn.execute('''
+            SELECT MoleculeStats.*
+            FROM MoleculeStats INNER JOIN Molecules
+            ON MoleculeStats.MOLECULE_ID = Molecules.MOLECULE_ID
+            WHERE Molecules.NAME = ?;
+        ''', (name,)).fetchone()
+        if row is None:
+            return None
+
+        return {
+            "atomNum": row[1],
+            "bondNum": row[2],
+            "min": tuple(row[3:6]),
+            "max": tuple(row[6:9]),
+            "centroid": tuple(row[9:12]),
+            "rgyr": row[12],
+            "extent": row[13],
+            "formula": row[14],
+            "elements": row[15].split(",") if row[15] else []
+        }
+
+    # Add the frames <frames> (from MolDisplay.Molecule.parse_frames()) of the molecule <molname> after its existing frames.
+    # If the frames were parsed with the molecule <newMol>, they are put in the atom order of the stored atoms first: a
+    # molecule aliased to an existing structure (see add_molecule()) uses that structure's atoms, which can be in
+    # another order than in its own sdf file
+    def add_frames(self, molname, frames, newMol=None):
+        molID = self.conn.execute('''
+            SELECT MOLECULE_ID FROM Molecules
+            WHERE NAME = ?;
+        ''', (molname,)).fetchone()[0]
+
+        if newMol is not None and frames:
+            frames = self.reorder_frames(molname, frames, newMol)
+
+        # Continue from the last stored frame
+        frameNo = self.frame_count(molname)
+        previous = None
+        for previous in self.get_frames(molname, start=frameNo - 1):
+            pass
+        previous = quantize(previous)
+
+        extent = 0.0
+        for coords in frames:
+            current = quantize(coords)
+            keyframe = (frameNo % keyframe_interval == 0)
+            if keyframe:
+                encoded = current
+            else:
+                encoded = array.array("i", [c - p for c, p in zip(current, previous)])
+            self["Frames"] = (molID, frameNo, int(keyframe), zlib.compress(encoded.tobytes()))
+
+            extent = max([extent] + [math.sqrt(x * x + y * y + z * z) for x, y, z in coords])
+            previous = current
+            frameNo += 1
+
+        # Keep the extent an upper bound for every frame
+        self.conn.execute('''
+            UPDATE MoleculeStats SET EXTENT = max(EXTENT, ?)
+            WHERE MOLECULE_ID = ?;
+        ''', (extent, molID))
+
+    # Put the frames <frames>, in the atom order of the molecule <newMol>, in the order of the stored atoms of the
+    # molecule <molname>, which has the same structure. Atoms are matched by their canonical order
+    def reorder_frames(self, molname, frames, newMol):
+        storedAtoms = self.load_mol(molname).canonical_atoms()
+        newAtoms = newMol.canonical_atoms()
+        if [key[2] for key in storedAtoms] == [key[2] for key in newAtoms]:
+            return frames
+
+        # Index in newMol of the atom at each index of the stored atoms
+        source = [0] * len(storedAtoms)
+        for storedKey, newKey in zip(storedAtoms, newAtoms):
+            source[storedKey[2]] = newKey[2]
+        return [[coords[i] for i in source] for coords in frames]
+
+    # Get the number of frames of the molecule <name>, including its own atoms (frame 0)
+    def frame_count(self, name):
+        frameNo = self.conn.execute('''
+            SELECT max(Frames.FRAME_NO)
+            FROM Frames INNER JOIN Molecules
+            ON Frames.MOLECULE_ID = Molecules.MOLECULE_ID
+            WHERE Molecules.NAME = ?;
+        ''', (name,)).fetchone()[0]
+        return 1 if frameNo is None else frameNo + 1
+
+    # Generate the frames of the molecule <name> from frame <start>, each a list of (x, y, z) in atom order. The frames
+    # are read frame_batch_size at a time, so no query is left open (holding a read transaction) while the caller uses
+    # a frame
+    def get_frames(self, name, start=0):
+        # Decode from the closest keyframe (or the molecule's atoms) at or before start
+        keyframeNo = self.conn.execute('''
+            SELECT max(Frames.FRAME_NO)
+            FROM Frames INNER JOIN Molecules
+            ON Frames.MOLECULE_ID = Molecules.MOLECULE_ID
+            WHERE Molecules.NAME = ? AND Frames.KEYFRAME = 1 AND Frames.FRAME_NO <= ?;
+        ''', (name, start)).fetchone()[0]
+        if keyframeNo is None:
+            keyframeNo = 0
+            atomData = self.conn.execute('''
+                SELECT Atoms.X, Atoms.Y, Atoms.Z
+                FROM Atoms INNER JOIN MoleculeAtom, Molecules
+                ON (MoleculeAtom.MOLECULE_ID = Molecules.MOLECULE_ID) AND (MoleculeAtom.ATOM_ID = Atoms.ATOM_ID)
+                WHERE Molecules.NAME = ?
+                ORDER BY Atoms.ATOM_ID ASC;
+            ''', (name,)).fetchall()
+            coords = [(float(x), float(y), float(z)) for x, y, z in atomData]
+            if start == 0:
+                yield coords
+            previous = quantize(coords)
+        else:
+            previous = None
+
+        nextFrameNo = max(keyframeNo, 1)
+        while True:
+            frameData = self.conn.execute('''
+                SELECT Frames.FRAME_NO, Frames.KEYFRAME, Frames.COORDS
+                FROM Frames INNER JOIN Molecules
+                ON Frames.MOLECULE_ID = Molecules.MOLECULE_ID
+                WHERE Molecules.NAME = ? AND Frames.FRAME_NO >= ?
+                ORDER BY Frames.FRAME_NO ASC
+                LIMIT ?;
+            ''', (name, nextFrameNo, frame_batch_size)).fetchall()
+            for frameNo, keyframe, blob in frameData:
+                decoded = array.array("i")
+                decoded.frombytes(zlib.decompress(blob))
+                if not keyframe:
+                    decoded = array.array("i", [d + p for d, p in zip(decoded, previous)])
+                previous = decoded
+
+                if frameNo >= start:
+                    yield [(decoded[i] / coord_precision, decoded[i + 1] / coord_precision, decoded[i + 2] / coord_precision)
+                           for i in range(0, len(decoded), 3)]
+
+            if len(frameData) < frame_batch_size:
+                return
+            nextFrameNo = frameData[-1][0] + 1
+
+    # Link the molecule <molname> to the atoms and bonds already stored for the molecule <target>
+    def add_alias(self, molname, target):
+        self.conn.execute('''
+            INSERT INTO MoleculeAtom (MOLECULE_ID, ATOM_ID)
+            SELECT (SELECT MOLECULE_ID FROM Molecules WHERE NAME = ?), MoleculeAtom.ATOM_ID
+            FROM MoleculeAtom INNER JOIN Molecules
+            ON MoleculeAtom.MOLECULE_ID = Molecules.MOLECULE_ID
+            WHERE Molecules.NAME = ?;
+        ''', (molname, target))
+        self.conn.execute('''
+            INSERT INTO MoleculeBond (MOLECULE_ID, BOND_ID)
+            SELECT (SELECT MOLECULE_ID FROM Molecules WHERE NAME = ?), MoleculeBond.BOND_ID
+            FROM MoleculeBond INNER JOIN Molecules
+            ON MoleculeBond.MOLECULE_ID = Molecules.MOLECULE_ID
+            WHERE Molecules.NAME = ?;
+        ''', (molname, target))
+
     # Add an element to the Elements table
     def add_element(self, num, symbol, name, c1, c2, c3, radius):
         try:
             self['Elements'] = (num, symbol, name, c1, c2, c3, radius)
         except:
+            self.conn.rollback()
             raise DuplicateEntry("Entry already exists in database")
     
     # Remove an element with element_code <symbol> from Elements table
@@ -195,6 +681,85 @@ class Database:
             WHERE ELEMENT_CODE = '%s';
         ''' % (symbol))
     
+    # Remove the molecule <name> with its atoms, bonds and linking rows in one transaction.
+    # Atoms and bonds that are shared with another molecule of the same structure are kept
+    def remove_molecule(self, name):
+        molID = self.conn.execute('''
+            SELECT MOLECULE_ID FROM Molecules
+            WHERE NAME = ?;
+        ''', (name,)).fetchone()
+        if molID is None:
+            raise MissingEntry("Molecule does not exist in database")
+        molID = molID[0]
+
+        with self.conn:
+            self.conn.execute('''
+                DELETE FROM Atoms
+                WHERE ATOM_ID IN (SELECT ATOM_ID FROM MoleculeAtom WHERE MOLECULE_ID = :id)
+                AND NOT EXISTS (SELECT 1 FROM MoleculeAtom WHERE ATOM_ID = Atoms.ATOM_ID AND MOLECULE_ID != :id);
+            ''', {"id": molID})
+            self.conn.execute('''
+                DELETE FROM Bonds
+                WHERE BOND_ID IN (SELECT BOND_ID FROM MoleculeBond WHERE MOLECULE_ID = :id)
+                AND NOT EXISTS (SELECT 1 FROM MoleculeBond WHERE BOND_ID = Bonds.BOND_ID AND MOLECULE_ID != :id);
+            ''', {"id": molID})
+            self.conn.execute('''
+                DELETE FROM MoleculeAtom
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+            self.conn.execute('''
+                DELETE FROM MoleculeBond
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+            self.conn.execute('''
+                DELETE FROM MoleculeStats
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+            self.conn.execute('''
+                DELETE FROM Frames
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+            self.conn.execute('''
+                DELETE FROM MoleculeElement
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+            if self.has_name_index():
+                self.conn.execute('''
+                    DELETE FROM MoleculeName
+                    WHERE rowid = ?;
+                ''', (molID,))
+
+            # Release the molecule's reference to its structure
+            self.conn.execute('''
+                UPDATE Structures SET REFCOUNT = REFCOUNT - 1
+                WHERE STRUCTURE_ID = (SELECT STRUCTURE_ID FROM MoleculeStructure WHERE MOLECULE_ID = ?);
+            ''', (molID,))
+            self.conn.execute('''
+                DELETE FROM Structures
+                WHERE STRUCTURE_ID = (SELECT STRUCTURE_ID FROM MoleculeStructure WHERE MOLECULE_ID = ?)
+                AND REFCOUNT <= 0;
+            ''', (molID,))
+            self.conn.execute('''
+                DELETE FROM MoleculeStructure
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+
+            self.conn.execute('''
+                DELETE FROM Molecules
+                WHERE MOLECULE_ID = ?;
+            ''', (molID,))
+
+    # Reclaim the pages freed by removed rows and refresh the statistics used by the query planner
+    def compact(self):
+        self.conn.commit()
+        if self.conn.execute("PRAGMA auto_vacuum;").fetchone()[0] != 2:
+            # An existing database only switches to incremental auto-vacuum after one full VACUUM
+            self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+            self.conn.execute("VACUUM;")
+        self.conn.execute("PRAGMA incremental_vacuum;").fetchall()
+        self.conn.execute("ANALYZE;")
+        self.conn.commit()
+
     # Load a new molecule called <name> from the table into a MoDisplay.Molecule() object
     def load_mol(self, name):
         newMol = MolDisplay.Molecule()
@@ -218,6 +783,7 @@ class Database:
         ''' % (name)).fetchall()
 
         # Populate atoms in newMol
+        newMol.reserve(len(atomData), len(bondData))
         for atom in atomData:
             newMol.append_atom(atom[0], float(atom[1]), float(atom[2]), float(atom[3]))
         
@@ -227,37 +793,93 @@ class Database:
 
         return newMol
 
-    # Get list of all molecules in db with the number of atoms and bonds in each molecule
+    # Get list of all molecules in db with the number of atoms and bonds and the formula of each molecule
     def get_molecules(self):
-        atomData = self.conn.execute('''
-            SELECT COUNT(ATOM_ID)
-            FROM MoleculeAtom
-            GROUP BY MOLECULE_ID
-            ORDER BY MOLECULE_ID ASC;
+        moleculeData = self.conn.execute('''
+            SELECT Molecules.MOLECULE_ID, Molecules.NAME, MoleculeStats.ATOM_NO, MoleculeStats.BOND_NO, MoleculeStats.FORMULA
+            FROM Molecules INNER JOIN MoleculeStats
+            ON Molecules.MOLECULE_ID = MoleculeStats.MOLECULE_ID
+            ORDER BY Molecules.MOLECULE_ID ASC;
         ''').fetchall()
 
-        bondData = self.conn.execute('''
-            SELECT COUNT(BOND_ID)
-            FROM MoleculeBond
-            GROUP BY MOLECULE_ID
-            ORDER BY MOLECULE_ID ASC;
-        ''').fetchall()
-
-        moleculeNames = self.conn.execute('''
-            SELECT MOLECULE_ID, NAME
-            FROM Molecules
-            ORDER BY MOLECULE_ID ASC;
-        ''').fetchall()
-        
         # Create list of dictionaries for each molecule
         molList = []
-        i = 0
-        for mol in moleculeNames:
-            print(mol)
-            molList.append({"id": mol[0], "name": mol[1], "atomNum": atomData[i][0], "bondNum": bondData[i][0]})
-            i += 1
+        for mol in moleculeData:
+            molList.append({"id": mol[0], "name": mol[1], "atomNum": mol[2], "bondNum": mol[3], "formula": mol[4]})
         
         return molList
+
+    # Search for molecules by name and content. All the given criteria must match:
+    #   name - Substring of the molecule name (case-insensitive)
+    #   elementRanges - Dictionary of element code to a (minimum, maximum) number of atoms of that element, where
+    #                   None leaves the maximum open. (1, None) means the molecule contains the element
+    #   atomRange - (minimum, maximum) total number of atoms, where None leaves that end open
+    # Returns at most <limit> molecules in the same form as get_molecules(). Only the MoleculeElement, MoleculeStats
+    # and MoleculeName indexes are read, never the atoms of the molecules
+    def search_molecules(self, name=None, elementRanges=None, atomRange=(None, None), limit=100):
+        minAtoms = 0 if atomRange[0] is None else atomRange[0]
+        maxAtoms = sys.maxsize if atomRange[1] is None else atomRange[1]
+
+        # Each criterion as a check of one molecule, and (for the ones that can drive the search) the query of
+        # the IDs of all the molecules that match it
+        checks = []
+        drivers = []
+        for code, (minCount, maxCount) in (elementRanges or {}).items():
+            maxCount = sys.maxsize if maxCount is None else maxCount
+            if minCount:
+                checks.append(("""EXISTS (SELECT 1 FROM MoleculeElement
+                    WHERE MOLECULE_ID = Molecules.MOLECULE_ID AND ELEMENT_CODE = ? AND COUNT BETWEEN ? AND ?)""",
+                    [code, minCount, maxCount]))
+                drivers.append(("""SELECT MOLECULE_ID FROM MoleculeElement
+                    WHERE ELEMENT_CODE = ? AND COUNT BETWEEN ? AND ?""", [code, minCount, maxCount]))
+            else:
+                # Molecules without the element have no row for it
+                checks.append(("""NOT EXISTS (SELECT 1 FROM MoleculeElement
+                    WHERE MOLECULE_ID = Molecules.MOLECULE_ID AND ELEMENT_CODE = ? AND COUNT > ?)""", [code, maxCount]))
+
+        if atomRange != (None, None):
+            checks.append(("+MoleculeStats.ATOM_NO BETWEEN ? AND ?", [minAtoms, maxAtoms]))
+            drivers.append(("""SELECT MOLECULE_ID FROM MoleculeStats
+                WHERE ATOM_NO BETWEEN ? AND ?""", [minAtoms, maxAtoms]))
+
+        driver = None
+        if name and len(name) >= 3 and self.has_name_index():
+            # Trigram match of the name as a single quoted phrase. Names are specific, so they drive the search
+            driver = ("""SELECT rowid FROM MoleculeName
+                WHERE MoleculeName MATCH ?""", ['"' + name.replace('"', '""') + '"'])
+        elif name:
+            checks.append(("Molecules.NAME LIKE ? ESCAPE '\\'",
+                           ["%" + name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"]))
+
+        # Otherwise start from the criterion with the fewest matches, if it has few enough to collect them all.
+        # When every criterion matches many molecules, walk the molecules in order and stop at <limit> matches
+        if driver is None and drivers:
+            matchCounts = [self.conn.execute("SELECT COUNT(*) FROM (%s LIMIT ?);" % query, params + [search_probe_limit]).fetchone()[0]
+                           for query, params in drivers]
+            fewest = matchCounts.index(min(matchCounts))
+            if matchCounts[fewest] < search_probe_limit:
+                driver = drivers[fewest]
+
+        conditions = [check for check, _ in checks]
+        params = [param for _, checkParams in checks for param in checkParams]
+        if driver is not None:
+            conditions.insert(0, "Molecules.MOLECULE_ID IN (%s)" % driver[0])
+            params = driver[1] + params
+
+        moleculeData = self.conn.execute('''
+            SELECT Molecules.MOLECULE_ID, Molecules.NAME, MoleculeStats.ATOM_NO, MoleculeStats.BOND_NO, MoleculeStats.FORMULA
+            FROM Molecules INNER JOIN MoleculeStats
+            ON Molecules.MOLECULE_ID = MoleculeStats.MOLECULE_ID
+            WHERE %s
+            ORDER BY Molecules.MOLECULE_ID ASC
+            LIMIT ?;
+        ''' % (" AND ".join(conditions) if conditions else "1"), params + [limit]).fetchall()
+
+        molList = []
+        for mol in moleculeData:
+            molList.append({"id": mol[0], "name": mol[1], "atomNum": mol[2], "bondNum": mol[3], "formula": mol[4]})
+
+        return molList
     
     # Get list of all elements
     def get_elements(self):
@@ -303,8 +925,22 @@ class Database:
 
         return elementNames
     
-    # Create radial gradients svg string using data from Elements table
-    def radial_gradients(self):
+    # Create element_colours dictionary (element code to its 3 colours) using Elements table data
+    def element_colours(self):
+        colourRows = self.conn.execute('''
+            SELECT ELEMENT_CODE, COLOUR1, COLOUR2, COLOUR3
+            FROM Elements;
+        ''').fetchall()
+
+        elementColours = {}
+        for row in colourRows:
+            elementColours[row[0]] = (row[1], row[2], row[3])
+
+        return elementColours
+    
+    # Create radial gradients svg string using data from Elements table.
+    # If a list of element codes <elements> is given, only the gradients of those elements are created
+    def radial_gradients(self, elements=None):
         # Default colour for elements that are not in db
         radialGradientSVG = """ 
   <radialGradient id="%s" cx="-50%%" cy="-50%%" r="220%%" fx="20%%" fy="20%%"> 
@@ -314,10 +950,17 @@ class Database:
   </radialGradient>""" % ("default", "E2E8F0", "718096", "1a202c")
 
         # Get colour and name data from Elements
-        elements = self.conn.execute('''
-            SELECT ELEMENT_NAME, COLOUR1, COLOUR2, COLOUR3
-            FROM Elements;
-        ''').fetchall()
+        if elements is None:
+            elements = self.conn.execute('''
+                SELECT ELEMENT_NAME, COLOUR1, COLOUR2, COLOUR3
+                FROM Elements;
+            ''').fetchall()
+        else:
+            elements = self.conn.execute('''
+                SELECT ELEMENT_NAME, COLOUR1, COLOUR2, COLOUR3
+                FROM Elements
+                WHERE ELEMENT_CODE IN (%s);
+            ''' % ", ".join("?" for _ in elements), tuple(elements)).fetchall()
 
         # Create radialGradientsSVG string for each element
         for element in elements:
@@ -335,4 +978,35 @@ class Database:
     # Helper method to commit transactions to database
     def commit_db(self):
         self.conn.commit()
-        
\ No newline at end of file
+        
+
+
+# Compactor Class: Background thread that compacts the database some time after molecules are removed.
+# Uses its own connection, since sqlite connections can only be used in the thread that created them
+# Methods: request() - Schedule a compaction
+class Compactor (threading.Thread):
+    def __init__(self, delay=30.0):
+        super().__init__(daemon=True)
+        self.delay = delay
+        self.pending = threading.Event()
+
+    def request(self):
+        self.pending.set()
+
+    def run(self):
+        db = Database(reset=False)
+        while True:
+            self.pending.wait()
+            # Wait for the churn to settle so several removals share one compaction
+            time.sleep(self.delay)
+            self.pending.clear()
+            try:
+                db.compact()
+            except sqlite3.OperationalError:
+                # Database is busy, try again later
+                self.pending.set()
+
+
+# Convert a list of (x, y, z) coordinates to a flat array of integers in units of 1/coord_precision Angstroms
+def quantize(coords):
+    return array.array("i", [round(c * coord_precision) for xyz in coords for c in xyz])
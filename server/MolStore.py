@@ -0,0 +1,172 @@
+import mmap
+import os
+import json
+import struct
+import sys
+import MolDisplay
+import MolSql
+from MolExceptions import MissingEntry
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+# File header: magic string and format version
+header_format = struct.Struct("=8sI4x")
+magic = b"MOLSTORE"
+version = 2
+
+# Atom record, laid out as the atom structure in mol.h: char element[3], (padding), double x, y, z
+atom_format = struct.Struct("@3s5x3d")
+# Bond record, laid out as the bond_record structure in mol.h: unsigned short a1, a2, unsigned char epairs, (padding)
+bond_format = struct.Struct("@HHBx")
+
+'''
+******************
+*   CLASSES
+******************
+'''
+
+# MolStore Class: Read-only, memory-mapped store of molecules built from the database.
+# The store file holds the fixed-layout atom and bond records of each molecule one after the other, and the
+# index file (<path>.idx) maps each molecule name to the offset and number of its atom and bond records and to the
+# MOLECULE_ID it had in the database. Molecule IDs are never reused, so a copy is only current while the database
+# still has the molecule under the same ID (see is_current()): removing a molecule or uploading it again makes
+# its copy stale, even in servers started after the change.
+# The records can be handed to the C core (load_mol) or viewed without parsing, e.g. with
+# numpy.frombuffer(store.atom_records(name), dtype=[("element", "S3"), ("", "V5"), ("x", "f8"), ("y", "f8"), ("z", "f8")])
+# Methods: atom_records() - memoryview of the atom records of a molecule
+#          bond_records() - memoryview of the bond records of a molecule
+#          load_mol() - Load a molecule from the store into a MolDisplay.Molecule object
+#          is_current() - Check whether the copy of a molecule matches the database
+#          close() - Unmap the store file
+class MolStore ():
+    def __init__(self, path="molecules.store"):
+        self.path = path
+        with open(path, "rb") as filePtr:
+            self.map = mmap.mmap(filePtr.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        fileMagic, fileVersion = header_format.unpack_from(self.map, 0)
+        if fileMagic != magic or fileVersion != version:
+            self.close()
+            raise ValueError("%s is not a molecule store (version %d)" % (path, version))
+
+        with open(path + ".idx") as indexPtr:
+            self.index = json.load(indexPtr)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self):
+        return list(self.index)
+
+    def atom_records(self, name):
+        try:
+            atomOffset, atomNo, _, _, _ = self.index[name]
+        except KeyError:
+            raise MissingEntry("Molecule does not exist in store")
+        return self.view[atomOffset:atomOffset + atomNo * atom_format.size]
+
+    def bond_records(self, name):
+        try:
+            _, _, bondOffset, bondNo, _ = self.index[name]
+        except KeyError:
+            raise MissingEntry("Molecule does not exist in store")
+        return self.view[bondOffset:bondOffset + bondNo * bond_format.size]
+
+    def load_mol(self, name):
+        newMol = MolDisplay.Molecule()
+        newMol.append_atom_records(self.atom_records(name))
+        newMol.append_bond_records(self.bond_records(name))
+        return newMol
+
+    def is_current(self, name, molID):
+        return name in self.index and self.index[name][4] == molID
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create an empty store file <path> with its index file
+def create(path):
+    with open(path, "wb") as filePtr:
+        filePtr.write(header_format.pack(magic, version))
+    write_index(path, {})
+
+# Append the molecule <mol> called <name>, with the MOLECULE_ID <molID> in the database, to the store file <path> and
+# record it in the index file.
+# If an <index> (name to records, as read from the index file) is given, the molecule is only recorded in it, and
+# the caller writes it with write_index() once it has appended all its molecules
+def append(path, name, molID, mol, index=None):
+    writeIndex = index is None
+    if writeIndex:
+        with open(path + ".idx") as indexPtr:
+            index = json.load(indexPtr)
+
+    with open(path, "ab") as filePtr:
+        # Keep atom records aligned for the doubles they contain
+        offset = filePtr.tell()
+        padding = -offset % 8
+        filePtr.write(bytes(padding))
+
+        atomOffset = offset + padding
+        atomRecords = bytearray()
+        for i in range(mol.atom_no):
+            cAtom = mol.get_atom(i)
+            atomRecords += atom_format.pack(cAtom.element.encode(), cAtom.x, cAtom.y, cAtom.z)
+        filePtr.write(atomRecords)
+
+        bondOffset = atomOffset + len(atomRecords)
+        bondRecords = bytearray()
+        for i in range(mol.bond_no):
+            cBond = mol.get_bond(i)
+            bondRecords += bond_format.pack(cBond.a1, cBond.a2, cBond.epairs)
+        filePtr.write(bondRecords)
+
+    index[name] = [atomOffset, mol.atom_no, bondOffset, mol.bond_no, molID]
+    if writeIndex:
+        write_index(path, index)
+
+# Rebuild the store file <path> from all the molecules in the database <db>.
+# The new files replace the old ones, so stores that are already open keep reading the old file
+def build(db, path="molecules.store"):
+    buildPath = path + ".build"
+    create(buildPath)
+    index = {}
+    for mol in db.get_molecules():
+        append(buildPath, mol["name"], mol["id"], db.load_mol(mol["name"]), index)
+    write_index(buildPath, index)
+
+    os.replace(buildPath, path)
+    os.replace(buildPath + ".idx", path + ".idx")
+
+# Write the index <index> of the store file <path>
+def write_index(path, index):
+    with open(path + ".idx.tmp", "w") as indexPtr:
+        json.dump(index, indexPtr)
+    os.replace(path + ".idx.tmp", path + ".idx")
+
+# Open the store file <path> if it exists, otherwise return None. A store built by an older version is not used
+# until it is rebuilt
+def open_store(path="molecules.store"):
+    if os.path.exists(path) and os.path.exists(path + ".idx"):
+        try:
+            return MolStore(path)
+        except ValueError as err:
+            print(err)
+    return None
+
+
+if __name__ == "__main__":
+    # Rebuild the store from molecules.db
+    db = MolSql.Database(reset=False)
+    build(db, sys.argv[1] if len(sys.argv) == 2 else "molecules.store")
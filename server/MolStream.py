@@ -0,0 +1,202 @@
+import bisect
+import secrets
+import threading
+import time
+import MolDisplay
+
+# RotationSession Class: One client's interactive rotation of a molecule, streamed as server-sent events. The molecule
+# stays loaded for the whole session, and each frame is sent as the changes to the primitives (atoms "a<index>" and
+# bonds "b<index>", by their index in the molecule) since the previous frame: the atoms that moved, and the primitives
+# that changed places in the z-order. The client moves the ends of the bonds with their atoms (see bondAtoms).
+# Orientation updates that arrive while a frame is being rendered replace each other, so only the latest is rendered
+# Members: id - Random token that identifies the session to /rotate-update
+#          name - Name of the molecule
+#          header - Root element and definitions of the compact svg of the molecule (see MolDisplay.compact_header())
+#          bondAtoms - Indices of the two atoms of each bond
+#          updated - time.monotonic() of the last orientation update
+#          reason - Why the session was closed ("removed" when its molecule was removed), None while it is open
+# Methods: update() - Set the orientation to render next
+#          wait() - Wait for an orientation update
+#          close() - End the session
+#          svg() - Create the compact svg of an orientation, with an id on each primitive
+#          diff() - Create the changes from the previous frame to an orientation
+class RotationSession ():
+    def __init__(self, sessionId, name, newMol, header):
+        self.id = sessionId
+        self.name = name
+        self.header = header
+        self.mol = newMol
+        self.baseCoords = newMol.coord_records()
+        self.elements = [newMol.get_atom(i).element for i in range(newMol.atom_no)]
+        self.bondAtoms = [(newMol.get_bond(i).a1, newMol.get_bond(i).a2) for i in range(newMol.bond_no)]
+
+        self.condition = threading.Condition()
+        self.orientation = (0, 0, 0)
+        self.version = 0
+        self.sentVersion = 0
+        self.closed = False
+        self.reason = None
+        self.updated = time.monotonic()
+
+        # Positions and z-order of the primitives in the last frame sent
+        self.positions = {}
+        self.order = []
+
+    def update(self, xRot, yRot, zRot):
+        with self.condition:
+            self.orientation = (xRot % 360, yRot % 360, zRot % 360)
+            self.version += 1
+            self.updated = time.monotonic()
+            self.condition.notify()
+
+    # Wait up to <timeout> seconds for an orientation that was not rendered yet. Returns None on timeout or close
+    def wait(self, timeout):
+        with self.condition:
+            if self.version == self.sentVersion and not self.closed:
+                self.condition.wait(timeout)
+            if self.closed or self.version == self.sentVersion:
+                return None
+            self.sentVersion = self.version
+            return self.orientation
+
+    def close(self, reason="closed"):
+        with self.condition:
+            if not self.closed:
+                self.closed = True
+                self.reason = reason
+            self.condition.notify()
+
+    # Compact svg of the molecule in <orientation>. Atoms are <use> elements and bonds are <line> elements, so
+    # diff() can move each primitive on its own
+    def svg(self, orientation):
+        positions, order = self.frame(orientation)
+        self.positions = positions
+        self.order = order
+
+        svgStr = self.header
+        for key in order:
+            if key[0] == "a":
+                svgStr += '<use id="%s" href="#%s" x="%d" y="%d"/>' % ((key, self.elements[int(key[1:])]) + positions[key])
+            else:
+                svgStr += '<line id="%s" x1="%d" y1="%d" x2="%d" y2="%d"/>' % ((key,) + positions[key])
+        return svgStr + MolDisplay.footer
+
+    # Changes from the previous frame to the molecule in <orientation>, as a dictionary with the new positions of the
+    # atoms that moved ("move") and the moves that put the primitives in the new z-order ("order", see reorder()).
+    # Returns None if nothing changed
+    def diff(self, orientation):
+        positions, order = self.frame(orientation)
+        changes = {}
+
+        moved = {key: positions[key] for key in positions if key[0] == "a" and self.positions.get(key) != positions[key]}
+        if moved:
+            changes["move"] = moved
+        if order != self.order:
+            changes["order"] = reorder(self.order, order)
+
+        self.positions = positions
+        self.order = order
+        return changes if changes else None
+
+    # Positions in pixels of each primitive of the molecule in <orientation>, and the primitives in ascending z-order.
+    # On equal z-values a bond comes before an atom, as in svg_chunks()
+    def frame(self, orientation):
+        self.mol.set_coord_records(self.baseCoords)
+        self.mol.rotate(*orientation)
+        coords = self.mol.get_frame()
+
+        positions = {}
+        depths = []
+        for i, (x, y, z) in enumerate(coords):
+            positions["a%d" % i] = (round(x * 100.0), round(y * 100.0))
+            depths.append((z, 1, i, "a%d" % i))
+        for i, (a1, a2) in enumerate(self.bondAtoms):
+            positions["b%d" % i] = positions["a%d" % a1] + positions["a%d" % a2]
+            depths.append(((coords[a1][2] + coords[a2][2]) / 2.0, 0, i, "b%d" % i))
+        depths.sort()
+
+        return positions, [depth[3] for depth in depths]
+
+# RotationSessions Class: The open rotation sessions by id. Safe to use from several request handler threads
+# Members: max_sessions - Largest number of sessions open at once
+#          idle_timeout - Seconds without an orientation update after which a session ends
+# Methods: open() - Start a session
+#          get() - Get an open session by id
+#          close() - End a session
+#          close_molecule() - End the sessions of a molecule
+#          expired() - Whether a session went idle
+class RotationSessions ():
+    def __init__(self, max_sessions=64, idle_timeout=300.0):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.sessions = {}
+
+    # Start a session rotating the molecule <newMol> called <name>. Returns None if too many sessions are open
+    def open(self, name, newMol, header):
+        with self.lock:
+            if len(self.sessions) >= self.max_sessions:
+                return None
+            session = RotationSession(secrets.token_urlsafe(16), name, newMol, header)
+            self.sessions[session.id] = session
+        return session
+
+    def get(self, sessionId):
+        with self.lock:
+            return self.sessions.get(sessionId)
+
+    def close(self, session):
+        session.close()
+        with self.lock:
+            self.sessions.pop(session.id, None)
+
+    # End the sessions rotating the molecule called <name>, e.g. because it was removed. Their streams end with
+    # <reason>
+    def close_molecule(self, name, reason="removed"):
+        with self.lock:
+            closing = [session for session in self.sessions.values() if session.name == name]
+        for session in closing:
+            session.close(reason)
+            self.close(session)
+
+    def expired(self, session):
+        return time.monotonic() - session.updated > self.idle_timeout
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create the moves that turn the z-order <old> into <new> (lists of the same primitives): the primitives outside a
+# longest run of primitives that kept their order, each as [primitive, primitive it goes before or None for the end].
+# Moves are listed from the back of the z-order, so each one goes before a primitive that is already in place
+def reorder(old, new):
+    oldIndex = {key: i for i, key in enumerate(old)}
+    sequence = [oldIndex[key] for key in new]
+
+    # Longest increasing subsequence of the old positions, as indices into new
+    tails = []
+    tailIndices = []
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        j = bisect.bisect_left(tails, value)
+        if j == len(tails):
+            tails.append(value)
+            tailIndices.append(i)
+        else:
+            tails[j] = value
+            tailIndices[j] = i
+        previous[i] = tailIndices[j - 1] if j > 0 else -1
+
+    kept = set()
+    i = tailIndices[-1] if tailIndices else -1
+    while i != -1:
+        kept.add(i)
+        i = previous[i]
+
+    moves = []
+    for i in range(len(new) - 1, -1, -1):
+        if i not in kept:
+            moves.append([new[i], new[i + 1] if i + 1 < len(new) else None])
+    return moves
@@ -0,0 +1,126 @@
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolDisplay
+import MolSql
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+# Number of molecules in the synthetic catalog (override with the first command-line argument)
+catalog_size = 1000000
+# Molecules inserted per transaction while building the catalog
+batch_size = 10000
+# Times each query is run; the median is reported
+repeats = 5
+
+syllables = ["al", "ben", "caf", "cor", "di", "eth", "fen", "gly", "hex", "in", "ket", "lin", "meth", "nor", "ol",
+             "pro", "quin", "ros", "sul", "tri", "ur", "val", "xan", "yl", "zol"]
+
+# (description, search_molecules() keyword arguments)
+queries = [
+    ("contains N and O", {"elementRanges": {"N": (1, None), "O": (1, None)}}),
+    ("C8-C12", {"elementRanges": {"C": (8, 12)}}),
+    ("atoms between 20 and 200", {"atomRange": (20, 200)}),
+    ("name contains 'quinol'", {"name": "quinol"}),
+    ("name contains 'di' (no index)", {"name": "di"}),
+    ("C8-C12 with S, 20-40 atoms", {"elementRanges": {"C": (8, 12), "S": (1, None)}, "atomRange": (20, 40)}),
+    ("no N, name contains 'caf'", {"elementRanges": {"N": (0, 0)}, "name": "caf"}),
+]
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create a random element count dictionary for a synthetic molecule
+def random_counts(rand):
+    carbon = rand.randint(1, 60)
+    counts = {"C": carbon, "H": rand.randint(0, 2 * carbon + 2)}
+    for code, maxCount, chance in (("N", 6, 0.5), ("O", 8, 0.7), ("S", 2, 0.1), ("Cl", 3, 0.05)):
+        if rand.random() < chance:
+            counts[code] = rand.randint(1, maxCount)
+    return {code: count for code, count in counts.items() if count > 0}
+
+# Fill the empty database <db> with <size> synthetic molecules. Only the tables searches read are filled:
+# the molecules have no atoms or bonds
+def build_catalog(db, size):
+    rand = random.Random(31260)
+    molID = 0
+    while molID < size:
+        molecules = []
+        stats = []
+        elements = []
+        for _ in range(min(batch_size, size - molID)):
+            molID += 1
+            name = "".join(rand.choice(syllables) for _ in range(rand.randint(2, 5))).title() + str(molID)
+            counts = random_counts(rand)
+            atomNo = sum(counts.values())
+            molecules.append((molID, name))
+            stats.append((molID, atomNo, atomNo - 1) + (0.0,) * 11 + (MolDisplay.formula(counts), ",".join(sorted(counts))))
+            elements += [(code, count, molID) for code, count in counts.items()]
+
+        with db.conn:
+            db.conn.executemany("INSERT INTO Molecules VALUES (?, ?);", molecules)
+            db.conn.executemany("INSERT INTO MoleculeStats VALUES (%s);" % ", ".join("?" * 16), stats)
+            db.conn.executemany("INSERT INTO MoleculeElement VALUES (?, ?, ?);", elements)
+            if db.has_name_index():
+                db.conn.executemany("INSERT INTO MoleculeName (rowid, NAME) VALUES (?, ?);", molecules)
+
+    db.conn.execute("ANALYZE;")
+
+# Time <function>() <repeats> times and return the median in milliseconds
+def median_ms(function):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) == 2 else catalog_size
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        # Database works on molecules.db in the current directory
+        os.chdir(tempDir)
+        db = MolSql.Database(reset=True)
+
+        start = time.perf_counter()
+        build_catalog(db, size)
+        print("Built a catalog of %d molecules in %.1f s (name index: %s)"
+              % (size, time.perf_counter() - start, "fts5 trigram" if db.has_name_index() else "none"))
+        print()
+
+        print("%-32s %10s %10s" % ("query", "matches", "median ms"))
+        for description, kwargs in queries:
+            matches = len(db.search_molecules(limit=size, **kwargs))
+            firstPage = median_ms(lambda: db.search_molecules(limit=100, **kwargs))
+            print("%-32s %10d %10.2f" % (description, matches, firstPage))
+        print()
+
+        # Record the tables each search reads: only the indexes, never Atoms
+        tablesRead = set()
+        def authorizer(action, table, column, database, trigger):
+            if action == sqlite3.SQLITE_READ and not table.startswith("sqlite_"):
+                tablesRead.add(table)
+            return sqlite3.SQLITE_OK
+
+        db.conn.set_authorizer(authorizer)
+        for _, kwargs in queries:
+            db.search_molecules(**kwargs)
+        db.conn.set_authorizer(None)
+        print("Tables read by the searches: " + ", ".join(sorted(tablesRead)))
+
+        db.conn.close()
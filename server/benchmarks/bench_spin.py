@@ -0,0 +1,92 @@
+import math
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import molecule
+import MolDisplay
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+sdf_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "sdf-examples")
+
+# Molecules spun: sdf examples by file name, and synthetic chains by atom count
+cases = ["CID_31260.sdf", "cocaine-3D-structure-CT1002384854.sdf", 200, 1000]
+# spin() calls timed per molecule; the median is reported
+repeats = 200
+# Rotation sets kept alive at once while measuring peak RSS
+live_sets = 50
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Load a molecule from an sdf example, or build a synthetic zig-zag chain of <case> carbon atoms
+def load_case(case):
+    newMol = MolDisplay.Molecule()
+    if isinstance(case, str):
+        with open(os.path.join(sdf_dir, case)) as filePtr:
+            newMol.parse(filePtr)
+    else:
+        newMol.reserve(case, case - 1)
+        for i in range(case):
+            newMol.append_atom("C", 1.25 * i, 0.8 * (i % 2), math.sin(i))
+        for i in range(case - 1):
+            newMol.append_bond(i, i + 1, 1)
+    return newMol
+
+# Peak resident set size of this process in KiB
+def peak_rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+# Spin the molecule of <case> and print one result row. Run in a child process so peak RSS is per case
+def run_case(case):
+    mol = load_case(case)
+    startRss = peak_rss()
+
+    # Throughput and allocations of spin() + rotationsfree()
+    molecule.allocstats_reset()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        molecule.rotationsfree(molecule.spin(mol))
+        times.append((time.perf_counter() - start) * 1000.0)
+    counts = molecule.allocstats()
+
+    # Peak RSS with <live_sets> rotation sets alive at once
+    sets = [molecule.spin(mol) for _ in range(live_sets)]
+    arenaBytes = sets[0].arena.size
+    rssGrowth = peak_rss() - startRss
+    for rotations in sets:
+        molecule.rotationsfree(rotations)
+
+    median = statistics.median(times)
+    print("%-40s %6d %10.3f %10.0f %8.1f %8.1f %12.1f %12d" % (
+        case, mol.atom_no, median, 1000.0 / median,
+        (counts.mallocs + counts.reallocs) / repeats, counts.frees / repeats,
+        arenaBytes / 1024.0, rssGrowth))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--case":
+        case = sys.argv[2]
+        run_case(int(case) if case.isdigit() else case)
+        sys.exit(0)
+
+    print("spin() + rotationsfree(): median of %d calls; peak RSS growth with %d rotation sets alive"
+          % (repeats, live_sets))
+    print("%-40s %6s %10s %10s %8s %8s %12s %12s" % (
+        "molecule", "atoms", "median ms", "spins/s", "allocs", "frees", "arena KiB", "peak RSS KiB"))
+    for case in cases:
+        sys.stdout.flush()
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--case", str(case)], check=True)
@@ -0,0 +1,75 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolSql
+import bench_search
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+server_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Number of molecules in the synthetic database (override with the first command-line argument)
+catalog_size = 200000
+# Fresh processes started for each measurement; the median is reported
+repeats = 9
+
+# (description, code run in a fresh process: the time of its import and of the first query are measured)
+starts = [
+    ("import server", "import server as module; db = module.db"),
+    ("import MolSql, Database()", "import MolSql; db = MolSql.Database()"),
+]
+
+child = '''
+import sys, time
+sys.path.insert(0, %r)
+start = time.perf_counter()
+%s
+imported = time.perf_counter()
+db.get_stats("Missing")
+print(imported - start, time.perf_counter() - imported)
+'''
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Run <code> in <repeats> fresh processes in the directory <dbDir> and return the median times in milliseconds of
+# its import and of the first query
+def measure(code, dbDir):
+    importTimes = []
+    queryTimes = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", child % (server_dir, code)], cwd=dbDir, check=True,
+                                capture_output=True, text=True).stdout.split()
+        importTimes.append(float(output[-2]) * 1000.0)
+        queryTimes.append(float(output[-1]) * 1000.0)
+    return statistics.median(importTimes), statistics.median(queryTimes)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) == 2 else catalog_size
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        # Database works on molecules.db in the current directory
+        os.chdir(tempDir)
+        db = MolSql.Database(reset=True)
+        bench_search.build_catalog(db, size)
+        db.conn.close()
+        print("Database of %d molecules: %.1f MB, schema version %d"
+              % (size, os.path.getsize("molecules.db") / 1e6, len(MolSql.Database.migrations)))
+        print()
+
+        print("%-32s %12s %16s" % ("start", "import ms", "first query ms"))
+        for description, code in starts:
+            importTime, queryTime = measure(code, tempDir)
+            print("%-32s %12.2f %16.2f" % (description, importTime, queryTime))
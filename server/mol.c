@@ -1,7 +1,41 @@
 #include "mol.h"
+#include <limits.h>
 
 // NOTE: Detailed function comments and descriptions are in mol.h in an attempt to resemble API documentation
 
+// Alignment in bytes of the blocks handed out by arenaalloc()
+#define ARENA_ALIGN 16
+
+// Allocation counters returned by allocstats()
+static alloc_stats allocCounts;
+
+// malloc() that updates the allocation counters
+static void *counted_malloc(size_t size) {
+    allocCounts.mallocs++;
+    allocCounts.bytes += size;
+    return malloc(size);
+}
+
+// realloc() that updates the allocation counters
+static void *counted_realloc(void *ptr, size_t size) {
+    allocCounts.reallocs++;
+    allocCounts.bytes += size;
+    return realloc(ptr, size);
+}
+
+// free() that updates the allocation counters
+static void counted_free(void *ptr) {
+    if (ptr != NULL) {
+        allocCounts.frees++;
+    }
+    free(ptr);
+}
+
+// Round a number of bytes up to a multiple of ARENA_ALIGN
+static size_t arena_round(size_t size) {
+    return (size + ARENA_ALIGN - 1) / ARENA_ALIGN * ARENA_ALIGN;
+}
+
 // Set atom data
 void atomset(atom *atom, char element[3], double *x, double *y, double *z) {
     strcpy(atom->element, element);
@@ -51,13 +85,14 @@ void compute_coords(bond *bond) {
 
 // Allocate memory for a new molecule
 molecule *molmalloc(unsigned short atom_max, unsigned short bond_max) {
-    molecule *newMol = (molecule *) malloc(sizeof(struct molecule));
+    molecule *newMol = (molecule *) counted_malloc(sizeof(struct molecule));
 
     // Check for malloc() failure, return NULL if failed
     if (newMol == NULL) {
         printf("ERROR: malloc() failed, returning NULL\n");
         return NULL;
     }
+    newMol->arena = NULL;
     
     // Atoms allocation
     newMol->atom_max = atom_max;
@@ -66,8 +101,8 @@ molecule *molmalloc(unsigned short atom_max, unsigned short bond_max) {
         newMol->atoms = NULL;
         newMol->atom_ptrs = NULL;
     } else {
-        newMol->atoms = (atom *) malloc(atom_max * sizeof(struct atom));
-        newMol->atom_ptrs = (atom **) malloc(atom_max * sizeof(struct atom *));
+        newMol->atoms = (atom *) counted_malloc(atom_max * sizeof(struct atom));
+        newMol->atom_ptrs = (atom **) counted_malloc(atom_max * sizeof(struct atom *));
     }
 
     // Bonds allocation
@@ -77,13 +112,74 @@ molecule *molmalloc(unsigned short atom_max, unsigned short bond_max) {
         newMol->bonds = NULL;
         newMol->bond_ptrs = NULL;
     } else {
-        newMol->bonds = (bond *) malloc(bond_max * sizeof(struct bond));
-        newMol->bond_ptrs = (bond **) malloc(bond_max * sizeof(struct bond *));
+        newMol->bonds = (bond *) counted_malloc(bond_max * sizeof(struct bond));
+        newMol->bond_ptrs = (bond **) counted_malloc(bond_max * sizeof(struct bond *));
     }
 
     return newMol;
 }
 
+// Grow the arrays of molecule to at least atom_max atoms and bond_max bonds
+void molreserve(molecule *molecule, unsigned short atom_max, unsigned short bond_max) {
+    atom *newAtoms;
+    atom **newAtomPtrs;
+    bond *newBonds;
+    bond **newBondPtrs;
+
+    // Molecules in an arena cannot grow
+    if (molecule->arena != NULL) {
+        return;
+    }
+
+    if (atom_max > molecule->atom_max) {
+        newAtoms = counted_realloc(molecule->atoms, atom_max * sizeof(struct atom));
+        if (newAtoms == NULL) {
+            printf("ERROR: realloc() failed, returning without growing atoms...\n");
+            return;
+        }
+        molecule->atoms = newAtoms;
+
+        // Rebind pointers to atoms according to index number, and the bonds to the moved atoms, before growing
+        // atom_ptrs, so the molecule is still consistent (with its old atom_max) if that fails
+        for (int i = 0; i < molecule->atom_no; i++) {
+            molecule->atom_ptrs[i] = &(molecule->atoms[i]);
+        }
+        for (int i = 0; i < molecule->bond_no; i++) {
+            molecule->bonds[i].atoms = molecule->atoms;
+        }
+
+        newAtomPtrs = counted_realloc(molecule->atom_ptrs, atom_max * sizeof(struct atom *));
+        if (newAtomPtrs == NULL) {
+            printf("ERROR: realloc() failed, returning without growing atoms...\n");
+            return;
+        }
+        molecule->atom_ptrs = newAtomPtrs;
+        molecule->atom_max = atom_max;
+    }
+
+    if (bond_max > molecule->bond_max) {
+        newBonds = counted_realloc(molecule->bonds, bond_max * sizeof(struct bond));
+        if (newBonds == NULL) {
+            printf("ERROR: realloc() failed, returning without growing bonds...\n");
+            return;
+        }
+        molecule->bonds = newBonds;
+
+        // Rebind pointers to bonds according to index number, before growing bond_ptrs (see above)
+        for (int i = 0; i < molecule->bond_no; i++) {
+            molecule->bond_ptrs[i] = &(molecule->bonds[i]);
+        }
+
+        newBondPtrs = counted_realloc(molecule->bond_ptrs, bond_max * sizeof(struct bond *));
+        if (newBondPtrs == NULL) {
+            printf("ERROR: realloc() failed, returning without growing bonds...\n");
+            return;
+        }
+        molecule->bond_ptrs = newBondPtrs;
+        molecule->bond_max = bond_max;
+    }
+}
+
 // Create copy of molecule
 molecule *molcopy(molecule *src) {
     molecule *copyMol = molmalloc(src->atom_max, src->bond_max);
@@ -108,17 +204,35 @@ molecule *molcopy(molecule *src) {
 
 // Free molecule
 void molfree(molecule *ptr) {
-    free(ptr->atoms);
-    free(ptr->atom_ptrs);
-    free(ptr->bonds);
-    free(ptr->bond_ptrs);
-    free(ptr);
+    // Molecules in an arena are freed with the arena
+    if (ptr->arena != NULL) {
+        return;
+    }
+
+    counted_free(ptr->atoms);
+    counted_free(ptr->atom_ptrs);
+    counted_free(ptr->bonds);
+    counted_free(ptr->bond_ptrs);
+    counted_free(ptr);
+}
+
+// Get number of bytes allocated to molecule
+size_t molsize(molecule *mol) {
+    return sizeof(struct molecule)
+            + mol->atom_max * (sizeof(struct atom) + sizeof(struct atom *))
+            + mol->bond_max * (sizeof(struct bond) + sizeof(struct bond *));
 }
 
 // Append an atom to molecule
 void molappend_atom(molecule *molecule, atom *atom) {
     int needRealloc = 0;    // Flags if need to call realloc() for atoms and atom_ptrs arrays
 
+    // Molecules in an arena cannot grow
+    if (molecule->atom_no >= molecule->atom_max && molecule->arena != NULL) {
+        printf("ERROR: molecule in an arena is full, returning without appending atom...\n");
+        return;
+    }
+
     // Check and update atom_max if arrays are full and need more space
     if (molecule->atom_max == 0) {
         molecule->atom_max = 1;
@@ -129,8 +243,8 @@ void molappend_atom(molecule *molecule, atom *atom) {
     }
     // Reallocating arrays
     if (needRealloc == 1) {
-        molecule->atoms = realloc(molecule->atoms, molecule->atom_max * sizeof(struct atom));
-        molecule->atom_ptrs = realloc(molecule->atom_ptrs, molecule->atom_max * sizeof(struct atom *));
+        molecule->atoms = counted_realloc(molecule->atoms, molecule->atom_max * sizeof(struct atom));
+        molecule->atom_ptrs = counted_realloc(molecule->atom_ptrs, molecule->atom_max * sizeof(struct atom *));
         // Check if realloc() fails, return without appending atom if failed
         if (molecule->atoms == NULL || molecule->atom_ptrs == NULL) {
             printf("ERROR: realloc() failed, returning without appending atom...\n");
@@ -153,6 +267,12 @@ void molappend_atom(molecule *molecule, atom *atom) {
 void molappend_bond(molecule *molecule, bond *bond) {
     int needRealloc = 0;    // Flags if need to call realloc() for bonds and bond_ptrs arrays
 
+    // Molecules in an arena cannot grow
+    if (molecule->bond_no >= molecule->bond_max && molecule->arena != NULL) {
+        printf("ERROR: molecule in an arena is full, returning without appending bond...\n");
+        return;
+    }
+
     // Check and update bond_max if arrays are full and need more space
     if (molecule->bond_max == 0) {
         molecule->bond_max = 1;
@@ -163,8 +283,8 @@ void molappend_bond(molecule *molecule, bond *bond) {
     }
     // Reallocating arrays
     if (needRealloc == 1) {
-        molecule->bonds = realloc(molecule->bonds, molecule->bond_max * sizeof(struct bond));
-        molecule->bond_ptrs = realloc(molecule->bond_ptrs, molecule->bond_max * sizeof(struct bond *));
+        molecule->bonds = counted_realloc(molecule->bonds, molecule->bond_max * sizeof(struct bond));
+        molecule->bond_ptrs = counted_realloc(molecule->bond_ptrs, molecule->bond_max * sizeof(struct bond *));
         // Check if realloc() fails, return without appending bond if failed
         if (molecule->bonds == NULL || molecule->bond_ptrs == NULL) {
             printf("ERROR: realloc() failed, returning without appending bond...\n");
@@ -183,6 +303,49 @@ void molappend_bond(molecule *molecule, bond *bond) {
     (molecule->bond_no)++;
 }
 
+// Append an array of atoms to molecule
+void molappend_atoms(molecule *molecule, const atom *atoms, size_t count) {
+    atom newAtom;
+
+    // Grow the arrays once for all of the atoms
+    if (molecule->atom_no + count <= USHRT_MAX) {
+        molreserve(molecule, (unsigned short) (molecule->atom_no + count), molecule->bond_max);
+    }
+    for (size_t i = 0; i < count; i++) {
+        newAtom = atoms[i];
+        molappend_atom(molecule, &newAtom);
+    }
+}
+
+// Append an array of bond records to molecule
+void molappend_bond_records(molecule *molecule, const bond_record *records, size_t count) {
+    bond newBond;
+
+    // Grow the arrays once for all of the bonds
+    if (molecule->bond_no + count <= USHRT_MAX) {
+        molreserve(molecule, molecule->atom_max, (unsigned short) (molecule->bond_no + count));
+    }
+    for (size_t i = 0; i < count; i++) {
+        newBond.a1 = records[i].a1;
+        newBond.a2 = records[i].a2;
+        newBond.epairs = records[i].epairs;
+        molappend_bond(molecule, &newBond);
+    }
+}
+
+// Set the coordinates of the atoms of molecule and recompute its bonds
+void molset_coords(molecule *molecule, const double *coords, size_t count) {
+    for (size_t i = 0; i < count && i < molecule->atom_no; i++) {
+        molecule->atoms[i].x = coords[i * 3];
+        molecule->atoms[i].y = coords[i * 3 + 1];
+        molecule->atoms[i].z = coords[i * 3 + 2];
+    }
+
+    for (int i = 0; i < molecule->bond_no; i++) {
+        compute_coords(&(molecule->bonds[i]));
+    }
+}
+
 // Atom comparison function for qsort()
 int compare_atom(const void * a1, const void * a2) {
     atom **atom_ptr1, **atom_ptr2;
@@ -299,20 +462,150 @@ void mol_xform(molecule *molecule, xform_matrix matrix) {
     }
 }
 
+/*********************************
+ *        ARENA ALLOCATION
+ *********************************/
+
+// Get a copy of the allocation counters
+alloc_stats allocstats(void) {
+    return allocCounts;
+}
+
+// Reset the allocation counters
+void allocstats_reset(void) {
+    memset(&allocCounts, 0, sizeof(alloc_stats));
+}
+
+// Allocate an arena, with its memory following the arena struct
+arena *arenamalloc(size_t size) {
+    arena *newArena = (arena *) counted_malloc(arena_round(sizeof(struct arena)) + size);
+
+    // Check for malloc() failure, return NULL if failed
+    if (newArena == NULL) {
+        printf("ERROR: malloc() failed, returning NULL\n");
+        return NULL;
+    }
+
+    newArena->size = size;
+    newArena->used = 0;
+    allocCounts.arenas++;
+    return newArena;
+}
+
+// Hand out the next aligned block of an arena
+void *arenaalloc(arena *arena, size_t size) {
+    void *block;
+
+    size = arena_round(size);
+    if (size > arena->size - arena->used) {
+        return NULL;
+    }
+
+    block = (char *) arena + arena_round(sizeof(struct arena)) + arena->used;
+    arena->used += size;
+    allocCounts.arena_allocs++;
+    return block;
+}
+
+// Free an arena
+void arenafree(arena *arena) {
+    counted_free(arena);
+}
+
+// Get number of bytes of arena needed for a molecule
+size_t molarenasize(unsigned short atom_max, unsigned short bond_max) {
+    return arena_round(sizeof(struct molecule))
+            + arena_round(atom_max * sizeof(struct atom)) + arena_round(atom_max * sizeof(struct atom *))
+            + arena_round(bond_max * sizeof(struct bond)) + arena_round(bond_max * sizeof(struct bond *));
+}
+
+// Allocate a new molecule in an arena
+molecule *molmalloc_arena(arena *arena, unsigned short atom_max, unsigned short bond_max) {
+    molecule *newMol;
+
+    // Check that the whole molecule fits, return NULL if not
+    if (molarenasize(atom_max, bond_max) > arena->size - arena->used) {
+        printf("ERROR: arena is full, returning NULL\n");
+        return NULL;
+    }
+
+    newMol = (molecule *) arenaalloc(arena, sizeof(struct molecule));
+    newMol->arena = arena;
+
+    // Atoms allocation
+    newMol->atom_max = atom_max;
+    newMol->atom_no = 0;
+    if (atom_max == 0) {
+        newMol->atoms = NULL;
+        newMol->atom_ptrs = NULL;
+    } else {
+        newMol->atoms = (atom *) arenaalloc(arena, atom_max * sizeof(struct atom));
+        newMol->atom_ptrs = (atom **) arenaalloc(arena, atom_max * sizeof(struct atom *));
+    }
+
+    // Bonds allocation
+    newMol->bond_max = bond_max;
+    newMol->bond_no = 0;
+    if (bond_max == 0) {
+        newMol->bonds = NULL;
+        newMol->bond_ptrs = NULL;
+    } else {
+        newMol->bonds = (bond *) arenaalloc(arena, bond_max * sizeof(struct bond));
+        newMol->bond_ptrs = (bond **) arenaalloc(arena, bond_max * sizeof(struct bond *));
+    }
+
+    return newMol;
+}
+
+// Create copy of molecule in an arena
+molecule *molcopy_arena(arena *arena, molecule *src) {
+    molecule *copyMol = molmalloc_arena(arena, src->atom_no, src->bond_no);
+
+    // Check for a full arena, returns NULL if full
+    if (copyMol == NULL) {
+        return NULL;
+    }
+
+    // Copy atoms
+    for (int i = 0; i < src->atom_no; i++) {
+        copyMol->atoms[i] = src->atoms[i];
+        copyMol->atom_ptrs[i] = &(copyMol->atoms[i]);
+    }
+    copyMol->atom_no = src->atom_no;
+
+    // Copy bonds, pointing them at the copied atoms
+    for (int i = 0; i < src->bond_no; i++) {
+        copyMol->bonds[i] = src->bonds[i];
+        copyMol->bonds[i].atoms = copyMol->atoms;
+        copyMol->bond_ptrs[i] = &(copyMol->bonds[i]);
+    }
+    copyMol->bond_no = src->bond_no;
+
+    return copyMol;
+}
+
 /*********************************
  *        NIGHTMARE MODE
  *********************************/
 
-// Create rotations struct, calculate each rotation and return struct
+// Create rotations struct and its molecules in one arena, calculate each rotation and return struct
 rotations *spin(molecule *mol) {
-    rotations *molSpin = malloc(sizeof(rotations));
+    arena *spinArena = arenamalloc(arena_round(sizeof(rotations)) + 216 * molarenasize(mol->atom_no, mol->bond_no));
+    rotations *molSpin;
     xform_matrix xRot, yRot, zRot;  // Matrices of rotation transformations about the axes
 
+    // Check for malloc() failure, return NULL if failed
+    if (spinArena == NULL) {
+        return NULL;
+    }
+    molSpin = (rotations *) arenaalloc(spinArena, sizeof(rotations));
+    molSpin->arena = spinArena;
+
     for (int i = 0; i < 72; i++) {
         // Copy source molecule
-        molSpin->x[i] = molcopy(mol);
-        molSpin->y[i] = molcopy(mol);
-        molSpin->z[i] = molcopy(mol);
+        molSpin->x[i] = molcopy_arena(spinArena, mol);
+        molSpin->y[i] = molcopy_arena(spinArena, mol);
+        molSpin->z[i] = molcopy_arena(spinArena, mol);
 
         // Calculate rotations matrix
         xrotation(xRot, i * 5);
@@ -333,12 +626,167 @@ rotations *spin(molecule *mol) {
     return molSpin;
 }
 
-// Free a rotations struct
+// Free a rotations struct, which lives in the arena holding its molecules
 void rotationsfree(rotations *rotations) {
-    for (int i = 0; i < 72; i++) {
-        molfree(rotations->x[i]);
-        molfree(rotations->y[i]);
-        molfree(rotations->z[i]);
+    arenafree(rotations->arena);
+}
+
+/*********************************
+ *       RASTER THUMBNAILS
+ *********************************/
+
+// Allocate memory for a new transparent raster
+raster *rastermalloc(unsigned short width, unsigned short height) {
+    raster *newRaster = (raster *) malloc(sizeof(struct raster));
+
+    // Check for malloc() failure, return NULL if failed
+    if (newRaster == NULL) {
+        printf("ERROR: malloc() failed, returning NULL\n");
+        return NULL;
+    }
+
+    newRaster->width = width;
+    newRaster->height = height;
+    newRaster->pixels = (unsigned char *) calloc((size_t) width * height * 4, sizeof(unsigned char));
+    newRaster->depth = (double *) malloc((size_t) width * height * sizeof(double));
+    if (newRaster->pixels == NULL || newRaster->depth == NULL) {
+        printf("ERROR: malloc() failed, returning NULL\n");
+        rasterfree(newRaster);
+        return NULL;
+    }
+
+    for (size_t i = 0; i < (size_t) width * height; i++) {
+        newRaster->depth[i] = -HUGE_VAL;
+    }
+
+    return newRaster;
+}
+
+// Free raster
+void rasterfree(raster *raster) {
+    if (raster == NULL) {
+        return;
+    }
+    free(raster->pixels);
+    free(raster->depth);
+    free(raster);
+}
+
+// Write a pixel if it is closer to the viewer than what was drawn there before
+static void raster_plot(raster *raster, int x, int y, double z, double red, double green, double blue) {
+    size_t i = (size_t) y * raster->width + x;
+
+    if (z <= raster->depth[i]) {
+        return;
+    }
+    raster->depth[i] = z;
+    raster->pixels[i * 4] = (unsigned char) (red + 0.5);
+    raster->pixels[i * 4 + 1] = (unsigned char) (green + 0.5);
+    raster->pixels[i * 4 + 2] = (unsigned char) (blue + 0.5);
+    raster->pixels[i * 4 + 3] = 255;
+}
+
+// Linearly interpolate one 8-bit channel of two 0xRRGGBB colours
+static double channel_mix(unsigned int colourA, unsigned int colourB, int shift, double t) {
+    double a = (colourA >> shift) & 0xFF;
+    double b = (colourB >> shift) & 0xFF;
+    return a + (b - a) * t;
+}
+
+// Draw an atom as a shaded sphere
+void raster_atom(raster *raster, atom *atom, double scale, double offsetx, double offsety, double radius,
+                 unsigned int colour1, unsigned int colour2, unsigned int colour3) {
+    // Raster that failed to allocate, nothing to draw into
+    if (raster == NULL || raster->pixels == NULL || raster->depth == NULL) {
+        return;
+    }
+
+    double cx = atom->x * scale + offsetx;
+    double cy = atom->y * scale + offsety;
+    double cz = atom->z * scale;
+    // Highlight of the sphere, where colour1 is drawn
+    double hx = cx - radius * 0.35;
+    double hy = cy - radius * 0.35;
+
+    // Bounding box of the sphere, clipped to the raster
+    int xMin = (int) floor(cx - radius) < 0 ? 0 : (int) floor(cx - radius);
+    int yMin = (int) floor(cy - radius) < 0 ? 0 : (int) floor(cy - radius);
+    int xMax = (int) ceil(cx + radius) >= raster->width ? raster->width - 1 : (int) ceil(cx + radius);
+    int yMax = (int) ceil(cy + radius) >= raster->height ? raster->height - 1 : (int) ceil(cy + radius);
+
+    for (int y = yMin; y <= yMax; y++) {
+        for (int x = xMin; x <= xMax; x++) {
+            double px = x + 0.5 - cx;
+            double py = y + 0.5 - cy;
+            double d2 = px * px + py * py;
+            if (d2 > radius * radius) {
+                continue;
+            }
+
+            // Distance from the highlight relative to the farthest point of the sphere from it
+            double t = sqrt(pow(x + 0.5 - hx, 2) + pow(y + 0.5 - hy, 2)) / (radius * 1.35);
+            unsigned int from = t < 0.5 ? colour1 : colour2;
+            unsigned int to = t < 0.5 ? colour2 : colour3;
+            t = t < 0.5 ? t * 2.0 : (t - 0.5) * 2.0;
+            if (t > 1.0) {
+                t = 1.0;
+            }
+
+            raster_plot(raster, x, y, cz + sqrt(radius * radius - d2),
+                        channel_mix(from, to, 16, t), channel_mix(from, to, 8, t), channel_mix(from, to, 0, t));
+        }
+    }
+}
+
+// Draw a bond as a shaded quad
+void raster_bond(raster *raster, bond *bond, double scale, double offsetx, double offsety, double halfwidth,
+                 unsigned int colour) {
+    // Raster that failed to allocate, nothing to draw into
+    if (raster == NULL || raster->pixels == NULL || raster->depth == NULL) {
+        return;
+    }
+
+    double x1 = bond->x1 * scale + offsetx;
+    double y1 = bond->y1 * scale + offsety;
+    double x2 = bond->x2 * scale + offsetx;
+    double y2 = bond->y2 * scale + offsety;
+    double z1 = bond->atoms[bond->a1].z * scale;
+    double z2 = bond->atoms[bond->a2].z * scale;
+    double len = bond->len * scale;
+
+    // Bond seen end-on, nothing to draw
+    if (len < 0.000001) {
+        return;
+    }
+
+    // Bounding box of the quad, clipped to the raster
+    double left = fmin(x1, x2) - halfwidth, right = fmax(x1, x2) + halfwidth;
+    double top = fmin(y1, y2) - halfwidth, bottom = fmax(y1, y2) + halfwidth;
+    int xMin = left < 0 ? 0 : (int) floor(left);
+    int yMin = top < 0 ? 0 : (int) floor(top);
+    int xMax = right >= raster->width ? raster->width - 1 : (int) ceil(right);
+    int yMax = bottom >= raster->height ? raster->height - 1 : (int) ceil(bottom);
+
+    for (int y = yMin; y <= yMax; y++) {
+        for (int x = xMin; x <= xMax; x++) {
+            double px = x + 0.5 - x1;
+            double py = y + 0.5 - y1;
+            // Position along the bond (0 to 1) and across it (-1 to 1)
+            double along = (px * bond->dx + py * bond->dy) / len;
+            double across = (py * bond->dx - px * bond->dy) / halfwidth;
+            if (along < 0.0 || along > 1.0 || across < -1.0 || across > 1.0) {
+                continue;
+            }
+
+            // Shade the quad like a cylinder, lit from the top-left
+            double bulge = sqrt(1.0 - across * across);
+            double light = 0.55 + 0.45 * bulge - 0.15 * across;
+            if (light > 1.0) {
+                light = 1.0;
+            }
+
+            raster_plot(raster, x, y, z1 + (z2 - z1) * along + halfwidth * bulge,
+                        ((colour >> 16) & 0xFF) * light, ((colour >> 8) & 0xFF) * light, (colour & 0xFF) * light);
+        }
     }
-    free(rotations);
 }
@@ -60,6 +60,20 @@ typedef struct bond {
     double dx, dy; 
 } bond;
 
+/**
+ * Represents a block of memory that molecules and other structures are carved out of in order, and that is freed 
+ * as a whole. The memory follows the arena structure in the same allocation
+ * Items:
+ *  - size_t size, used
+ */
+typedef struct arena {
+
+    // Number of bytes of memory in the arena
+    size_t size;
+    // Number of bytes handed out by arenaalloc()
+    size_t used;
+} arena;
+
 /**
  * Represents a molecule which consists of zero or more atoms, and zero or more bonds
  * Items:
@@ -67,6 +81,7 @@ typedef struct bond {
  *  - atom *atoms, **atom_ptrs
  *  - unsigned short bond_max, bond_no
  *  - bond *bonds, **bond_ptrs
+ *  - arena *arena
  */
 typedef struct molecule {
 
@@ -89,8 +104,28 @@ typedef struct molecule {
     bond *bonds;
     // Array of pointers to the bonds in the molecule
     bond **bond_ptrs;
+
+    // Arena holding the molecule and its arrays, or NULL if they were allocated by molmalloc() and molappend_*().
+    // Molecules in an arena cannot grow past atom_max and bond_max, and are freed with the arena
+    arena *arena;
 } molecule;
 
+/**
+ * Fixed-layout record of a bond as stored on disk by MolStore.py. a1, a2 and epairs are laid out as 
+ * at the start of the bond structure; the remaining bond members are derived by compute_coords()
+ * Items:
+ *  - unsigned short a1, a2
+ *  - unsigned char epairs
+ */
+typedef struct bond_record {
+
+    // Index of the atom in the co-valent bonds
+    unsigned short a1, a2;
+
+    // Number of electron pairs in the bond
+    unsigned char epairs;
+} bond_record;
+
 // 3-d transformation matrix for molecule rotations
 typedef double xform_matrix[3][3];
 
@@ -155,6 +190,17 @@ void compute_coords( bond *bond );
  */
 molecule *molmalloc( unsigned short atom_max, unsigned short bond_max );
 
+/**
+ * @brief Grows the arrays of a molecule so they hold at least atom_max atoms and bond_max bonds, with one 
+ * realloc() per array instead of the repeated doubling of appending one at a time. 
+ * Returns without growing the arrays if realloc() fails or the molecule is in an arena
+ * 
+ * @param molecule Source molecule
+ * @param atom_max Minimum size of the atoms and atom_ptrs arrays
+ * @param bond_max Minimum size of the bonds and bond_ptrs arrays
+ */
+void molreserve( molecule *molecule, unsigned short atom_max, unsigned short bond_max );
+
 /**
  * @brief Creates a copy of the molecule data and returns a pointer to the new copy molecule. 
  * Returns NULL is malloc fails
@@ -165,15 +211,24 @@ molecule *molmalloc( unsigned short atom_max, unsigned short bond_max );
 molecule *molcopy( molecule *src );
 
 /**
- * @brief Frees the memory allocated to a molecule
+ * @brief Frees the memory allocated to a molecule. Does nothing for a molecule in an arena, which is freed 
+ * with its arena
  * 
  * @param ptr Molecule to be freed
  */
 void molfree( molecule *ptr );
 
+/**
+ * @brief Returns the number of bytes allocated to a molecule, based on its atom_max and bond_max
+ * 
+ * @param mol Source molecule
+ * @return size_t 
+ */
+size_t molsize( molecule *mol );
+
 /**
  * @brief Appends an atom to the atoms and atom_ptrs array in a molecule. 
- * Returns before appending atoms if realloc() fails
+ * Returns before appending atoms if realloc() fails, or if the arrays are full and the molecule is in an arena
  * 
  * @param molecule Source molecule
  * @param atom Atom to be appended
@@ -182,13 +237,42 @@ void molappend_atom( molecule *molecule, atom *atom );
 
 /**
  * @brief Appends a bond to the bonds and bond_ptrs array in a molecule. 
- * Returns before appending bonds if realloc() fails
+ * Returns before appending bonds if realloc() fails, or if the arrays are full and the molecule is in an arena
  * 
  * @param molecule Source molecule
  * @param bond Bond to be appended
  */
 void molappend_bond( molecule *molecule, bond *bond );
 
+/**
+ * @brief Appends <count> atoms from a contiguous array of atom records to a molecule
+ * 
+ * @param molecule Source molecule
+ * @param atoms Array of atoms to be appended
+ * @param count Number of atoms in the array
+ */
+void molappend_atoms( molecule *molecule, const atom *atoms, size_t count );
+
+/**
+ * @brief Appends <count> bonds from a contiguous array of bond records to a molecule.
+ * The atoms of the bonds must already be appended to the molecule
+ * 
+ * @param molecule Source molecule
+ * @param records Array of bond records to be appended
+ * @param count Number of bond records in the array
+ */
+void molappend_bond_records( molecule *molecule, const bond_record *records, size_t count );
+
+/**
+ * @brief Sets the coordinates of the atoms of a molecule (in the order of the atoms array) from an array of 
+ * <count> x, y, z triples, then recomputes the coordinates of its bonds
+ * 
+ * @param molecule Source molecule
+ * @param coords Array of x, y, z coordinates
+ * @param count Number of x, y, z triples in the array
+ */
+void molset_coords( molecule *molecule, const double *coords, size_t count );
+
 /**
  * @brief Compar() function for atoms to be used in qsort() for molsort() function
  * 
@@ -254,6 +338,101 @@ typedef struct mx_wrapper {
     xform_matrix xform_matrix;
 } mx_wrapper;
 
+/*********************************
+ *        ARENA ALLOCATION
+ *********************************/
+
+/**
+ * Counters of the allocations made for molecules, rotations and arenas, since the library was loaded or the 
+ * counters were last reset with allocstats_reset()
+ * Items:
+ *  - unsigned long mallocs, reallocs, frees
+ *  - unsigned long long bytes
+ *  - unsigned long arenas, arena_allocs
+ */
+typedef struct alloc_stats {
+
+    // Number of calls to malloc(), realloc() and free() (not counting free(NULL))
+    unsigned long mallocs, reallocs, frees;
+    // Number of bytes requested from malloc() and realloc()
+    unsigned long long bytes;
+
+    // Number of arenas created by arenamalloc()
+    unsigned long arenas;
+    // Number of blocks handed out by arenaalloc()
+    unsigned long arena_allocs;
+} alloc_stats;
+
+/**
+ * @brief Returns a copy of the allocation counters
+ * 
+ * @return alloc_stats 
+ */
+alloc_stats allocstats( void );
+
+/**
+ * @brief Sets the allocation counters to zero
+ */
+void allocstats_reset( void );
+
+/**
+ * @brief Allocates an arena with size bytes of memory in a single malloc(). 
+ * Returns NULL if malloc() fails
+ * 
+ * @param size Number of bytes of memory in the arena
+ * @return arena* 
+ */
+arena *arenamalloc( size_t size );
+
+/**
+ * @brief Hands out the next size bytes of an arena, aligned for any of the structures in this file. 
+ * Returns NULL if the arena does not have size bytes left
+ * 
+ * @param arena Source arena
+ * @param size Number of bytes needed
+ * @return void* 
+ */
+void *arenaalloc( arena *arena, size_t size );
+
+/**
+ * @brief Frees an arena and everything allocated in it
+ * 
+ * @param arena Arena to be freed
+ */
+void arenafree( arena *arena );
+
+/**
+ * @brief Returns the number of bytes of arena needed by molmalloc_arena() for a molecule with the specified 
+ * atom_max and bond_max values
+ * 
+ * @param atom_max Max size of the atoms and atom_ptrs arrays
+ * @param bond_max Max size of the bonds and bond_ptrs arrays
+ * @return size_t 
+ */
+size_t molarenasize( unsigned short atom_max, unsigned short bond_max );
+
+/**
+ * @brief Allocates a molecule and its arrays in an arena using the specified atom_max and bond_max values. 
+ * Returns NULL if the arena is full
+ * 
+ * @param arena Arena to allocate the molecule in
+ * @param atom_max Max size of the atoms and atom_ptrs arrays
+ * @param bond_max Max size of the bonds and bond_ptrs arrays
+ * @return molecule* 
+ */
+molecule *molmalloc_arena( arena *arena, unsigned short atom_max, unsigned short bond_max );
+
+/**
+ * @brief Creates a copy of the molecule data in an arena, with arrays just large enough for its atoms and bonds. 
+ * The atoms and bonds are copied in the order of the atoms and bonds arrays, with the pointer arrays in the 
+ * same order. Returns NULL if the arena is full
+ * 
+ * @param arena Arena to allocate the copy in
+ * @param src Source molecule
+ * @return molecule* New copied molecule
+ */
+molecule *molcopy_arena( arena *arena, molecule *src );
+
 /*********************************
  *        NIGHTMARE MODE
  *********************************/
@@ -264,17 +443,19 @@ typedef struct mx_wrapper {
  *  - molecule *x[72]: Each 5 degree rotation of a molecule about the x-axis
  *  - molecule *y[72]: Each 5 degree rotation of a molecule about the y-axis
  *  - molecule *z[72]: Each 5 degree rotation of a molecule about the z-axis
+ *  - arena *arena: Arena holding the structure and all of its molecules
  */
 typedef struct rotations {
     molecule *x[72]; 
     molecule *y[72]; 
     molecule *z[72]; 
+    arena *arena;
 } rotations;
 
 /**
- * @brief Allocate memory for a rotations structure, create molecules using molcopy 
- * applied to the provided mol, and add their pointers to the x, y, and z members of the rotations 
- * structure.
+ * @brief Allocate an arena for a rotations structure and 216 molecules, create molecules in it using 
+ * molcopy_arena applied to the provided mol, and add their pointers to the x, y, and z members of the rotations 
+ * structure. Returns NULL if malloc() fails
  * 
  * @param mol Source molecule
  * @return rotations* 
@@ -282,10 +463,83 @@ typedef struct rotations {
 rotations *spin( molecule *mol );
 
 /**
- * @brief Frees memory allocated to a rotations struct
+ * @brief Frees memory allocated to a rotations struct and its molecules with a single free()
  * 
  * @param rotations Rotations struct to be freed
  */
 void rotationsfree( rotations *rotations );
 
+/*********************************
+ *       RASTER THUMBNAILS
+ *********************************/
+
+/**
+ * Represents an RGBA image with a depth buffer that atoms and bonds are rasterized into
+ * Items:
+ *  - unsigned short width, height
+ *  - unsigned char *pixels
+ *  - double *depth
+ */
+typedef struct raster {
+
+    // Dimensions of the image in pixels
+    unsigned short width, height;
+
+    // RGBA values of the pixels, row by row from the top-left corner. Pixels that are not drawn stay transparent
+    unsigned char *pixels;
+
+    // z-value of the closest primitive drawn at each pixel
+    double *depth;
+} raster;
+
+/**
+ * @brief Allocates memory for a transparent raster of the specified dimensions.
+ * Returns NULL if malloc() fails
+ * 
+ * @param width Width of the raster in pixels
+ * @param height Height of the raster in pixels
+ * @return raster* 
+ */
+raster *rastermalloc( unsigned short width, unsigned short height );
+
+/**
+ * @brief Frees memory allocated to a raster. Does nothing if raster is NULL
+ * 
+ * @param raster Raster to be freed
+ */
+void rasterfree( raster *raster );
+
+/**
+ * @brief Draws an atom as a shaded sphere into the raster, keeping the pixels that are closest to the viewer 
+ * (highest z-value). The shading imitates the radial gradients of the svg: colour1 at the highlight, 
+ * colour2 halfway and colour3 at the far edge. Does nothing if raster is NULL
+ * 
+ * @param raster Destination raster
+ * @param atom Atom to draw
+ * @param scale Pixels per Angstrom
+ * @param offsetx x-coordinate in pixels of the origin
+ * @param offsety y-coordinate in pixels of the origin
+ * @param radius Radius of the sphere in pixels
+ * @param colour1 Highlight colour (0xRRGGBB)
+ * @param colour2 Middle colour (0xRRGGBB)
+ * @param colour3 Edge colour (0xRRGGBB)
+ */
+void raster_atom( raster *raster, atom *atom, double scale, double offsetx, double offsety, double radius, 
+                  unsigned int colour1, unsigned int colour2, unsigned int colour3 );
+
+/**
+ * @brief Draws a bond as a shaded quad into the raster, using the coordinates computed by compute_coords(). 
+ * The depth of the quad is interpolated between the z-values of its two atoms. Does nothing if raster is NULL
+ * 
+ * @param raster Destination raster
+ * @param bond Bond to draw
+ * @param scale Pixels per Angstrom
+ * @param offsetx x-coordinate in pixels of the origin
+ * @param offsety y-coordinate in pixels of the origin
+ * @param halfwidth Half of the width of the bond in pixels
+ * @param colour Colour of the bond (0xRRGGBB)
+ */
+void raster_bond( raster *raster, bond *bond, double scale, double offsetx, double offsety, double halfwidth, 
+                  unsigned int colour );
+
 #endif
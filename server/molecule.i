@@ -4,6 +4,9 @@
   #include "mol.h"
 %}
 
+%include <pybuffer.i>
+%pybuffer_binary(const char *records, size_t size);
+
 %include "mol.h"
 
 %extend atom {
@@ -93,6 +96,60 @@
     molappend_bond( $self, &b1 );
   }
 
+  void reserve( unsigned short atom_max, unsigned short bond_max )
+  {
+    molreserve( $self, atom_max, bond_max );
+  }
+
+  void append_atom_records( const char *records, size_t size )
+  {
+    molappend_atoms( $self, (const atom *)records, size / sizeof(atom) );
+  }
+
+  void append_bond_records( const char *records, size_t size )
+  {
+    molappend_bond_records( $self, (const bond_record *)records, size / sizeof(bond_record) );
+  }
+
+  void set_coord_records( const char *records, size_t size )
+  {
+    molset_coords( $self, (const double *)records, size / (3 * sizeof(double)) );
+  }
+
+  PyObject *coord_records()
+  {
+    // x, y, z of each atom in the order of the atoms array, the layout read by set_coord_records()
+    PyObject *records = PyBytes_FromStringAndSize( NULL, (Py_ssize_t)$self->atom_no * 3 * sizeof(double) );
+    double *coords;
+    if (records == NULL)
+    {
+      return NULL;
+    }
+    coords = (double *)PyBytes_AS_STRING( records );
+    for (int i = 0; i < $self->atom_no; i++)
+    {
+      coords[i * 3] = $self->atoms[i].x;
+      coords[i * 3 + 1] = $self->atoms[i].y;
+      coords[i * 3 + 2] = $self->atoms[i].z;
+    }
+    return records;
+  }
+
+  void copy_from( molecule *src )
+  {
+    // Swap the contents of a copy of src into this molecule, then free the copy with the old contents
+    molecule *copy = molcopy( src );
+    molecule old;
+    if (copy == NULL)
+    {
+      return;
+    }
+    old = *$self;
+    *$self = *copy;
+    *copy = old;
+    molfree( copy );
+  }
+
   atom *get_atom( unsigned short i )
   {
     return $self->atom_ptrs[i];
@@ -114,4 +171,29 @@
   }
 };
 
+// Raise MemoryError instead of handing out a raster without pixels when rastermalloc() fails
+%exception raster::raster {
+  $action
+  if (result == NULL)
+  {
+    PyErr_NoMemory();
+    SWIG_fail;
+  }
+}
+
+%extend raster {
+  raster( unsigned short width, unsigned short height )
+  {
+    return rastermalloc( width, height );
+  }
 
+  ~raster()
+  {
+    rasterfree( $self );
+  }
+
+  PyObject *rgba()
+  {
+    return PyBytes_FromStringAndSize( (const char *)$self->pixels, (Py_ssize_t)$self->width * $self->height * 4 );
+  }
+};
@@ -95,6 +95,18 @@ class bond(object):
 
 # Register bond in _molecule:
 _molecule.bond_swigregister(bond)
+class arena(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    size = property(_molecule.arena_size_get, _molecule.arena_size_set)
+    used = property(_molecule.arena_used_get, _molecule.arena_used_set)
+
+    def __init__(self):
+        _molecule.arena_swiginit(self, _molecule.new_arena())
+    __swig_destroy__ = _molecule.delete_arena
+
+# Register arena in _molecule:
+_molecule.arena_swigregister(arena)
 class molecule(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
@@ -106,6 +118,7 @@ class molecule(object):
     bond_no = property(_molecule.molecule_bond_no_get, _molecule.molecule_bond_no_set)
     bonds = property(_molecule.molecule_bonds_get, _molecule.molecule_bonds_set)
     bond_ptrs = property(_molecule.molecule_bond_ptrs_get, _molecule.molecule_bond_ptrs_set)
+    arena = property(_molecule.molecule_arena_get, _molecule.molecule_arena_set)
 
     def __init__(self):
         _molecule.molecule_swiginit(self, _molecule.new_molecule())
@@ -117,6 +130,24 @@ class molecule(object):
     def append_bond(self, a1, a2, epairs):
         return _molecule.molecule_append_bond(self, a1, a2, epairs)
 
+    def reserve(self, atom_max, bond_max):
+        return _molecule.molecule_reserve(self, atom_max, bond_max)
+
+    def append_atom_records(self, records):
+        return _molecule.molecule_append_atom_records(self, records)
+
+    def append_bond_records(self, records):
+        return _molecule.molecule_append_bond_records(self, records)
+
+    def set_coord_records(self, records):
+        return _molecule.molecule_set_coord_records(self, records)
+
+    def coord_records(self):
+        return _molecule.molecule_coord_records(self)
+
+    def copy_from(self, src):
+        return _molecule.molecule_copy_from(self, src)
+
     def get_atom(self, i):
         return _molecule.molecule_get_atom(self, i)
 
@@ -131,6 +162,19 @@ class molecule(object):
 
 # Register molecule in _molecule:
 _molecule.molecule_swigregister(molecule)
+class bond_record(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    a1 = property(_molecule.bond_record_a1_get, _molecule.bond_record_a1_set)
+    a2 = property(_molecule.bond_record_a2_get, _molecule.bond_record_a2_set)
+    epairs = property(_molecule.bond_record_epairs_get, _molecule.bond_record_epairs_set)
+
+    def __init__(self):
+        _molecule.bond_record_swiginit(self, _molecule.new_bond_record())
+    __swig_destroy__ = _molecule.delete_bond_record
+
+# Register bond_record in _molecule:
+_molecule.bond_record_swigregister(bond_record)
 
 def atomset(atom, element, x, y, z):
     return _molecule.atomset(atom, element, x, y, z)
@@ -150,18 +194,33 @@ def compute_coords(bond):
 def molmalloc(atom_max, bond_max):
     return _molecule.molmalloc(atom_max, bond_max)
 
+def molreserve(molecule, atom_max, bond_max):
+    return _molecule.molreserve(molecule, atom_max, bond_max)
+
 def molcopy(src):
     return _molecule.molcopy(src)
 
 def molfree(ptr):
     return _molecule.molfree(ptr)
 
+def molsize(mol):
+    return _molecule.molsize(mol)
+
 def molappend_atom(molecule, atom):
     return _molecule.molappend_atom(molecule, atom)
 
 def molappend_bond(molecule, bond):
     return _molecule.molappend_bond(molecule, bond)
 
+def molappend_atoms(molecule, atoms, count):
+    return _molecule.molappend_atoms(molecule, atoms, count)
+
+def molappend_bond_records(molecule, records, count):
+    return _molecule.molappend_bond_records(molecule, records, count)
+
+def molset_coords(molecule, coords, count):
+    return _molecule.molset_coords(molecule, coords, count)
+
 def compare_atom(a1, a2):
     return _molecule.compare_atom(a1, a2)
 
@@ -193,12 +252,53 @@ class mx_wrapper(object):
 
 # Register mx_wrapper in _molecule:
 _molecule.mx_wrapper_swigregister(mx_wrapper)
+class alloc_stats(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    mallocs = property(_molecule.alloc_stats_mallocs_get, _molecule.alloc_stats_mallocs_set)
+    reallocs = property(_molecule.alloc_stats_reallocs_get, _molecule.alloc_stats_reallocs_set)
+    frees = property(_molecule.alloc_stats_frees_get, _molecule.alloc_stats_frees_set)
+    bytes = property(_molecule.alloc_stats_bytes_get, _molecule.alloc_stats_bytes_set)
+    arenas = property(_molecule.alloc_stats_arenas_get, _molecule.alloc_stats_arenas_set)
+    arena_allocs = property(_molecule.alloc_stats_arena_allocs_get, _molecule.alloc_stats_arena_allocs_set)
+
+    def __init__(self):
+        _molecule.alloc_stats_swiginit(self, _molecule.new_alloc_stats())
+    __swig_destroy__ = _molecule.delete_alloc_stats
+
+# Register alloc_stats in _molecule:
+_molecule.alloc_stats_swigregister(alloc_stats)
+
+def allocstats():
+    return _molecule.allocstats()
+
+def allocstats_reset():
+    return _molecule.allocstats_reset()
+
+def arenamalloc(size):
+    return _molecule.arenamalloc(size)
+
+def arenaalloc(arena, size):
+    return _molecule.arenaalloc(arena, size)
+
+def arenafree(arena):
+    return _molecule.arenafree(arena)
+
+def molarenasize(atom_max, bond_max):
+    return _molecule.molarenasize(atom_max, bond_max)
+
+def molmalloc_arena(arena, atom_max, bond_max):
+    return _molecule.molmalloc_arena(arena, atom_max, bond_max)
+
+def molcopy_arena(arena, src):
+    return _molecule.molcopy_arena(arena, src)
 class rotations(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
     x = property(_molecule.rotations_x_get, _molecule.rotations_x_set)
     y = property(_molecule.rotations_y_get, _molecule.rotations_y_set)
     z = property(_molecule.rotations_z_get, _molecule.rotations_z_set)
+    arena = property(_molecule.rotations_arena_get, _molecule.rotations_arena_set)
 
     def __init__(self):
         _molecule.rotations_swiginit(self, _molecule.new_rotations())
@@ -212,4 +312,33 @@ def spin(mol):
 
 def rotationsfree(rotations):
     return _molecule.rotationsfree(rotations)
+class raster(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    width = property(_molecule.raster_width_get, _molecule.raster_width_set)
+    height = property(_molecule.raster_height_get, _molecule.raster_height_set)
+    pixels = property(_molecule.raster_pixels_get, _molecule.raster_pixels_set)
+    depth = property(_molecule.raster_depth_get, _molecule.raster_depth_set)
+
+    def __init__(self, width, height):
+        _molecule.raster_swiginit(self, _molecule.new_raster(width, height))
+    __swig_destroy__ = _molecule.delete_raster
+
+    def rgba(self):
+        return _molecule.raster_rgba(self)
+
+# Register raster in _molecule:
+_molecule.raster_swigregister(raster)
+
+def rastermalloc(width, height):
+    return _molecule.rastermalloc(width, height)
+
+def rasterfree(raster):
+    return _molecule.rasterfree(raster)
+
+def raster_atom(raster, atom, scale, offsetx, offsety, radius, colour1, colour2, colour3):
+    return _molecule.raster_atom(raster, atom, scale, offsetx, offsety, radius, colour1, colour2, colour3)
+
+def raster_bond(raster, bond, scale, offsetx, offsety, halfwidth, colour):
+    return _molecule.raster_bond(raster, bond, scale, offsetx, offsety, halfwidth, colour)
 
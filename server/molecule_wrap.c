@@ -2980,20 +2980,25 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 
 #define SWIGTYPE_p_a_3__a_3__double swig_types[0]
 #define SWIGTYPE_p_a_3__double swig_types[1]
-#define SWIGTYPE_p_atom swig_types[2]
-#define SWIGTYPE_p_bond swig_types[3]
-#define SWIGTYPE_p_char swig_types[4]
-#define SWIGTYPE_p_double swig_types[5]
-#define SWIGTYPE_p_molecule swig_types[6]
-#define SWIGTYPE_p_mx_wrapper swig_types[7]
-#define SWIGTYPE_p_p_atom swig_types[8]
-#define SWIGTYPE_p_p_bond swig_types[9]
-#define SWIGTYPE_p_p_molecule swig_types[10]
-#define SWIGTYPE_p_rotations swig_types[11]
-#define SWIGTYPE_p_unsigned_char swig_types[12]
-#define SWIGTYPE_p_unsigned_short swig_types[13]
-static swig_type_info *swig_types[15];
-static swig_module_info swig_module = {swig_types, 14, 0, 0, 0, 0};
+#define SWIGTYPE_p_alloc_stats swig_types[2]
+#define SWIGTYPE_p_arena swig_types[3]
+#define SWIGTYPE_p_atom swig_types[4]
+#define SWIGTYPE_p_bond swig_types[5]
+#define SWIGTYPE_p_bond_record swig_types[6]
+#define SWIGTYPE_p_char swig_types[7]
+#define SWIGTYPE_p_double swig_types[8]
+#define SWIGTYPE_p_molecule swig_types[9]
+#define SWIGTYPE_p_mx_wrapper swig_types[10]
+#define SWIGTYPE_p_p_atom swig_types[11]
+#define SWIGTYPE_p_p_bond swig_types[12]
+#define SWIGTYPE_p_p_molecule swig_types[13]
+#define SWIGTYPE_p_raster swig_types[14]
+#define SWIGTYPE_p_rotations swig_types[15]
+#define SWIGTYPE_p_unsigned_char swig_types[16]
+#define SWIGTYPE_p_unsigned_short swig_types[17]
+#define SWIGTYPE_p_void swig_types[18]
+static swig_type_info *swig_types[20];
+static swig_module_info swig_module = {swig_types, 19, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -3416,6 +3421,99 @@ SWIG_From_unsigned_SS_char  (unsigned char value)
 SWIGINTERN struct bond *new_bond(bond *bond){
     return bond;
   }
+
+#if defined(LLONG_MAX) && !defined(SWIG_LONG_LONG_AVAILABLE)
+#  define SWIG_LONG_LONG_AVAILABLE
+#endif
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_long_SS_long (PyObject *obj, unsigned long long *val)
+{
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    unsigned long long v = PyLong_AsUnsignedLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, 0, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, mant_max)) {
+      if (val) *val = (unsigned long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
+SWIGINTERNINLINE int
+SWIG_AsVal_size_t (PyObject * obj, size_t *val)
+{
+  int res = SWIG_TypeError;
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else if (sizeof(size_t) <= sizeof(unsigned long long)) {
+    unsigned long long v;
+    res = SWIG_AsVal_unsigned_SS_long_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+  }
+#endif
+  return res;
+}
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERNINLINE PyObject* 
+SWIG_From_unsigned_SS_long_SS_long  (unsigned long long value)
+{
+  return (value > LONG_MAX) ?
+    PyLong_FromUnsignedLongLong(value) : PyInt_FromLong((long)(value));
+}
+#endif
+
+
+SWIGINTERNINLINE PyObject *
+SWIG_From_size_t  (size_t value)
+{    
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    return SWIG_From_unsigned_SS_long  ((unsigned long)(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else {
+    /* assume sizeof(size_t) <= sizeof(unsigned long long) */
+    return SWIG_From_unsigned_SS_long_SS_long  ((unsigned long long)(value));
+  }
+#endif
+}
+
 SWIGINTERN struct molecule *new_molecule(void){
     molecule *mol;
     mol = molmalloc( 0, 0 );
@@ -3444,6 +3542,51 @@ SWIGINTERN void molecule_append_bond(struct molecule *self,unsigned short a1,uns
 
     molappend_bond( self, &b1 );
   }
+SWIGINTERN void molecule_reserve(struct molecule *self,unsigned short atom_max,unsigned short bond_max){
+    molreserve( self, atom_max, bond_max );
+  }
+
+
+
+SWIGINTERN void molecule_append_atom_records(struct molecule *self,char const *records,size_t size){
+    molappend_atoms( self, (const atom *)records, size / sizeof(atom) );
+  }
+SWIGINTERN void molecule_append_bond_records(struct molecule *self,char const *records,size_t size){
+    molappend_bond_records( self, (const bond_record *)records, size / sizeof(bond_record) );
+  }
+SWIGINTERN void molecule_set_coord_records(struct molecule *self,char const *records,size_t size){
+    molset_coords( self, (const double *)records, size / (3 * sizeof(double)) );
+  }
+SWIGINTERN PyObject *molecule_coord_records(struct molecule *self){
+    // x, y, z of each atom in the order of the atoms array, the layout read by set_coord_records()
+    PyObject *records = PyBytes_FromStringAndSize( NULL, (Py_ssize_t)self->atom_no * 3 * sizeof(double) );
+    double *coords;
+    if (records == NULL)
+    {
+      return NULL;
+    }
+    coords = (double *)PyBytes_AS_STRING( records );
+    for (int i = 0; i < self->atom_no; i++)
+    {
+      coords[i * 3] = self->atoms[i].x;
+      coords[i * 3 + 1] = self->atoms[i].y;
+      coords[i * 3 + 2] = self->atoms[i].z;
+    }
+    return records;
+  }
+SWIGINTERN void molecule_copy_from(struct molecule *self,molecule *src){
+    // Swap the contents of a copy of src into this molecule, then free the copy with the old contents
+    molecule *copy = molcopy( src );
+    molecule old;
+    if (copy == NULL)
+    {
+      return;
+    }
+    old = *self;
+    *self = *copy;
+    *copy = old;
+    molfree( copy );
+  }
 SWIGINTERN atom *molecule_get_atom(struct molecule *self,unsigned short i){
     return self->atom_ptrs[i];
   }
@@ -3544,6 +3687,31 @@ SWIGINTERN struct mx_wrapper *new_mx_wrapper(int xrot,int yrot,int zrot){
 SWIGINTERN void delete_mx_wrapper(struct mx_wrapper *self){
     free( self );
   }
+SWIGINTERN struct raster *new_raster(unsigned short width,unsigned short height){
+    return rastermalloc( width, height );
+  }
+SWIGINTERN void delete_raster(struct raster *self){
+    rasterfree( self );
+  }
+SWIGINTERN PyObject *raster_rgba(struct raster *self){
+    return PyBytes_FromStringAndSize( (const char *)self->pixels, (Py_ssize_t)self->width * self->height * 4 );
+  }
+
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_int (PyObject * obj, unsigned int *val)
+{
+  unsigned long v;
+  int res = SWIG_AsVal_unsigned_SS_long (obj, &v);
+  if (SWIG_IsOK(res)) {
+    if ((v > UINT_MAX)) {
+      return SWIG_OverflowError;
+    } else {
+      if (val) *val = (unsigned int)(v);
+    }
+  }  
+  return res;
+}
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -4521,6 +4689,156 @@ SWIGINTERN PyObject *bond_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
   return SWIG_Python_InitShadowInstance(args);
 }
 
+SWIGINTERN PyObject *_wrap_arena_size_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct arena *arg1 = (struct arena *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "arena_size_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "arena_size_set" "', argument " "1"" of type '" "struct arena *""'"); 
+  }
+  arg1 = (struct arena *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "arena_size_set" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  if (arg1) (arg1)->size = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_arena_size_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct arena *arg1 = (struct arena *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "arena_size_get" "', argument " "1"" of type '" "struct arena *""'"); 
+  }
+  arg1 = (struct arena *)(argp1);
+  result =  ((arg1)->size);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_arena_used_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct arena *arg1 = (struct arena *) 0 ;
+  size_t arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "arena_used_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "arena_used_set" "', argument " "1"" of type '" "struct arena *""'"); 
+  }
+  arg1 = (struct arena *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "arena_used_set" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  if (arg1) (arg1)->used = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_arena_used_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct arena *arg1 = (struct arena *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "arena_used_get" "', argument " "1"" of type '" "struct arena *""'"); 
+  }
+  arg1 = (struct arena *)(argp1);
+  result =  ((arg1)->used);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_arena(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct arena *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_arena", 0, 0, 0)) SWIG_fail;
+  result = (struct arena *)calloc(1, sizeof(struct arena));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_arena, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_arena(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct arena *arg1 = (struct arena *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_arena" "', argument " "1"" of type '" "struct arena *""'"); 
+  }
+  arg1 = (struct arena *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *arena_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_arena, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *arena_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
 SWIGINTERN PyObject *_wrap_molecule_atom_max_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
@@ -4937,6 +5255,58 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_molecule_arena_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  arena *arg2 = (arena *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_arena_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_arena_set" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_arena, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molecule_arena_set" "', argument " "2"" of type '" "arena *""'"); 
+  }
+  arg2 = (arena *)(argp2);
+  if (arg1) (arg1)->arena = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_arena_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  arena *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_arena_get" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  result = (arena *) ((arg1)->arena);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_arena, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_molecule(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *result = 0 ;
@@ -5070,61 +5440,261 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molecule_get_atom(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule_reserve(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
   unsigned short arg2 ;
+  unsigned short arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   unsigned short val2 ;
   int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  atom *result = 0 ;
+  unsigned short val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molecule_get_atom", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molecule_reserve", 3, 3, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_atom" "', argument " "1"" of type '" "struct molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_reserve" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
   ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_atom" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_reserve" "', argument " "2"" of type '" "unsigned short""'");
   } 
   arg2 = (unsigned short)(val2);
-  result = (atom *)molecule_get_atom(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_atom, 0 |  0 );
+  ecode3 = SWIG_AsVal_unsigned_SS_short(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molecule_reserve" "', argument " "3"" of type '" "unsigned short""'");
+  } 
+  arg3 = (unsigned short)(val3);
+  molecule_reserve(arg1,arg2,arg3);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molecule_get_bond(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_molecule_append_atom_records(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   struct molecule *arg1 = (struct molecule *) 0 ;
-  unsigned short arg2 ;
+  char *arg2 = (char *) 0 ;
+  size_t arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
-  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
-  bond *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molecule_get_bond", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molecule_append_atom_records", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_bond" "', argument " "1"" of type '" "struct molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_append_atom_records" "', argument " "1"" of type '" "struct molecule *""'"); 
   }
   arg1 = (struct molecule *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_bond" "', argument " "2"" of type '" "unsigned short""'");
-  } 
-  arg2 = (unsigned short)(val2);
-  result = (bond *)molecule_get_bond(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_bond, 0 |  0 );
-  return resultobj;
+  {
+    int res; Py_ssize_t size = 0; const void *buf = 0;
+    Py_buffer view;
+    res = PyObject_GetBuffer(swig_obj[1], &view, PyBUF_CONTIG_RO);
+    if (res < 0) {
+      PyErr_Clear();
+      SWIG_exception_fail(SWIG_ArgError(res), "in method '" "molecule_append_atom_records" "', argument " "2"" of type '" "(const char *records, size_t size)""'");
+    }
+    size = view.len;
+    buf = view.buf;
+    PyBuffer_Release(&view);
+    arg2 = (char *) buf;
+    arg3 = (size_t) (size / sizeof(char const));
+  }
+  molecule_append_atom_records(arg1,(char const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_append_bond_records(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  char *arg2 = (char *) 0 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_append_bond_records", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_append_bond_records" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  {
+    int res; Py_ssize_t size = 0; const void *buf = 0;
+    Py_buffer view;
+    res = PyObject_GetBuffer(swig_obj[1], &view, PyBUF_CONTIG_RO);
+    if (res < 0) {
+      PyErr_Clear();
+      SWIG_exception_fail(SWIG_ArgError(res), "in method '" "molecule_append_bond_records" "', argument " "2"" of type '" "(const char *records, size_t size)""'");
+    }
+    size = view.len;
+    buf = view.buf;
+    PyBuffer_Release(&view);
+    arg2 = (char *) buf;
+    arg3 = (size_t) (size / sizeof(char const));
+  }
+  molecule_append_bond_records(arg1,(char const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_set_coord_records(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  char *arg2 = (char *) 0 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_set_coord_records", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_set_coord_records" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  {
+    int res; Py_ssize_t size = 0; const void *buf = 0;
+    Py_buffer view;
+    res = PyObject_GetBuffer(swig_obj[1], &view, PyBUF_CONTIG_RO);
+    if (res < 0) {
+      PyErr_Clear();
+      SWIG_exception_fail(SWIG_ArgError(res), "in method '" "molecule_set_coord_records" "', argument " "2"" of type '" "(const char *records, size_t size)""'");
+    }
+    size = view.len;
+    buf = view.buf;
+    PyBuffer_Release(&view);
+    arg2 = (char *) buf;
+    arg3 = (size_t) (size / sizeof(char const));
+  }
+  molecule_set_coord_records(arg1,(char const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_coord_records(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_coord_records" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  result = (PyObject *)molecule_coord_records(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_copy_from(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  molecule *arg2 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_copy_from", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_copy_from" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molecule_copy_from" "', argument " "2"" of type '" "molecule *""'"); 
+  }
+  arg2 = (molecule *)(argp2);
+  molecule_copy_from(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_get_atom(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  unsigned short arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  atom *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_get_atom", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_atom" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_atom" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  result = (atom *)molecule_get_atom(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_atom, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molecule_get_bond(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct molecule *arg1 = (struct molecule *) 0 ;
+  unsigned short arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  bond *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molecule_get_bond", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molecule_get_bond" "', argument " "1"" of type '" "struct molecule *""'"); 
+  }
+  arg1 = (struct molecule *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molecule_get_bond" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  result = (bond *)molecule_get_bond(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_bond, 0 |  0 );
+  return resultobj;
 fail:
   return NULL;
 }
@@ -5192,52 +5762,28 @@ SWIGINTERN PyObject *molecule_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_atomset(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_bond_record_a1_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  atom *arg1 = (atom *) 0 ;
-  char *arg2 ;
-  double *arg3 = (double *) 0 ;
-  double *arg4 = (double *) 0 ;
-  double *arg5 = (double *) 0 ;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
+  unsigned short arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char temp2[3] ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  PyObject *swig_obj[5] ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "atomset", 5, 5, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "bond_record_a1_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomset" "', argument " "1"" of type '" "atom *""'"); 
-  }
-  arg1 = (atom *)(argp1);
-  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomset" "', argument " "2"" of type '" "char [3]""'");
-  }
-  arg2 = (char *)(temp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "atomset" "', argument " "3"" of type '" "double *""'"); 
-  }
-  arg3 = (double *)(argp3);
-  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "atomset" "', argument " "4"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_record_a1_set" "', argument " "1"" of type '" "struct bond_record *""'"); 
   }
-  arg4 = (double *)(argp4);
-  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "atomset" "', argument " "5"" of type '" "double *""'"); 
-  }
-  arg5 = (double *)(argp5);
-  atomset(arg1,arg2,arg3,arg4,arg5);
+  arg1 = (struct bond_record *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_record_a1_set" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  if (arg1) (arg1)->a1 = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5245,74 +5791,300 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_atomget(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_bond_record_a1_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  atom *arg1 = (atom *) 0 ;
-  char *arg2 ;
-  double *arg3 = (double *) 0 ;
-  double *arg4 = (double *) 0 ;
-  double *arg5 = (double *) 0 ;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char temp2[3] ;
-  int res2 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  PyObject *swig_obj[5] ;
+  PyObject *swig_obj[1] ;
+  unsigned short result;
   
-  if (!SWIG_Python_UnpackTuple(args, "atomget", 5, 5, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomget" "', argument " "1"" of type '" "atom *""'"); 
-  }
-  arg1 = (atom *)(argp1);
-  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomget" "', argument " "2"" of type '" "char [3]""'");
-  }
-  arg2 = (char *)(temp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "atomget" "', argument " "3"" of type '" "double *""'"); 
-  }
-  arg3 = (double *)(argp3);
-  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "atomget" "', argument " "4"" of type '" "double *""'"); 
-  }
-  arg4 = (double *)(argp4);
-  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "atomget" "', argument " "5"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_record_a1_get" "', argument " "1"" of type '" "struct bond_record *""'"); 
   }
-  arg5 = (double *)(argp5);
-  atomget(arg1,arg2,arg3,arg4,arg5);
-  resultobj = SWIG_Py_Void();
+  arg1 = (struct bond_record *)(argp1);
+  result = (unsigned short) ((arg1)->a1);
+  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_bondset(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_bond_record_a2_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  bond *arg1 = (bond *) 0 ;
-  unsigned short *arg2 = (unsigned short *) 0 ;
-  unsigned short *arg3 = (unsigned short *) 0 ;
-  atom **arg4 = (atom **) 0 ;
-  unsigned char *arg5 = (unsigned char *) 0 ;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
+  unsigned short arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "bond_record_a2_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_record_a2_set" "', argument " "1"" of type '" "struct bond_record *""'"); 
+  }
+  arg1 = (struct bond_record *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_record_a2_set" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  if (arg1) (arg1)->a2 = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bond_record_a2_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned short result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_record_a2_get" "', argument " "1"" of type '" "struct bond_record *""'"); 
+  }
+  arg1 = (struct bond_record *)(argp1);
+  result = (unsigned short) ((arg1)->a2);
+  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bond_record_epairs_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
+  unsigned char arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned char val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "bond_record_epairs_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_record_epairs_set" "', argument " "1"" of type '" "struct bond_record *""'"); 
+  }
+  arg1 = (struct bond_record *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_char(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "bond_record_epairs_set" "', argument " "2"" of type '" "unsigned char""'");
+  } 
+  arg2 = (unsigned char)(val2);
+  if (arg1) (arg1)->epairs = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bond_record_epairs_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned char result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_record_epairs_get" "', argument " "1"" of type '" "struct bond_record *""'"); 
+  }
+  arg1 = (struct bond_record *)(argp1);
+  result = (unsigned char) ((arg1)->epairs);
+  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_bond_record(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct bond_record *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_bond_record", 0, 0, 0)) SWIG_fail;
+  result = (struct bond_record *)calloc(1, sizeof(struct bond_record));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_bond_record, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_bond_record(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct bond_record *arg1 = (struct bond_record *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond_record, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_bond_record" "', argument " "1"" of type '" "struct bond_record *""'"); 
+  }
+  arg1 = (struct bond_record *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *bond_record_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_bond_record, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *bond_record_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_atomset(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  atom *arg1 = (atom *) 0 ;
+  char *arg2 ;
+  double *arg3 = (double *) 0 ;
+  double *arg4 = (double *) 0 ;
+  double *arg5 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  char temp2[3] ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atomset", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomset" "', argument " "1"" of type '" "atom *""'"); 
+  }
+  arg1 = (atom *)(argp1);
+  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomset" "', argument " "2"" of type '" "char [3]""'");
+  }
+  arg2 = (char *)(temp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "atomset" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "atomset" "', argument " "4"" of type '" "double *""'"); 
+  }
+  arg4 = (double *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "atomset" "', argument " "5"" of type '" "double *""'"); 
+  }
+  arg5 = (double *)(argp5);
+  atomset(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_atomget(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  atom *arg1 = (atom *) 0 ;
+  char *arg2 ;
+  double *arg3 = (double *) 0 ;
+  double *arg4 = (double *) 0 ;
+  double *arg5 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  char temp2[3] ;
+  int res2 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "atomget", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "atomget" "', argument " "1"" of type '" "atom *""'"); 
+  }
+  arg1 = (atom *)(argp1);
+  res2 = SWIG_AsCharArray(swig_obj[1], temp2, 3);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "atomget" "', argument " "2"" of type '" "char [3]""'");
+  }
+  arg2 = (char *)(temp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "atomget" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "atomget" "', argument " "4"" of type '" "double *""'"); 
+  }
+  arg4 = (double *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "atomget" "', argument " "5"" of type '" "double *""'"); 
+  }
+  arg5 = (double *)(argp5);
+  atomget(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bondset(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  bond *arg1 = (bond *) 0 ;
+  unsigned short *arg2 = (unsigned short *) 0 ;
+  unsigned short *arg3 = (unsigned short *) 0 ;
+  atom **arg4 = (atom **) 0 ;
+  unsigned char *arg5 = (unsigned char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
   void *argp5 = 0 ;
   int res5 = 0 ;
   PyObject *swig_obj[5] ;
@@ -5351,74 +6123,1163 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_bondget(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_bondget(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  bond *arg1 = (bond *) 0 ;
+  unsigned short *arg2 = (unsigned short *) 0 ;
+  unsigned short *arg3 = (unsigned short *) 0 ;
+  atom **arg4 = (atom **) 0 ;
+  unsigned char *arg5 = (unsigned char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "bondget", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bondget" "', argument " "1"" of type '" "bond *""'"); 
+  }
+  arg1 = (bond *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_short, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bondget" "', argument " "2"" of type '" "unsigned short *""'"); 
+  }
+  arg2 = (unsigned short *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_short, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "bondget" "', argument " "3"" of type '" "unsigned short *""'"); 
+  }
+  arg3 = (unsigned short *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "bondget" "', argument " "4"" of type '" "atom **""'"); 
+  }
+  arg4 = (atom **)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_unsigned_char, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "bondget" "', argument " "5"" of type '" "unsigned char *""'"); 
+  }
+  arg5 = (unsigned char *)(argp5);
+  bondget(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_compute_coords(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  bond *arg1 = (bond *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "compute_coords" "', argument " "1"" of type '" "bond *""'"); 
+  }
+  arg1 = (bond *)(argp1);
+  compute_coords(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molmalloc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned short arg1 ;
+  unsigned short arg2 ;
+  unsigned short val1 ;
+  int ecode1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  molecule *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molmalloc", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_short(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "molmalloc" "', argument " "1"" of type '" "unsigned short""'");
+  } 
+  arg1 = (unsigned short)(val1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molmalloc" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  result = (molecule *)molmalloc(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molreserve(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  unsigned short arg2 ;
+  unsigned short arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  unsigned short val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molreserve", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molreserve" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molreserve" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  ecode3 = SWIG_AsVal_unsigned_SS_short(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molreserve" "', argument " "3"" of type '" "unsigned short""'");
+  } 
+  arg3 = (unsigned short)(val3);
+  molreserve(arg1,arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molcopy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  molecule *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molcopy" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  result = (molecule *)molcopy(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molfree(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molfree" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  molfree(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molsize(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  size_t result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molsize" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  result = molsize(arg1);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molappend_atom(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  atom *arg2 = (atom *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molappend_atom", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_atom" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_atom" "', argument " "2"" of type '" "atom *""'"); 
+  }
+  arg2 = (atom *)(argp2);
+  molappend_atom(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molappend_bond(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  bond *arg2 = (bond *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molappend_bond", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_bond" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_bond, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_bond" "', argument " "2"" of type '" "bond *""'"); 
+  }
+  arg2 = (bond *)(argp2);
+  molappend_bond(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molappend_atoms(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  atom *arg2 = (atom *) 0 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molappend_atoms", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_atoms" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_atoms" "', argument " "2"" of type '" "atom const *""'"); 
+  }
+  arg2 = (atom *)(argp2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molappend_atoms" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = (size_t)(val3);
+  molappend_atoms(arg1,(struct atom const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molappend_bond_records(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  bond_record *arg2 = (bond_record *) 0 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molappend_bond_records", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_bond_records" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_bond_record, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_bond_records" "', argument " "2"" of type '" "bond_record const *""'"); 
+  }
+  arg2 = (bond_record *)(argp2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molappend_bond_records" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = (size_t)(val3);
+  molappend_bond_records(arg1,(struct bond_record const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molset_coords(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  double *arg2 = (double *) 0 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molset_coords", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molset_coords" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molset_coords" "', argument " "2"" of type '" "double const *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molset_coords" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = (size_t)(val3);
+  molset_coords(arg1,(double const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_compare_atom(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  void *arg1 = (void *) 0 ;
+  void *arg2 = (void *) 0 ;
+  int res1 ;
+  int res2 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "compare_atom", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0],SWIG_as_voidptrptr(&arg1), 0, 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "compare_atom" "', argument " "1"" of type '" "void const *""'"); 
+  }
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "compare_atom" "', argument " "2"" of type '" "void const *""'"); 
+  }
+  result = (int)compare_atom((void const *)arg1,(void const *)arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bond_comp(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  void *arg1 = (void *) 0 ;
+  void *arg2 = (void *) 0 ;
+  int res1 ;
+  int res2 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "bond_comp", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0],SWIG_as_voidptrptr(&arg1), 0, 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_comp" "', argument " "1"" of type '" "void const *""'"); 
+  }
+  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bond_comp" "', argument " "2"" of type '" "void const *""'"); 
+  }
+  result = (int)bond_comp((void const *)arg1,(void const *)arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molsort(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molsort" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  molsort(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_xrotation(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double (*arg1)[3] ;
+  unsigned short arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "xrotation", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "xrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
+  } 
+  arg1 = (double (*)[3])(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "xrotation" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  xrotation((double (*)[3])arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_yrotation(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double (*arg1)[3] ;
+  unsigned short arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "yrotation", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "yrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
+  } 
+  arg1 = (double (*)[3])(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "yrotation" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  yrotation((double (*)[3])arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_zrotation(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double (*arg1)[3] ;
+  unsigned short arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "zrotation", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "zrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
+  } 
+  arg1 = (double (*)[3])(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "zrotation" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  zrotation((double (*)[3])arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_mol_xform(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  molecule *arg1 = (molecule *) 0 ;
+  double (*arg2)[3] ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "mol_xform", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mol_xform" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "mol_xform" "', argument " "2"" of type '" "double [3][3]""'"); 
+  } 
+  arg2 = (double (*)[3])(argp2);
+  mol_xform(arg1,(double (*)[3])arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_mx_wrapper_xform_matrix_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  double (*arg2)[3] ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "mx_wrapper_xform_matrix_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mx_wrapper_xform_matrix_set" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+  }
+  arg1 = (struct mx_wrapper *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "mx_wrapper_xform_matrix_set" "', argument " "2"" of type '" "double [3][3]""'"); 
+  } 
+  arg2 = (double (*)[3])(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)3; ++ii) {
+        if (arg2[ii]) {
+          size_t jj = 0;
+          for (; jj < (size_t)3; ++jj) arg1->xform_matrix[ii][jj] = arg2[ii][jj];
+        } else {
+          SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""xform_matrix""' of type '""double [3][3]""'");
+        }
+      }
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""xform_matrix""' of type '""double [3][3]""'");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_mx_wrapper_xform_matrix_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double (*result)[3] = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mx_wrapper_xform_matrix_get" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+  }
+  arg1 = (struct mx_wrapper *)(argp1);
+  result = (double (*)[3]) ((arg1)->xform_matrix);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_a_3__double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_mx_wrapper(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int arg2 ;
+  int arg3 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  struct mx_wrapper *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_mx_wrapper", 3, 3, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_mx_wrapper" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_mx_wrapper" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "new_mx_wrapper" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  result = (struct mx_wrapper *)new_mx_wrapper(arg1,arg2,arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_mx_wrapper, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_mx_wrapper(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_mx_wrapper" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+  }
+  arg1 = (struct mx_wrapper *)(argp1);
+  delete_mx_wrapper(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *mx_wrapper_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_mx_wrapper, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *mx_wrapper_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_alloc_stats_mallocs_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  unsigned long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "alloc_stats_mallocs_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_mallocs_set" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "alloc_stats_mallocs_set" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = (unsigned long)(val2);
+  if (arg1) (arg1)->mallocs = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_mallocs_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned long result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_mallocs_get" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  result = (unsigned long) ((arg1)->mallocs);
+  resultobj = SWIG_From_unsigned_SS_long((unsigned long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_reallocs_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  unsigned long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "alloc_stats_reallocs_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_reallocs_set" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "alloc_stats_reallocs_set" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = (unsigned long)(val2);
+  if (arg1) (arg1)->reallocs = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_reallocs_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned long result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_reallocs_get" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  result = (unsigned long) ((arg1)->reallocs);
+  resultobj = SWIG_From_unsigned_SS_long((unsigned long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_frees_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  unsigned long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "alloc_stats_frees_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_frees_set" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "alloc_stats_frees_set" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = (unsigned long)(val2);
+  if (arg1) (arg1)->frees = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_frees_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned long result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_frees_get" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  result = (unsigned long) ((arg1)->frees);
+  resultobj = SWIG_From_unsigned_SS_long((unsigned long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_bytes_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  unsigned long long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "alloc_stats_bytes_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_bytes_set" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "alloc_stats_bytes_set" "', argument " "2"" of type '" "unsigned long long""'");
+  } 
+  arg2 = (unsigned long long)(val2);
+  if (arg1) (arg1)->bytes = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_bytes_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned long long result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_bytes_get" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  result = (unsigned long long) ((arg1)->bytes);
+  resultobj = SWIG_From_unsigned_SS_long_SS_long((unsigned long long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_arenas_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  unsigned long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "alloc_stats_arenas_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_arenas_set" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "alloc_stats_arenas_set" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = (unsigned long)(val2);
+  if (arg1) (arg1)->arenas = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_arenas_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned long result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_arenas_get" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  result = (unsigned long) ((arg1)->arenas);
+  resultobj = SWIG_From_unsigned_SS_long((unsigned long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_arena_allocs_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  unsigned long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "alloc_stats_arena_allocs_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_arena_allocs_set" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "alloc_stats_arena_allocs_set" "', argument " "2"" of type '" "unsigned long""'");
+  } 
+  arg2 = (unsigned long)(val2);
+  if (arg1) (arg1)->arena_allocs = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_alloc_stats_arena_allocs_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned long result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "alloc_stats_arena_allocs_get" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  result = (unsigned long) ((arg1)->arena_allocs);
+  resultobj = SWIG_From_unsigned_SS_long((unsigned long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_alloc_stats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_alloc_stats", 0, 0, 0)) SWIG_fail;
+  result = (struct alloc_stats *)calloc(1, sizeof(struct alloc_stats));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_alloc_stats, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_alloc_stats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct alloc_stats *arg1 = (struct alloc_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_alloc_stats, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_alloc_stats" "', argument " "1"" of type '" "struct alloc_stats *""'"); 
+  }
+  arg1 = (struct alloc_stats *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *alloc_stats_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_alloc_stats, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *alloc_stats_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_allocstats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  alloc_stats result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "allocstats", 0, 0, 0)) SWIG_fail;
+  result = allocstats();
+  resultobj = SWIG_NewPointerObj((alloc_stats *)memcpy((alloc_stats *)calloc(1,sizeof(alloc_stats)),&result,sizeof(alloc_stats)), SWIGTYPE_p_alloc_stats, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_allocstats_reset(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  
+  if (!SWIG_Python_UnpackTuple(args, "allocstats_reset", 0, 0, 0)) SWIG_fail;
+  allocstats_reset();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_arenamalloc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  bond *arg1 = (bond *) 0 ;
-  unsigned short *arg2 = (unsigned short *) 0 ;
-  unsigned short *arg3 = (unsigned short *) 0 ;
-  atom **arg4 = (atom **) 0 ;
-  unsigned char *arg5 = (unsigned char *) 0 ;
+  size_t arg1 ;
+  size_t val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  arena *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_size_t(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "arenamalloc" "', argument " "1"" of type '" "size_t""'");
+  } 
+  arg1 = (size_t)(val1);
+  result = (arena *)arenamalloc(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_arena, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_arenaalloc(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  arena *arg1 = (arena *) 0 ;
+  size_t arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  void *argp5 = 0 ;
-  int res5 = 0 ;
-  PyObject *swig_obj[5] ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  void *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "bondget", 5, 5, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "arenaalloc", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bondget" "', argument " "1"" of type '" "bond *""'"); 
-  }
-  arg1 = (bond *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_short, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bondget" "', argument " "2"" of type '" "unsigned short *""'"); 
-  }
-  arg2 = (unsigned short *)(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_unsigned_short, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "bondget" "', argument " "3"" of type '" "unsigned short *""'"); 
-  }
-  arg3 = (unsigned short *)(argp3);
-  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_p_atom, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "bondget" "', argument " "4"" of type '" "atom **""'"); 
-  }
-  arg4 = (atom **)(argp4);
-  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_unsigned_char, 0 |  0 );
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "bondget" "', argument " "5"" of type '" "unsigned char *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "arenaalloc" "', argument " "1"" of type '" "arena *""'"); 
   }
-  arg5 = (unsigned char *)(argp5);
-  bondget(arg1,arg2,arg3,arg4,arg5);
-  resultobj = SWIG_Py_Void();
+  arg1 = (arena *)(argp1);
+  ecode2 = SWIG_AsVal_size_t(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "arenaalloc" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = (size_t)(val2);
+  result = (void *)arenaalloc(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_compute_coords(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_arenafree(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  bond *arg1 = (bond *) 0 ;
+  arena *arg1 = (arena *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_bond, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "compute_coords" "', argument " "1"" of type '" "bond *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "arenafree" "', argument " "1"" of type '" "arena *""'"); 
   }
-  arg1 = (bond *)(argp1);
-  compute_coords(arg1);
+  arg1 = (arena *)(argp1);
+  arenafree(arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5426,7 +7287,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molmalloc(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_molarenasize(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   unsigned short arg1 ;
   unsigned short arg2 ;
@@ -5435,20 +7296,58 @@ SWIGINTERN PyObject *_wrap_molmalloc(PyObject *self, PyObject *args) {
   unsigned short val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
-  molecule *result = 0 ;
+  size_t result;
   
-  if (!SWIG_Python_UnpackTuple(args, "molmalloc", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "molarenasize", 2, 2, swig_obj)) SWIG_fail;
   ecode1 = SWIG_AsVal_unsigned_SS_short(swig_obj[0], &val1);
   if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "molmalloc" "', argument " "1"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "molarenasize" "', argument " "1"" of type '" "unsigned short""'");
   } 
   arg1 = (unsigned short)(val1);
   ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molmalloc" "', argument " "2"" of type '" "unsigned short""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molarenasize" "', argument " "2"" of type '" "unsigned short""'");
   } 
   arg2 = (unsigned short)(val2);
-  result = (molecule *)molmalloc(arg1,arg2);
+  result = molarenasize(arg1,arg2);
+  resultobj = SWIG_From_size_t((size_t)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_molmalloc_arena(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  arena *arg1 = (arena *) 0 ;
+  unsigned short arg2 ;
+  unsigned short arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  unsigned short val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  molecule *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "molmalloc_arena", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molmalloc_arena" "', argument " "1"" of type '" "arena *""'"); 
+  }
+  arg1 = (arena *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "molmalloc_arena" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  ecode3 = SWIG_AsVal_unsigned_SS_short(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "molmalloc_arena" "', argument " "3"" of type '" "unsigned short""'");
+  } 
+  arg3 = (unsigned short)(val3);
+  result = (molecule *)molmalloc_arena(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
   return resultobj;
 fail:
@@ -5456,22 +7355,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molcopy(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_molcopy_arena(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
+  arena *arg1 = (arena *) 0 ;
+  molecule *arg2 = (molecule *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   molecule *result = 0 ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "molcopy_arena", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_arena, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molcopy" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molcopy_arena" "', argument " "1"" of type '" "arena *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  result = (molecule *)molcopy(arg1);
+  arg1 = (arena *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molcopy_arena" "', argument " "2"" of type '" "molecule *""'"); 
+  }
+  arg2 = (molecule *)(argp2);
+  result = (molecule *)molcopy_arena(arg1,arg2);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_molecule, 0 |  0 );
   return resultobj;
 fail:
@@ -5479,50 +7385,94 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molfree(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rotations_x_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
+  struct rotations *arg1 = (struct rotations *) 0 ;
+  molecule **arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "rotations_x_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_x_set" "', argument " "1"" of type '" "struct rotations *""'"); 
+  }
+  arg1 = (struct rotations *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_molecule, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_x_set" "', argument " "2"" of type '" "molecule *[72]""'"); 
+  } 
+  arg2 = (molecule **)(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)72; ++ii) *(molecule * *)&arg1->x[ii] = *((molecule * *)arg2 + ii);
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""x""' of type '""molecule *[72]""'");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_rotations_x_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct rotations *arg1 = (struct rotations *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  molecule **result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molfree" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_x_get" "', argument " "1"" of type '" "struct rotations *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  molfree(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (struct rotations *)(argp1);
+  result = (molecule **)(molecule **) ((arg1)->x);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_molecule, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molappend_atom(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rotations_y_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
-  atom *arg2 = (atom *) 0 ;
+  struct rotations *arg1 = (struct rotations *) 0 ;
+  molecule **arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molappend_atom", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "rotations_y_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_atom" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_y_set" "', argument " "1"" of type '" "struct rotations *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_atom, 0 |  0 );
+  arg1 = (struct rotations *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_atom" "', argument " "2"" of type '" "atom *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_y_set" "', argument " "2"" of type '" "molecule *[72]""'"); 
+  } 
+  arg2 = (molecule **)(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)72; ++ii) *(molecule * *)&arg1->y[ii] = *((molecule * *)arg2 + ii);
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""y""' of type '""molecule *[72]""'");
+    }
   }
-  arg2 = (atom *)(argp2);
-  molappend_atom(arg1,arg2);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5530,160 +7480,168 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_molappend_bond(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rotations_y_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
-  bond *arg2 = (bond *) 0 ;
+  struct rotations *arg1 = (struct rotations *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  molecule **result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_y_get" "', argument " "1"" of type '" "struct rotations *""'"); 
+  }
+  arg1 = (struct rotations *)(argp1);
+  result = (molecule **)(molecule **) ((arg1)->y);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_molecule, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_rotations_z_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct rotations *arg1 = (struct rotations *) 0 ;
+  molecule **arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "molappend_bond", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "rotations_z_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molappend_bond" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_z_set" "', argument " "1"" of type '" "struct rotations *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_bond, 0 |  0 );
+  arg1 = (struct rotations *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "molappend_bond" "', argument " "2"" of type '" "bond *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_z_set" "', argument " "2"" of type '" "molecule *[72]""'"); 
+  } 
+  arg2 = (molecule **)(argp2);
+  {
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)72; ++ii) *(molecule * *)&arg1->z[ii] = *((molecule * *)arg2 + ii);
+    } else {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""z""' of type '""molecule *[72]""'");
+    }
   }
-  arg2 = (bond *)(argp2);
-  molappend_bond(arg1,arg2);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
-
-SWIGINTERN PyObject *_wrap_compare_atom(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  void *arg1 = (void *) 0 ;
-  void *arg2 = (void *) 0 ;
-  int res1 ;
-  int res2 ;
-  PyObject *swig_obj[2] ;
-  int result;
+
+SWIGINTERN PyObject *_wrap_rotations_z_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  struct rotations *arg1 = (struct rotations *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  molecule **result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "compare_atom", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0],SWIG_as_voidptrptr(&arg1), 0, 0);
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "compare_atom" "', argument " "1"" of type '" "void const *""'"); 
-  }
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "compare_atom" "', argument " "2"" of type '" "void const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_z_get" "', argument " "1"" of type '" "struct rotations *""'"); 
   }
-  result = (int)compare_atom((void const *)arg1,(void const *)arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (struct rotations *)(argp1);
+  result = (molecule **)(molecule **) ((arg1)->z);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_molecule, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_bond_comp(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rotations_arena_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  void *arg1 = (void *) 0 ;
-  void *arg2 = (void *) 0 ;
-  int res1 ;
-  int res2 ;
+  struct rotations *arg1 = (struct rotations *) 0 ;
+  arena *arg2 = (arena *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
-  int result;
   
-  if (!SWIG_Python_UnpackTuple(args, "bond_comp", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0],SWIG_as_voidptrptr(&arg1), 0, 0);
+  if (!SWIG_Python_UnpackTuple(args, "rotations_arena_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bond_comp" "', argument " "1"" of type '" "void const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_arena_set" "', argument " "1"" of type '" "struct rotations *""'"); 
   }
-  res2 = SWIG_ConvertPtr(swig_obj[1],SWIG_as_voidptrptr(&arg2), 0, 0);
+  arg1 = (struct rotations *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_arena, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "bond_comp" "', argument " "2"" of type '" "void const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_arena_set" "', argument " "2"" of type '" "arena *""'"); 
   }
-  result = (int)bond_comp((void const *)arg1,(void const *)arg2);
-  resultobj = SWIG_From_int((int)(result));
+  arg2 = (arena *)(argp2);
+  if (arg1) (arg1)->arena = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_molsort(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rotations_arena_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
+  struct rotations *arg1 = (struct rotations *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  arena *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "molsort" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_arena_get" "', argument " "1"" of type '" "struct rotations *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  molsort(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (struct rotations *)(argp1);
+  result = (arena *) ((arg1)->arena);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_arena, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_xrotation(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_rotations(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double (*arg1)[3] ;
-  unsigned short arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  unsigned short val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
+  struct rotations *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "xrotation", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "xrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
-  } 
-  arg1 = (double (*)[3])(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "xrotation" "', argument " "2"" of type '" "unsigned short""'");
-  } 
-  arg2 = (unsigned short)(val2);
-  xrotation((double (*)[3])arg1,arg2);
-  resultobj = SWIG_Py_Void();
+  if (!SWIG_Python_UnpackTuple(args, "new_rotations", 0, 0, 0)) SWIG_fail;
+  result = (struct rotations *)calloc(1, sizeof(struct rotations));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_rotations, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_yrotation(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_rotations(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double (*arg1)[3] ;
-  unsigned short arg2 ;
+  struct rotations *arg1 = (struct rotations *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
+  PyObject *swig_obj[1] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "yrotation", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "yrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
-  } 
-  arg1 = (double (*)[3])(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "yrotation" "', argument " "2"" of type '" "unsigned short""'");
-  } 
-  arg2 = (unsigned short)(val2);
-  yrotation((double (*)[3])arg1,arg2);
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_rotations" "', argument " "1"" of type '" "struct rotations *""'"); 
+  }
+  arg1 = (struct rotations *)(argp1);
+  free((char *) arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5691,57 +7649,55 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_zrotation(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *rotations_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_rotations, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *rotations_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_spin(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double (*arg1)[3] ;
-  unsigned short arg2 ;
+  molecule *arg1 = (molecule *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned short val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
+  PyObject *swig_obj[1] ;
+  rotations *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "zrotation", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_a_3__double, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "zrotation" "', argument " "1"" of type '" "double [3][3]""'"); 
-  } 
-  arg1 = (double (*)[3])(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "zrotation" "', argument " "2"" of type '" "unsigned short""'");
-  } 
-  arg2 = (unsigned short)(val2);
-  zrotation((double (*)[3])arg1,arg2);
-  resultobj = SWIG_Py_Void();
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spin" "', argument " "1"" of type '" "molecule *""'"); 
+  }
+  arg1 = (molecule *)(argp1);
+  result = (rotations *)spin(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_rotations, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_mol_xform(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rotationsfree(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
-  double (*arg2)[3] ;
+  rotations *arg1 = (rotations *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  PyObject *swig_obj[1] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "mol_xform", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mol_xform" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotationsfree" "', argument " "1"" of type '" "rotations *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_3__double, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "mol_xform" "', argument " "2"" of type '" "double [3][3]""'"); 
-  } 
-  arg2 = (double (*)[3])(argp2);
-  mol_xform(arg1,(double (*)[3])arg2);
+  arg1 = (rotations *)(argp1);
+  rotationsfree(arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5749,42 +7705,28 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_mx_wrapper_xform_matrix_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_width_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
-  double (*arg2)[3] ;
+  struct raster *arg1 = (struct raster *) 0 ;
+  unsigned short arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "mx_wrapper_xform_matrix_set", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "raster_width_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mx_wrapper_xform_matrix_set" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_width_set" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct mx_wrapper *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_a_3__double, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "mx_wrapper_xform_matrix_set" "', argument " "2"" of type '" "double [3][3]""'"); 
+  arg1 = (struct raster *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "raster_width_set" "', argument " "2"" of type '" "unsigned short""'");
   } 
-  arg2 = (double (*)[3])(argp2);
-  {
-    if (arg2) {
-      size_t ii = 0;
-      for (; ii < (size_t)3; ++ii) {
-        if (arg2[ii]) {
-          size_t jj = 0;
-          for (; jj < (size_t)3; ++jj) arg1->xform_matrix[ii][jj] = arg2[ii][jj];
-        } else {
-          SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""xform_matrix""' of type '""double [3][3]""'");
-        }
-      }
-    } else {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""xform_matrix""' of type '""double [3][3]""'");
-    }
-  }
+  arg2 = (unsigned short)(val2);
+  if (arg1) (arg1)->width = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5792,129 +7734,103 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_mx_wrapper_xform_matrix_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_width_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  struct raster *arg1 = (struct raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  double (*result)[3] = 0 ;
+  unsigned short result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "mx_wrapper_xform_matrix_get" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_width_get" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct mx_wrapper *)(argp1);
-  result = (double (*)[3]) ((arg1)->xform_matrix);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_a_3__double, 0 |  0 );
+  arg1 = (struct raster *)(argp1);
+  result = (unsigned short) ((arg1)->width);
+  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_mx_wrapper(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_height_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  int arg1 ;
-  int arg2 ;
-  int arg3 ;
-  int val1 ;
-  int ecode1 = 0 ;
-  int val2 ;
+  struct raster *arg1 = (struct raster *) 0 ;
+  unsigned short arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned short val2 ;
   int ecode2 = 0 ;
-  int val3 ;
-  int ecode3 = 0 ;
-  PyObject *swig_obj[3] ;
-  struct mx_wrapper *result = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "new_mx_wrapper", 3, 3, swig_obj)) SWIG_fail;
-  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_mx_wrapper" "', argument " "1"" of type '" "int""'");
-  } 
-  arg1 = (int)(val1);
-  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_Python_UnpackTuple(args, "raster_height_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_height_set" "', argument " "1"" of type '" "struct raster *""'"); 
+  }
+  arg1 = (struct raster *)(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_mx_wrapper" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = (int)(val2);
-  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "new_mx_wrapper" "', argument " "3"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "raster_height_set" "', argument " "2"" of type '" "unsigned short""'");
   } 
-  arg3 = (int)(val3);
-  result = (struct mx_wrapper *)new_mx_wrapper(arg1,arg2,arg3);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_mx_wrapper, SWIG_POINTER_NEW |  0 );
+  arg2 = (unsigned short)(val2);
+  if (arg1) (arg1)->height = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_mx_wrapper(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_height_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct mx_wrapper *arg1 = (struct mx_wrapper *) 0 ;
+  struct raster *arg1 = (struct raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  unsigned short result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_mx_wrapper, SWIG_POINTER_DISOWN |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_mx_wrapper" "', argument " "1"" of type '" "struct mx_wrapper *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_height_get" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct mx_wrapper *)(argp1);
-  delete_mx_wrapper(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (struct raster *)(argp1);
+  result = (unsigned short) ((arg1)->height);
+  resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *mx_wrapper_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_mx_wrapper, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *mx_wrapper_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  return SWIG_Python_InitShadowInstance(args);
-}
-
-SWIGINTERN PyObject *_wrap_rotations_x_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_pixels_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
-  molecule **arg2 ;
+  struct raster *arg1 = (struct raster *) 0 ;
+  unsigned char *arg2 = (unsigned char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "rotations_x_set", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "raster_pixels_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_x_set" "', argument " "1"" of type '" "struct rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_pixels_set" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct rotations *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_molecule, 0 |  0 );
+  arg1 = (struct raster *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_char, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_x_set" "', argument " "2"" of type '" "molecule *[72]""'"); 
-  } 
-  arg2 = (molecule **)(argp2);
-  {
-    if (arg2) {
-      size_t ii = 0;
-      for (; ii < (size_t)72; ++ii) *(molecule * *)&arg1->x[ii] = *((molecule * *)arg2 + ii);
-    } else {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""x""' of type '""molecule *[72]""'");
-    }
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "raster_pixels_set" "', argument " "2"" of type '" "unsigned char *""'"); 
   }
+  arg2 = (unsigned char *)(argp2);
+  if (arg1) (arg1)->pixels = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5922,58 +7838,51 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_rotations_x_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_pixels_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
+  struct raster *arg1 = (struct raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  molecule **result = 0 ;
+  unsigned char *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_x_get" "', argument " "1"" of type '" "struct rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_pixels_get" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct rotations *)(argp1);
-  result = (molecule **)(molecule **) ((arg1)->x);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_molecule, 0 |  0 );
+  arg1 = (struct raster *)(argp1);
+  result = (unsigned char *) ((arg1)->pixels);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_unsigned_char, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_rotations_y_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_depth_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
-  molecule **arg2 ;
+  struct raster *arg1 = (struct raster *) 0 ;
+  double *arg2 = (double *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "rotations_y_set", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "raster_depth_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_y_set" "', argument " "1"" of type '" "struct rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_depth_set" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct rotations *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_molecule, 0 |  0 );
+  arg1 = (struct raster *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_y_set" "', argument " "2"" of type '" "molecule *[72]""'"); 
-  } 
-  arg2 = (molecule **)(argp2);
-  {
-    if (arg2) {
-      size_t ii = 0;
-      for (; ii < (size_t)72; ++ii) *(molecule * *)&arg1->y[ii] = *((molecule * *)arg2 + ii);
-    } else {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""y""' of type '""molecule *[72]""'");
-    }
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "raster_depth_set" "', argument " "2"" of type '" "double *""'"); 
   }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->depth = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5981,172 +7890,321 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_rotations_y_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_depth_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
+  struct raster *arg1 = (struct raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  molecule **result = 0 ;
+  double *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_y_get" "', argument " "1"" of type '" "struct rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_depth_get" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct rotations *)(argp1);
-  result = (molecule **)(molecule **) ((arg1)->y);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_molecule, 0 |  0 );
+  arg1 = (struct raster *)(argp1);
+  result = (double *) ((arg1)->depth);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_rotations_z_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_raster(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
-  molecule **arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  unsigned short arg1 ;
+  unsigned short arg2 ;
+  unsigned short val1 ;
+  int ecode1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
+  struct raster *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "rotations_z_set", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_z_set" "', argument " "1"" of type '" "struct rotations *""'"); 
-  }
-  arg1 = (struct rotations *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_molecule, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "rotations_z_set" "', argument " "2"" of type '" "molecule *[72]""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "new_raster", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_short(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_raster" "', argument " "1"" of type '" "unsigned short""'");
   } 
-  arg2 = (molecule **)(argp2);
+  arg1 = (unsigned short)(val1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_raster" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
   {
-    if (arg2) {
-      size_t ii = 0;
-      for (; ii < (size_t)72; ++ii) *(molecule * *)&arg1->z[ii] = *((molecule * *)arg2 + ii);
-    } else {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""z""' of type '""molecule *[72]""'");
+    result = (struct raster *)new_raster(arg1,arg2);
+    if (result == NULL)
+    {
+      PyErr_NoMemory();
+      SWIG_fail;
     }
   }
-  resultobj = SWIG_Py_Void();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_raster, SWIG_POINTER_NEW |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_rotations_z_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_raster(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
+  struct raster *arg1 = (struct raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  molecule **result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotations_z_get" "', argument " "1"" of type '" "struct rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_raster" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct rotations *)(argp1);
-  result = (molecule **)(molecule **) ((arg1)->z);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_molecule, 0 |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_new_rotations(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  struct rotations *result = 0 ;
-  
-  if (!SWIG_Python_UnpackTuple(args, "new_rotations", 0, 0, 0)) SWIG_fail;
-  result = (struct rotations *)calloc(1, sizeof(struct rotations));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_rotations, SWIG_POINTER_NEW |  0 );
+  arg1 = (struct raster *)(argp1);
+  delete_raster(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_rotations(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_rgba(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  struct rotations *arg1 = (struct rotations *) 0 ;
+  struct raster *arg1 = (struct raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, SWIG_POINTER_DISOWN |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_rotations" "', argument " "1"" of type '" "struct rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_rgba" "', argument " "1"" of type '" "struct raster *""'"); 
   }
-  arg1 = (struct rotations *)(argp1);
-  free((char *) arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (struct raster *)(argp1);
+  result = (PyObject *)raster_rgba(arg1);
+  resultobj = result;
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *rotations_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *raster_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
   if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_rotations, SWIG_NewClientData(obj));
+  SWIG_TypeNewClientData(SWIGTYPE_p_raster, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
 
-SWIGINTERN PyObject *rotations_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *raster_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_spin(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_rastermalloc(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  molecule *arg1 = (molecule *) 0 ;
+  unsigned short arg1 ;
+  unsigned short arg2 ;
+  unsigned short val1 ;
+  int ecode1 = 0 ;
+  unsigned short val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  raster *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "rastermalloc", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_short(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "rastermalloc" "', argument " "1"" of type '" "unsigned short""'");
+  } 
+  arg1 = (unsigned short)(val1);
+  ecode2 = SWIG_AsVal_unsigned_SS_short(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "rastermalloc" "', argument " "2"" of type '" "unsigned short""'");
+  } 
+  arg2 = (unsigned short)(val2);
+  result = (raster *)rastermalloc(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_raster, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_rasterfree(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  raster *arg1 = (raster *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  rotations *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_molecule, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spin" "', argument " "1"" of type '" "molecule *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rasterfree" "', argument " "1"" of type '" "raster *""'"); 
   }
-  arg1 = (molecule *)(argp1);
-  result = (rotations *)spin(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_rotations, 0 |  0 );
+  arg1 = (raster *)(argp1);
+  rasterfree(arg1);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_rotationsfree(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_raster_atom(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  rotations *arg1 = (rotations *) 0 ;
+  raster *arg1 = (raster *) 0 ;
+  atom *arg2 = (atom *) 0 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
+  double arg6 ;
+  unsigned int arg7 ;
+  unsigned int arg8 ;
+  unsigned int arg9 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  double val6 ;
+  int ecode6 = 0 ;
+  unsigned int val7 ;
+  int ecode7 = 0 ;
+  unsigned int val8 ;
+  int ecode8 = 0 ;
+  unsigned int val9 ;
+  int ecode9 = 0 ;
+  PyObject *swig_obj[9] ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_rotations, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "raster_atom", 9, 9, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "rotationsfree" "', argument " "1"" of type '" "rotations *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_atom" "', argument " "1"" of type '" "raster *""'"); 
   }
-  arg1 = (rotations *)(argp1);
-  rotationsfree(arg1);
+  arg1 = (raster *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_atom, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "raster_atom" "', argument " "2"" of type '" "atom *""'"); 
+  }
+  arg2 = (atom *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "raster_atom" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "raster_atom" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  ecode5 = SWIG_AsVal_double(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "raster_atom" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = (double)(val5);
+  ecode6 = SWIG_AsVal_double(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "raster_atom" "', argument " "6"" of type '" "double""'");
+  } 
+  arg6 = (double)(val6);
+  ecode7 = SWIG_AsVal_unsigned_SS_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "raster_atom" "', argument " "7"" of type '" "unsigned int""'");
+  } 
+  arg7 = (unsigned int)(val7);
+  ecode8 = SWIG_AsVal_unsigned_SS_int(swig_obj[7], &val8);
+  if (!SWIG_IsOK(ecode8)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "raster_atom" "', argument " "8"" of type '" "unsigned int""'");
+  } 
+  arg8 = (unsigned int)(val8);
+  ecode9 = SWIG_AsVal_unsigned_SS_int(swig_obj[8], &val9);
+  if (!SWIG_IsOK(ecode9)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "raster_atom" "', argument " "9"" of type '" "unsigned int""'");
+  } 
+  arg9 = (unsigned int)(val9);
+  raster_atom(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_raster_bond(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  raster *arg1 = (raster *) 0 ;
+  bond *arg2 = (bond *) 0 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
+  double arg6 ;
+  unsigned int arg7 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  double val6 ;
+  int ecode6 = 0 ;
+  unsigned int val7 ;
+  int ecode7 = 0 ;
+  PyObject *swig_obj[7] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "raster_bond", 7, 7, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_raster, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "raster_bond" "', argument " "1"" of type '" "raster *""'"); 
+  }
+  arg1 = (raster *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_bond, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "raster_bond" "', argument " "2"" of type '" "bond *""'"); 
+  }
+  arg2 = (bond *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "raster_bond" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "raster_bond" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  ecode5 = SWIG_AsVal_double(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "raster_bond" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = (double)(val5);
+  ecode6 = SWIG_AsVal_double(swig_obj[5], &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "raster_bond" "', argument " "6"" of type '" "double""'");
+  } 
+  arg6 = (double)(val6);
+  ecode7 = SWIG_AsVal_unsigned_SS_int(swig_obj[6], &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "raster_bond" "', argument " "7"" of type '" "unsigned int""'");
+  } 
+  arg7 = (unsigned int)(val7);
+  raster_bond(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6195,6 +8253,14 @@ static PyMethodDef SwigMethods[] = {
 	 { "delete_bond", _wrap_delete_bond, METH_O, NULL},
 	 { "bond_swigregister", bond_swigregister, METH_O, NULL},
 	 { "bond_swiginit", bond_swiginit, METH_VARARGS, NULL},
+	 { "arena_size_set", _wrap_arena_size_set, METH_VARARGS, NULL},
+	 { "arena_size_get", _wrap_arena_size_get, METH_O, NULL},
+	 { "arena_used_set", _wrap_arena_used_set, METH_VARARGS, NULL},
+	 { "arena_used_get", _wrap_arena_used_get, METH_O, NULL},
+	 { "new_arena", _wrap_new_arena, METH_NOARGS, NULL},
+	 { "delete_arena", _wrap_delete_arena, METH_O, NULL},
+	 { "arena_swigregister", arena_swigregister, METH_O, NULL},
+	 { "arena_swiginit", arena_swiginit, METH_VARARGS, NULL},
 	 { "molecule_atom_max_set", _wrap_molecule_atom_max_set, METH_VARARGS, NULL},
 	 { "molecule_atom_max_get", _wrap_molecule_atom_max_get, METH_O, NULL},
 	 { "molecule_atom_no_set", _wrap_molecule_atom_no_set, METH_VARARGS, NULL},
@@ -6211,26 +8277,49 @@ static PyMethodDef SwigMethods[] = {
 	 { "molecule_bonds_get", _wrap_molecule_bonds_get, METH_O, NULL},
 	 { "molecule_bond_ptrs_set", _wrap_molecule_bond_ptrs_set, METH_VARARGS, NULL},
 	 { "molecule_bond_ptrs_get", _wrap_molecule_bond_ptrs_get, METH_O, NULL},
+	 { "molecule_arena_set", _wrap_molecule_arena_set, METH_VARARGS, NULL},
+	 { "molecule_arena_get", _wrap_molecule_arena_get, METH_O, NULL},
 	 { "new_molecule", _wrap_new_molecule, METH_NOARGS, NULL},
 	 { "delete_molecule", _wrap_delete_molecule, METH_O, NULL},
 	 { "molecule_append_atom", _wrap_molecule_append_atom, METH_VARARGS, NULL},
 	 { "molecule_append_bond", _wrap_molecule_append_bond, METH_VARARGS, NULL},
+	 { "molecule_reserve", _wrap_molecule_reserve, METH_VARARGS, NULL},
+	 { "molecule_append_atom_records", _wrap_molecule_append_atom_records, METH_VARARGS, NULL},
+	 { "molecule_append_bond_records", _wrap_molecule_append_bond_records, METH_VARARGS, NULL},
+	 { "molecule_set_coord_records", _wrap_molecule_set_coord_records, METH_VARARGS, NULL},
+	 { "molecule_coord_records", _wrap_molecule_coord_records, METH_O, NULL},
+	 { "molecule_copy_from", _wrap_molecule_copy_from, METH_VARARGS, NULL},
 	 { "molecule_get_atom", _wrap_molecule_get_atom, METH_VARARGS, NULL},
 	 { "molecule_get_bond", _wrap_molecule_get_bond, METH_VARARGS, NULL},
 	 { "molecule_sort", _wrap_molecule_sort, METH_O, NULL},
 	 { "molecule_xform", _wrap_molecule_xform, METH_VARARGS, NULL},
 	 { "molecule_swigregister", molecule_swigregister, METH_O, NULL},
 	 { "molecule_swiginit", molecule_swiginit, METH_VARARGS, NULL},
+	 { "bond_record_a1_set", _wrap_bond_record_a1_set, METH_VARARGS, NULL},
+	 { "bond_record_a1_get", _wrap_bond_record_a1_get, METH_O, NULL},
+	 { "bond_record_a2_set", _wrap_bond_record_a2_set, METH_VARARGS, NULL},
+	 { "bond_record_a2_get", _wrap_bond_record_a2_get, METH_O, NULL},
+	 { "bond_record_epairs_set", _wrap_bond_record_epairs_set, METH_VARARGS, NULL},
+	 { "bond_record_epairs_get", _wrap_bond_record_epairs_get, METH_O, NULL},
+	 { "new_bond_record", _wrap_new_bond_record, METH_NOARGS, NULL},
+	 { "delete_bond_record", _wrap_delete_bond_record, METH_O, NULL},
+	 { "bond_record_swigregister", bond_record_swigregister, METH_O, NULL},
+	 { "bond_record_swiginit", bond_record_swiginit, METH_VARARGS, NULL},
 	 { "atomset", _wrap_atomset, METH_VARARGS, NULL},
 	 { "atomget", _wrap_atomget, METH_VARARGS, NULL},
 	 { "bondset", _wrap_bondset, METH_VARARGS, NULL},
 	 { "bondget", _wrap_bondget, METH_VARARGS, NULL},
 	 { "compute_coords", _wrap_compute_coords, METH_O, NULL},
 	 { "molmalloc", _wrap_molmalloc, METH_VARARGS, NULL},
+	 { "molreserve", _wrap_molreserve, METH_VARARGS, NULL},
 	 { "molcopy", _wrap_molcopy, METH_O, NULL},
 	 { "molfree", _wrap_molfree, METH_O, NULL},
+	 { "molsize", _wrap_molsize, METH_O, NULL},
 	 { "molappend_atom", _wrap_molappend_atom, METH_VARARGS, NULL},
 	 { "molappend_bond", _wrap_molappend_bond, METH_VARARGS, NULL},
+	 { "molappend_atoms", _wrap_molappend_atoms, METH_VARARGS, NULL},
+	 { "molappend_bond_records", _wrap_molappend_bond_records, METH_VARARGS, NULL},
+	 { "molset_coords", _wrap_molset_coords, METH_VARARGS, NULL},
 	 { "compare_atom", _wrap_compare_atom, METH_VARARGS, NULL},
 	 { "bond_comp", _wrap_bond_comp, METH_VARARGS, NULL},
 	 { "molsort", _wrap_molsort, METH_O, NULL},
@@ -6244,18 +8333,61 @@ static PyMethodDef SwigMethods[] = {
 	 { "delete_mx_wrapper", _wrap_delete_mx_wrapper, METH_O, NULL},
 	 { "mx_wrapper_swigregister", mx_wrapper_swigregister, METH_O, NULL},
 	 { "mx_wrapper_swiginit", mx_wrapper_swiginit, METH_VARARGS, NULL},
+	 { "alloc_stats_mallocs_set", _wrap_alloc_stats_mallocs_set, METH_VARARGS, NULL},
+	 { "alloc_stats_mallocs_get", _wrap_alloc_stats_mallocs_get, METH_O, NULL},
+	 { "alloc_stats_reallocs_set", _wrap_alloc_stats_reallocs_set, METH_VARARGS, NULL},
+	 { "alloc_stats_reallocs_get", _wrap_alloc_stats_reallocs_get, METH_O, NULL},
+	 { "alloc_stats_frees_set", _wrap_alloc_stats_frees_set, METH_VARARGS, NULL},
+	 { "alloc_stats_frees_get", _wrap_alloc_stats_frees_get, METH_O, NULL},
+	 { "alloc_stats_bytes_set", _wrap_alloc_stats_bytes_set, METH_VARARGS, NULL},
+	 { "alloc_stats_bytes_get", _wrap_alloc_stats_bytes_get, METH_O, NULL},
+	 { "alloc_stats_arenas_set", _wrap_alloc_stats_arenas_set, METH_VARARGS, NULL},
+	 { "alloc_stats_arenas_get", _wrap_alloc_stats_arenas_get, METH_O, NULL},
+	 { "alloc_stats_arena_allocs_set", _wrap_alloc_stats_arena_allocs_set, METH_VARARGS, NULL},
+	 { "alloc_stats_arena_allocs_get", _wrap_alloc_stats_arena_allocs_get, METH_O, NULL},
+	 { "new_alloc_stats", _wrap_new_alloc_stats, METH_NOARGS, NULL},
+	 { "delete_alloc_stats", _wrap_delete_alloc_stats, METH_O, NULL},
+	 { "alloc_stats_swigregister", alloc_stats_swigregister, METH_O, NULL},
+	 { "alloc_stats_swiginit", alloc_stats_swiginit, METH_VARARGS, NULL},
+	 { "allocstats", _wrap_allocstats, METH_NOARGS, NULL},
+	 { "allocstats_reset", _wrap_allocstats_reset, METH_NOARGS, NULL},
+	 { "arenamalloc", _wrap_arenamalloc, METH_O, NULL},
+	 { "arenaalloc", _wrap_arenaalloc, METH_VARARGS, NULL},
+	 { "arenafree", _wrap_arenafree, METH_O, NULL},
+	 { "molarenasize", _wrap_molarenasize, METH_VARARGS, NULL},
+	 { "molmalloc_arena", _wrap_molmalloc_arena, METH_VARARGS, NULL},
+	 { "molcopy_arena", _wrap_molcopy_arena, METH_VARARGS, NULL},
 	 { "rotations_x_set", _wrap_rotations_x_set, METH_VARARGS, NULL},
 	 { "rotations_x_get", _wrap_rotations_x_get, METH_O, NULL},
 	 { "rotations_y_set", _wrap_rotations_y_set, METH_VARARGS, NULL},
 	 { "rotations_y_get", _wrap_rotations_y_get, METH_O, NULL},
 	 { "rotations_z_set", _wrap_rotations_z_set, METH_VARARGS, NULL},
 	 { "rotations_z_get", _wrap_rotations_z_get, METH_O, NULL},
+	 { "rotations_arena_set", _wrap_rotations_arena_set, METH_VARARGS, NULL},
+	 { "rotations_arena_get", _wrap_rotations_arena_get, METH_O, NULL},
 	 { "new_rotations", _wrap_new_rotations, METH_NOARGS, NULL},
 	 { "delete_rotations", _wrap_delete_rotations, METH_O, NULL},
 	 { "rotations_swigregister", rotations_swigregister, METH_O, NULL},
 	 { "rotations_swiginit", rotations_swiginit, METH_VARARGS, NULL},
 	 { "spin", _wrap_spin, METH_O, NULL},
 	 { "rotationsfree", _wrap_rotationsfree, METH_O, NULL},
+	 { "raster_width_set", _wrap_raster_width_set, METH_VARARGS, NULL},
+	 { "raster_width_get", _wrap_raster_width_get, METH_O, NULL},
+	 { "raster_height_set", _wrap_raster_height_set, METH_VARARGS, NULL},
+	 { "raster_height_get", _wrap_raster_height_get, METH_O, NULL},
+	 { "raster_pixels_set", _wrap_raster_pixels_set, METH_VARARGS, NULL},
+	 { "raster_pixels_get", _wrap_raster_pixels_get, METH_O, NULL},
+	 { "raster_depth_set", _wrap_raster_depth_set, METH_VARARGS, NULL},
+	 { "raster_depth_get", _wrap_raster_depth_get, METH_O, NULL},
+	 { "new_raster", _wrap_new_raster, METH_VARARGS, NULL},
+	 { "delete_raster", _wrap_delete_raster, METH_O, NULL},
+	 { "raster_rgba", _wrap_raster_rgba, METH_O, NULL},
+	 { "raster_swigregister", raster_swigregister, METH_O, NULL},
+	 { "raster_swiginit", raster_swiginit, METH_VARARGS, NULL},
+	 { "rastermalloc", _wrap_rastermalloc, METH_VARARGS, NULL},
+	 { "rasterfree", _wrap_rasterfree, METH_O, NULL},
+	 { "raster_atom", _wrap_raster_atom, METH_VARARGS, NULL},
+	 { "raster_bond", _wrap_raster_bond, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -6264,8 +8396,11 @@ static PyMethodDef SwigMethods[] = {
 
 static swig_type_info _swigt__p_a_3__a_3__double = {"_p_a_3__a_3__double", "xform_matrix *|double (*)[3][3]", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_a_3__double = {"_p_a_3__double", "double (*)[3]", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_alloc_stats = {"_p_alloc_stats", "alloc_stats *|struct alloc_stats *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_arena = {"_p_arena", "arena *|struct arena *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_atom = {"_p_atom", "atom *|struct atom *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_bond = {"_p_bond", "bond *|struct bond *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_bond_record = {"_p_bond_record", "bond_record *|struct bond_record *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_double = {"_p_double", "double *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_molecule = {"_p_molecule", "molecule *|struct molecule *", 0, 0, (void*)0, 0};
@@ -6273,15 +8408,20 @@ static swig_type_info _swigt__p_mx_wrapper = {"_p_mx_wrapper", "mx_wrapper *|str
 static swig_type_info _swigt__p_p_atom = {"_p_p_atom", "atom **|struct atom **", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_bond = {"_p_p_bond", "bond **|struct bond **", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_molecule = {"_p_p_molecule", "molecule **|struct molecule **", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_raster = {"_p_raster", "raster *|struct raster *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_rotations = {"_p_rotations", "rotations *|struct rotations *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_unsigned_char = {"_p_unsigned_char", "unsigned char *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_unsigned_short = {"_p_unsigned_short", "unsigned short *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_void = {"_p_void", "void *", 0, 0, (void*)0, 0};
 
 static swig_type_info *swig_type_initial[] = {
   &_swigt__p_a_3__a_3__double,
   &_swigt__p_a_3__double,
+  &_swigt__p_alloc_stats,
+  &_swigt__p_arena,
   &_swigt__p_atom,
   &_swigt__p_bond,
+  &_swigt__p_bond_record,
   &_swigt__p_char,
   &_swigt__p_double,
   &_swigt__p_molecule,
@@ -6289,15 +8429,20 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_p_atom,
   &_swigt__p_p_bond,
   &_swigt__p_p_molecule,
+  &_swigt__p_raster,
   &_swigt__p_rotations,
   &_swigt__p_unsigned_char,
   &_swigt__p_unsigned_short,
+  &_swigt__p_void,
 };
 
 static swig_cast_info _swigc__p_a_3__a_3__double[] = {  {&_swigt__p_a_3__a_3__double, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_a_3__double[] = {  {&_swigt__p_a_3__double, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_alloc_stats[] = {  {&_swigt__p_alloc_stats, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_arena[] = {  {&_swigt__p_arena, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_atom[] = {  {&_swigt__p_atom, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_bond[] = {  {&_swigt__p_bond, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_bond_record[] = {  {&_swigt__p_bond_record, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_double[] = {  {&_swigt__p_double, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_molecule[] = {  {&_swigt__p_molecule, 0, 0, 0},{0, 0, 0, 0}};
@@ -6305,15 +8450,20 @@ static swig_cast_info _swigc__p_mx_wrapper[] = {  {&_swigt__p_mx_wrapper, 0, 0,
 static swig_cast_info _swigc__p_p_atom[] = {  {&_swigt__p_p_atom, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_bond[] = {  {&_swigt__p_p_bond, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_molecule[] = {  {&_swigt__p_p_molecule, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_raster[] = {  {&_swigt__p_raster, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_rotations[] = {  {&_swigt__p_rotations, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_unsigned_char[] = {  {&_swigt__p_unsigned_char, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_unsigned_short[] = {  {&_swigt__p_unsigned_short, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_void[] = {  {&_swigt__p_void, 0, 0, 0},{0, 0, 0, 0}};
 
 static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_a_3__a_3__double,
   _swigc__p_a_3__double,
+  _swigc__p_alloc_stats,
+  _swigc__p_arena,
   _swigc__p_atom,
   _swigc__p_bond,
+  _swigc__p_bond_record,
   _swigc__p_char,
   _swigc__p_double,
   _swigc__p_molecule,
@@ -6321,9 +8471,11 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_p_atom,
   _swigc__p_p_bond,
   _swigc__p_p_molecule,
+  _swigc__p_raster,
   _swigc__p_rotations,
   _swigc__p_unsigned_char,
   _swigc__p_unsigned_short,
+  _swigc__p_void,
 };
 
 
@@ -1,10 +1,20 @@
 import sys
+import os
+import hmac
+import threading
 import MolSql
 import MolDisplay
-from MolExceptions import InvalidSdf, DuplicateEntry
+import MolStore
+import MolCache
+import MolProfile
+import MolFlight
+import MolStream
+from MolExceptions import InvalidSdf, DuplicateEntry, MissingEntry, FlightTimeout, SchemaBusy
 from io import TextIOWrapper
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
+import math
+import re
 import urllib
 
 # List of files that client can request
@@ -19,11 +29,84 @@ public_files = [
     "/molecules.css", 
     "/molecules.js"
 ]
-db = MolSql.Database(reset=False)
-db.create_tables()
+# Token that authorises the /admin endpoints, from the MOL_ADMIN_TOKEN environment variable. Unset disables them
+admin_token = os.environ.get("MOL_ADMIN_TOKEN")
+
+# Number of characters buffered before a chunk of a streamed response is written
+stream_buffer_size = 16384
+
+# Margin in pixels around a molecule in a generated svg
+svg_margin = 10
+
+# Default width and height in pixels of png thumbnails
+thumbnail_size = 128
+
+# Default and largest number of molecules returned by a search
+search_limit = 100
+max_search_limit = 1000
+
+# Seconds between keepalive comments on an idle rotation stream, which detect clients that went away
+stream_keepalive = 15
+
+# Seconds a request waits for the schema migration that another request started before it is answered with 503
+schema_wait = 1.0
+
+# Opened, and its schema brought up to date, on the first query
+db = MolSql.Database(reset=False, setup_wait=schema_wait)
+compactor = MolSql.Compactor()
+# Read-only memory-mapped copy of the database (built with "python3 MolStore.py"), if there is one
+store = MolStore.open_store()
+
+# Load the molecule <molName>, from the memory-mapped store when its copy there is current and otherwise from the
+# database
+def load_molecule(molName):
+    if store is not None and store.is_current(molName, db.molecule_id(molName)):
+        return store.load_mol(molName)
+    return db.load_mol(molName)
+
+# Loaded molecules kept in memory, so renders start from a copy instead of the database
+cache = MolCache.MolCache(load_molecule)
+
+# On-demand sampling profiler, started through /admin/profile
+profiler = MolProfile.Profiler()
+
+# Concurrent requests for the same svg render share one computation
+renders = MolFlight.SingleFlight()
+# Renders set the module-level drawing settings of MolDisplay (header, offsets, radii, colours), so only one runs at a time
+render_lock = threading.Lock()
+# The module-level drawing settings of MolDisplay that an svg is generated with
+drawing_settings = ["header", "offsetx", "offsety", "radius", "element_name", "colours"]
+# Incremented whenever the elements change, so renders with different colours or radii are not coalesced
+palette_version = 0
+
+# Interactive rotations streamed through /rotate-stream
+sessions = MolStream.RotationSessions()
+
+# MolServer Class: Extends ThreadingHTTPServer to handle each request in its own thread, with a listen queue long
+# enough for bursts of viewers opening the same molecule
+class MolServer(ThreadingHTTPServer):
+    request_queue_size = 128
 
 # MolHandler Class: Extends BaseHTTPRequestHandler class to provide own do_GET and do_POST methods
 class MolHandler(BaseHTTPRequestHandler):
+    # Handle a request, recording its call stacks while the profiler is running. The database connection the
+    # request used goes back to the pool when it ends, since each connection gets a new handler thread. Requests that
+    # need the database while the first one migrates its schema are answered with 503 instead of waiting for it
+    def handle_one_request(self):
+        try:
+            if not profiler.active:
+                return super().handle_one_request()
+
+            profiler.begin_request()
+            try:
+                super().handle_one_request()
+            finally:
+                profiler.end_request()
+        except SchemaBusy:
+            self.send_unavailable()
+        finally:
+            db.release()
+
     '''
     ' GET METHOD
     '''
@@ -57,6 +140,46 @@ class MolHandler(BaseHTTPRequestHandler):
             self.set_header_info(200, "application/json", len(jsonStr))
             self.wfile.write(bytes(jsonStr, "utf-8"))
 
+        # Search molecules (/search-molecules?name=<substring>&contains=N,O&element=C8-C12&atoms=20-200&limit=<number>).
+        # element can be repeated and takes an element code with a count or a range of counts ("C8", "C8-C12", "C8-").
+        # atoms takes a range of total atom counts ("20-200", "20-", "-200")
+        elif "/search-molecules" in self.path:
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+
+            try:
+                elementRanges = {}
+                for code in query.get("contains", [""])[0].split(","):
+                    if code:
+                        elementRanges[code.strip().title()] = (1, None)
+                for elementRange in query.get("element", []):
+                    match = re.fullmatch(r"([A-Za-z]{1,3}?)(\d+)(?:-(?:\1)?(\d*))?", elementRange.strip())
+                    if match is None:
+                        raise ValueError(elementRange)
+                    minCount = int(match.group(2))
+                    if match.group(3) is None:
+                        maxCount = minCount
+                    else:
+                        maxCount = int(match.group(3)) if match.group(3) else None
+                    elementRanges[match.group(1).title()] = (minCount, maxCount)
+
+                atomRange = (None, None)
+                if "atoms" in query:
+                    minAtoms, _, maxAtoms = query["atoms"][0].partition("-")
+                    atomRange = (int(minAtoms) if minAtoms else None, int(maxAtoms) if maxAtoms else None)
+
+                limit = int(query.get("limit", [search_limit])[0])
+            except ValueError:
+                limit = 0
+
+            if limit < 1 or limit > max_search_limit:
+                self.send_bad_request()
+            else:
+                moleculeList = db.search_molecules(query.get("name", [""])[0], elementRanges, atomRange, limit)
+                jsonStr = json.dumps(moleculeList)
+
+                self.set_header_info(200, "application/json", len(jsonStr))
+                self.wfile.write(bytes(jsonStr, "utf-8"))
+
         # Get list of elements in database and send to client
         elif "/get-elements" in self.path:
             elementList = db.get_elements()
@@ -66,6 +189,69 @@ class MolHandler(BaseHTTPRequestHandler):
             self.set_header_info(200, "application/json", len(jsonStr))
             self.wfile.write(bytes(jsonStr, "utf-8"))
 
+        # Get a png thumbnail of a molecule (/thumbnail?name=<name>&size=<pixels>)
+        elif "/thumbnail" in self.path:
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+
+            molName = query.get("name", [""])[0]
+            try:
+                size = int(query.get("size", [thumbnail_size])[0])
+            except ValueError:
+                size = 0
+
+            stats = db.get_stats(molName)
+            if stats is None or size < 16 or size > 1024:
+                self.send_bad_request()
+            else:
+                newMol = cache.get(molName)
+                with render_lock:
+                    MolDisplay.radius = db.radius()
+                    MolDisplay.colours = db.element_colours()
+                    image = newMol.png(size, stats["min"], stats["max"])
+
+                self.set_header_info(200, 'image/png', len(image))
+                self.wfile.write(image)
+
+        # Stream an interactive rotation of a molecule as server-sent events
+        # (/rotate-stream?name=<name>&xRot=<degrees>&yRot=<degrees>&zRot=<degrees>). Sends a "session" event with the
+        # id that /rotate-update takes and the atoms of each bond, a "frame" event with the compact svg, then a "diff"
+        # event for each update (see MolStream.RotationSession.diff())
+        elif "/rotate-stream" in self.path:
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+
+            molName = query.get("name", [""])[0]
+            try:
+                xRot = int(query.get("xRot", ["0"])[0])
+                yRot = int(query.get("yRot", ["0"])[0])
+                zRot = int(query.get("zRot", ["0"])[0])
+            except ValueError:
+                molName = ""
+
+            if db.get_stats(molName) is None:
+                self.send_bad_request()
+            else:
+                session = sessions.open(molName, cache.get(molName), self.get_stream_header(molName))
+                if session is None:
+                    self.send_unavailable()
+                else:
+                    self.send_events(session, (xRot, yRot, zRot))
+
+        # Get the counters of coalesced svg renders
+        elif "/get-render-stats" in self.path:
+            jsonStr = json.dumps(renders.stats())
+
+            self.set_header_info(200, "application/json", len(jsonStr))
+            self.wfile.write(bytes(jsonStr, "utf-8"))
+
+        # Get the call stacks recorded by the profiler, collapsed for flame graph tools (admin only)
+        elif "/admin/profile" in self.path:
+            if not self.is_admin():
+                self.send_forbidden()
+            else:
+                stacks = profiler.collapsed()
+                self.set_header_info(200, 'text/plain', len(stacks))
+                self.wfile.write(bytes(stacks, "utf-8"))
+
         # Path other than public_files is requested
         else:
             print(self.path)
@@ -92,6 +278,8 @@ class MolHandler(BaseHTTPRequestHandler):
             newMol = MolDisplay.Molecule()
             try:
                 newMol.parse(formPtr)
+                # Conformers/frames in the rest of a multi-record sdf
+                frames = newMol.parse_frames(formPtr)
             except InvalidSdf as err:
                 message = err.message
                 statusCode = 400
@@ -110,8 +298,12 @@ class MolHandler(BaseHTTPRequestHandler):
                 else:
                     # Add molecule to database
                     try:
-                        db.add_molecule(molName, newMol)
+                        aliasOf = db.add_molecule(molName, newMol)
+                        db.add_frames(molName, frames, newMol)
                         db.commit_db()
+                        cache.invalidate(molName)
+                        if aliasOf is not None:
+                            message = "success (same structure as " + aliasOf + ")"
                     except DuplicateEntry as err:
                         statusCode = 400
                         message = err.message
@@ -119,24 +311,44 @@ class MolHandler(BaseHTTPRequestHandler):
             self.set_header_info(statusCode, 'text/plain', len(message))
             self.wfile.write(bytes(message, "utf-8"))
 
+        # Remove a molecule from database
+        elif "/remove-molecule" in self.path:
+            postvars = self.get_postvars()
+
+            molName = postvars["name"][0]
+
+            try:
+                db.remove_molecule(molName)
+            except MissingEntry as err:
+                message = err.message
+                self.set_header_info(400, 'text/plain', len(message))
+                self.wfile.write(bytes(message, "utf-8"))
+            else:
+                cache.invalidate(molName)
+                sessions.close_molecule(molName)
+                compactor.request()
+                message = "successful"
+                self.set_header_info(200, 'text/plain', len(message))
+                self.wfile.write(bytes(message, "utf-8"))
+
         # Get svg string for molecule
         elif "/get-svg" in self.path:
             postvars = self.get_postvars()
 
             molName = postvars["name"][0]
+            compact = postvars.get("compact", ["0"])[0] == "1"
 
-            newMol = db.load_mol(molName)
-            newMol.sort()
-            svgContent = self.get_svg(newMol)
-
-            self.set_header_info(200, 'text/html', len(svgContent))
-            self.wfile.write(bytes(svgContent, "utf-8"))
+            if db.get_stats(molName) is None:
+                self.send_bad_request()
+            else:
+                self.send_render(molName, 0, 0, 0, compact)
 
         # Rotate and get svg string for molecule
         elif "/rotate-svg" in self.path:
             postvars = self.get_postvars()
 
             molName = postvars["name"][0]
+            compact = postvars.get("compact", ["0"])[0] == "1"
             try:
                 xRot = int(postvars["xRot"][0])
                 yRot = int(postvars["yRot"][0])
@@ -144,18 +356,48 @@ class MolHandler(BaseHTTPRequestHandler):
             except ValueError:
                 self.send_bad_request()
             else:
-                if (xRot < 0 or yRot < 0 or zRot < 0):
+                if (xRot < 0 or yRot < 0 or zRot < 0 or db.get_stats(molName) is None):
                     self.send_bad_request()
                 else:
-                    newMol = db.load_mol(molName)
-                    newMol.sort()
-            
-                    newMol.rotate(xRot, yRot, zRot)
+                    self.send_render(molName, xRot, yRot, zRot, compact)
+
+        # Stream every frame of a molecule as svg, one JSON object {"frame": <number>, "svg": <svg>} per line
+        elif "/play-frames" in self.path:
+            postvars = self.get_postvars()
+
+            molName = postvars["name"][0]
+            compact = postvars.get("compact", ["0"])[0] == "1"
+            try:
+                xRot = int(postvars.get("xRot", ["0"])[0])
+                yRot = int(postvars.get("yRot", ["0"])[0])
+                zRot = int(postvars.get("zRot", ["0"])[0])
+            except ValueError:
+                self.send_bad_request()
+            else:
+                if (xRot < 0 or yRot < 0 or zRot < 0 or db.get_stats(molName) is None):
+                    self.send_bad_request()
+                else:
+                    self.send_stream(200, 'application/x-ndjson', self.get_blocks(self.get_frame_chunks(molName, xRot, yRot, zRot, compact)))
 
-                    svgContent = self.get_svg(newMol)
+        # Set the orientation of an interactive rotation opened with /rotate-stream. Any integer angles are accepted
+        elif "/rotate-update" in self.path:
+            postvars = self.get_postvars()
 
-                    self.set_header_info(200, 'text/html', len(svgContent))
-                    self.wfile.write(bytes(svgContent, "utf-8"))
+            session = sessions.get(postvars.get("session", [""])[0])
+            try:
+                xRot = int(postvars["xRot"][0])
+                yRot = int(postvars["yRot"][0])
+                zRot = int(postvars["zRot"][0])
+            except (KeyError, ValueError):
+                session = None
+
+            if session is None:
+                self.send_bad_request()
+            else:
+                session.update(xRot, yRot, zRot)
+                message = "successful"
+                self.set_header_info(200, 'text/plain', len(message))
+                self.wfile.write(bytes(message, "utf-8"))
 
         # Add an element to the database
         elif "/add-element" in self.path:
@@ -200,6 +442,7 @@ class MolHandler(BaseHTTPRequestHandler):
                 try:
                     db.add_element(number, code, name, colour1, colour2, colour3, radius)
                     db.commit_db()
+                    self.palette_changed()
                     message = "successful"
                     self.set_header_info(200, 'text/plain', len(message))
                     self.wfile.write(bytes(message, "utf-8"))
@@ -218,11 +461,41 @@ class MolHandler(BaseHTTPRequestHandler):
 
             db.remove_element(symbol)
             db.commit_db()
+            self.palette_changed()
 
             message = "successful"
             self.set_header_info(200, 'text/plain', len(message))
             self.wfile.write(bytes(message, "utf-8"))
 
+        # Start profiling the next <requests> requests and/or the next <seconds> seconds, or stop=1 (admin only). A
+        # profile that is already running is left as it is and answered with 409
+        elif "/admin/profile" in self.path:
+            if not self.is_admin():
+                self.send_forbidden()
+            else:
+                postvars = self.get_postvars()
+                try:
+                    requests = int(postvars["requests"][0]) if "requests" in postvars else None
+                    seconds = float(postvars["seconds"][0]) if "seconds" in postvars else None
+                except ValueError:
+                    requests = seconds = None
+
+                if "stop" in postvars:
+                    profiler.stop()
+                    message = "stopped"
+                    self.set_header_info(200, 'text/plain', len(message))
+                    self.wfile.write(bytes(message, "utf-8"))
+                elif requests is None and seconds is None:
+                    self.send_bad_request()
+                elif not profiler.start(requests, seconds):
+                    message = "already profiling"
+                    self.set_header_info(409, 'text/plain', len(message))
+                    self.wfile.write(bytes(message, "utf-8"))
+                else:
+                    message = "profiling"
+                    self.set_header_info(200, 'text/plain', len(message))
+                    self.wfile.write(bytes(message, "utf-8"))
+
         # Bad request - Should not reach here typically
         else:
             self.send_response(404)
@@ -235,19 +508,164 @@ class MolHandler(BaseHTTPRequestHandler):
         self.set_header_info(400, 'text/plain', len(message))
         self.wfile.write(bytes(message, "utf-8"))
     
+    # Helper method to send busy message to client when a result it waited for took too long
+    def send_unavailable(self):
+        message = "busy"
+        self.set_header_info(503, 'text/plain', len(message))
+        self.wfile.write(bytes(message, "utf-8"))
+
+    # Helper method to send forbidden message to client when it is not an admin
+    def send_forbidden(self):
+        message = "forbidden"
+        self.set_header_info(403, 'text/plain', len(message))
+        self.wfile.write(bytes(message, "utf-8"))
+
+    # Helper method to check the admin token sent by the client in the X-Admin-Token header
+    def is_admin(self):
+        token = self.headers.get("X-Admin-Token", "")
+        # Compared as bytes, compare_digest() only takes ASCII strings
+        return admin_token is not None and hmac.compare_digest(token.encode(), admin_token.encode())
+
     # Helper method to get the variables sent by client to server
     def get_postvars(self):
         content_length = int(self.headers['Content-Length'])
         body = self.rfile.read(content_length)
         return urllib.parse.parse_qs( body.decode( 'utf-8' ) )
     
-    # Helper method to generate svg string for a molecule
-    def get_svg(self, newMol):
+    # Helper method to stream the svg of the molecule <molName> rotated by <xRot>, <yRot> and <zRot> degrees.
+    # Concurrent requests for the same svg follow one render: its blocks are encoded once and written to every request
+    # as they are produced (see MolFlight.SingleFlight.stream())
+    def send_render(self, molName, xRot, yRot, zRot, compact):
+        def render():
+            newMol = cache.get(molName)
+            newMol.sort()
+            newMol.rotate(xRot, yRot, zRot)
+            return self.get_svg_blocks(molName, newMol, compact)
+
+        try:
+            blocks = renders.stream((molName, xRot, yRot, zRot, compact, palette_version), render)
+        except FlightTimeout:
+            self.send_unavailable()
+        else:
+            self.send_stream(200, 'text/html', blocks)
+
+    # Helper method to note that the elements changed
+    def palette_changed(self):
+        global palette_version
+        with render_lock:
+            palette_version += 1
+
+    # Helper method to generate the svg of the molecule <molName> as a sequence of string chunks in z-order.
+    # Compact svgs place the atoms at integer pixel coordinates in a viewBox centred on the origin
+    def get_svg_chunks(self, molName, newMol, compact=False):
         MolDisplay.radius = db.radius()
         MolDisplay.element_name = db.element_name()
-        MolDisplay.header = """<svg version="1.1" width="3000" height="3000" xmlns="http://www.w3.org/2000/svg">""" + db.radial_gradients()
 
-        return newMol.svg()
+        stats = db.get_stats(molName)
+        if stats is None:
+            size = 3000
+            MolDisplay.offsetx = MolDisplay.offsety = 500
+            elements = list(MolDisplay.radius)
+        else:
+            halfSize = self.get_half_size(stats)
+            size = halfSize * 2
+            MolDisplay.offsetx = MolDisplay.offsety = halfSize
+            elements = stats["elements"]
+
+        if compact:
+            MolDisplay.colours = db.element_colours()
+            MolDisplay.header = MolDisplay.compact_header(-MolDisplay.offsetx, -MolDisplay.offsety, size, elements)
+            MolDisplay.offsetx = MolDisplay.offsety = 0
+            return newMol.compact_svg_chunks()
+
+        MolDisplay.header = """<svg version="1.1" width="%d" height="%d" xmlns="http://www.w3.org/2000/svg">""" % (size, size) \
+            + db.radial_gradients(elements if stats is not None else None)
+
+        return newMol.svg_chunks()
+
+    # Helper method to generate the svg of the molecule <molName> as blocks of bytes for send_stream(). Each block is
+    # generated under render_lock with the drawing settings of this svg put back, so the lock is not held while
+    # a block is written to a client
+    def get_svg_blocks(self, molName, newMol, compact=False):
+        with render_lock:
+            chunks = self.get_svg_chunks(molName, newMol, compact)
+            settings = {name: getattr(MolDisplay, name) for name in drawing_settings}
+
+        blocks = self.get_blocks(chunks)
+        while True:
+            with render_lock:
+                for name, value in settings.items():
+                    setattr(MolDisplay, name, value)
+                block = next(blocks, None)
+            if block is None:
+                return
+            yield block
+
+    # Helper method to get half of the width and height in pixels of an svg that fits a molecule with the stats <stats>
+    # (100 pixels per Angstrom). The extent bounds the molecule for any rotation
+    def get_half_size(self, stats):
+        maxRadius = max([MolDisplay.radius.get(code, 30) for code in stats["elements"]], default=0)
+        return math.ceil(stats["extent"] * 100.0 + maxRadius) + svg_margin
+
+    # Helper method to generate the root element and definitions of the compact svgs of a rotation stream of the
+    # molecule <molName>, with the origin at the centre
+    def get_stream_header(self, molName):
+        with render_lock:
+            MolDisplay.radius = db.radius()
+            MolDisplay.element_name = db.element_name()
+            MolDisplay.colours = db.element_colours()
+
+            stats = db.get_stats(molName)
+            halfSize = self.get_half_size(stats)
+            return MolDisplay.compact_header(-halfSize, -halfSize, halfSize * 2, stats["elements"])
+
+    # Helper method to send the events of the rotation session <session>, starting at <orientation>, until the client
+    # disconnects or the session goes idle
+    def send_events(self, session, orientation):
+        self.send_response(200)
+        self.send_header("Content-type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        # The stream does not use the database, so do not hold a connection while it is open
+        db.release()
+
+        try:
+            self.write_event("session", json.dumps({"id": session.id, "bonds": session.bondAtoms}, separators=(",", ":")))
+            self.write_event("frame", session.svg(orientation))
+            while not sessions.expired(session):
+                orientation = session.wait(stream_keepalive)
+                if session.closed:
+                    break
+                if orientation is None:
+                    self.wfile.write(b": keepalive\n\n")
+                    continue
+
+                changes = session.diff(orientation)
+                if changes is not None:
+                    self.write_event("diff", json.dumps(changes, separators=(",", ":")))
+            self.write_event("end", session.reason if session.closed else "idle")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            sessions.close(session)
+
+    # Helper method to write a server-sent event. <data> must be a single line
+    def write_event(self, event, data):
+        self.wfile.write(bytes("event: %s\ndata: %s\n\n" % (event, data), "utf-8"))
+
+    # Helper method to generate each frame of the molecule <molName> as a line of JSON with its svg. The database
+    # connection goes back to the pool before each frame is sent, so a slow client does not hold it
+    def get_frame_chunks(self, molName, xRot, yRot, zRot, compact=False):
+        newMol = cache.get(molName)
+        for frameNo, coords in enumerate(db.get_frames(molName)):
+            newMol.set_frame(coords)
+            newMol.rotate(xRot, yRot, zRot)
+            newMol.sort()
+            with render_lock:
+                svgContent = "".join(self.get_svg_chunks(molName, newMol, compact))
+            db.release()
+            yield json.dumps({"frame": frameNo, "svg": svgContent}) + "\n"
 
     # Helper method to set the header info before sending response to client
     def set_header_info(self, code, type, length):
@@ -256,11 +674,56 @@ class MolHandler(BaseHTTPRequestHandler):
         self.send_header("Content-length", length)
         self.end_headers()
 
+    # Helper method to stream blocks of bytes (see get_blocks()) to the client without building the whole response in
+    # memory. Uses chunked transfer encoding for HTTP/1.1 clients, otherwise the end of the body is marked by closing the
+    # connection
+    def send_stream(self, code, type, blocks):
+        chunked = self.request_version == "HTTP/1.1"
+        if chunked:
+            self.protocol_version = "HTTP/1.1"
+
+        self.send_response(code)
+        self.send_header("Content-type", type)
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        for block in blocks:
+            self.write_chunk(block, chunked)
+
+        # Terminating zero-length chunk
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    # Helper method to coalesce string chunks into blocks of bytes, so each write to the socket carries a reasonable
+    # amount of data
+    def get_blocks(self, chunks):
+        buffer = []
+        bufferSize = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            bufferSize += len(chunk)
+            if bufferSize >= stream_buffer_size:
+                yield bytes("".join(buffer), "utf-8")
+                buffer = []
+                bufferSize = 0
+        if bufferSize > 0:
+            yield bytes("".join(buffer), "utf-8")
+
+    # Helper method to write a single chunk of a streamed response
+    def write_chunk(self, data, chunked):
+        if chunked:
+            self.wfile.write(b"%X\r\n" % len(data) + data + b"\r\n")
+        else:
+            self.wfile.write(data)
+
 
 if __name__ == "__main__":
     # Run the server at port specified by command-line argument
     if len(sys.argv) == 2:
-        httpd = HTTPServer(('localhost', int(sys.argv[1]) ), MolHandler)
+        httpd = MolServer(('localhost', int(sys.argv[1]) ), MolHandler)
+        compactor.start()
         httpd.serve_forever()
     else:
         print("ERROR: Invalid number of command-line arguments - Enter the port number as the first command-line argument after the program name")
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import molecule
+import MolCache
+import MolDisplay
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Molecules held by the cache and the bytes counted for them
+class TestCacheEntries (unittest.TestCase):
+    def setUp(self):
+        self.loads = []
+        self.cache = MolCache.MolCache(self.load)
+
+    # Loader of molecules with one carbon atom per letter of their name, and no atoms for names starting with "Missing"
+    def load(self, name):
+        self.loads.append(name)
+        newMol = MolDisplay.Molecule()
+        if not name.startswith("Missing"):
+            for i in range(len(name)):
+                newMol.append_atom("C", float(i), 0.0, 0.0)
+        return newMol
+
+    def test_hit(self):
+        self.assertEqual(self.cache.get("Water").atom_no, 5)
+        self.assertEqual(self.cache.get("Water").atom_no, 5)
+        self.assertEqual(self.loads, ["Water"])
+
+    def test_empty_not_cached(self):
+        for i in range(100):
+            self.assertEqual(self.cache.get("Missing%d" % i).atom_no, 0)
+        self.assertEqual(len(self.cache.entries), 0)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_entry_overhead(self):
+        self.cache.get("Water")
+        self.assertEqual(self.cache.size, molecule.molsize(self.load("Water")) + MolCache.entry_overhead)
+
+    def test_eviction(self):
+        entrySize = molecule.molsize(self.load("Water")) + MolCache.entry_overhead
+        self.cache.max_bytes = entrySize * 3
+        for name in ["Aaaaa", "Bbbbb", "Ccccc", "Ddddd"]:
+            self.cache.get(name)
+        self.assertEqual(list(self.cache.entries), ["Bbbbb", "Ccccc", "Ddddd"])
+        self.assertLessEqual(self.cache.size, self.cache.max_bytes)
+
+    def test_invalidate(self):
+        self.cache.get("Water")
+        self.cache.invalidate("Water")
+        self.cache.get("Water")
+        self.assertEqual(self.loads, ["Water", "Water"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolFlight
+from MolExceptions import FlightTimeout
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Computations joined by concurrent requests
+class TestDo (unittest.TestCase):
+    def setUp(self):
+        self.flights = MolFlight.SingleFlight(timeout=5.0)
+        self.release = threading.Event()
+        self.calls = 0
+
+    # Computation that waits for self.release, then returns <result> or raises it if it is an exception
+    def compute(self, result):
+        self.calls += 1
+        self.release.wait(5.0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    # Run do(<key>) for the computation of <result> in another thread, appending its result or exception to <results>
+    def join(self, key, result, results):
+        def run():
+            try:
+                results.append(self.flights.do(key, lambda: self.compute(result)))
+            except Exception as err:
+                results.append(err)
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    # Wait for <condition>() to be true
+    def wait_until(self, condition):
+        deadline = time.monotonic() + 5.0
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def test_shared_result(self):
+        results = []
+        threads = [self.join("key", "svg", results)]
+        self.wait_until(lambda: self.calls == 1)
+        threads += [self.join("key", "other", results) for _ in range(3)]
+        self.wait_until(lambda: self.flights.stats()["coalesced"] == 3)
+        self.release.set()
+        for thread in threads:
+            thread.join(5.0)
+
+        self.assertEqual(results, ["svg"] * 4)
+        self.assertEqual(self.calls, 1)
+        # Nothing is kept once the computation finished
+        self.assertEqual(self.flights.do("key", lambda: "new"), "new")
+
+    def test_error_propagation(self):
+        error = ValueError("bad molecule")
+        results = []
+        threads = [self.join("key", error, results)]
+        self.wait_until(lambda: self.calls == 1)
+        threads += [self.join("key", "svg", results) for _ in range(2)]
+        self.wait_until(lambda: self.flights.stats()["coalesced"] == 2)
+        self.release.set()
+        for thread in threads:
+            thread.join(5.0)
+
+        self.assertEqual(results, [error] * 3)
+        self.assertEqual(self.flights.stats()["errors"], 1)
+        self.assertEqual(self.flights.do("key", lambda: "svg"), "svg")
+
+    def test_timeout(self):
+        self.flights.timeout = 0.05
+        leaderResults = []
+        leader = self.join("key", "svg", leaderResults)
+        self.wait_until(lambda: self.calls == 1)
+
+        with self.assertRaises(FlightTimeout):
+            self.flights.do("key", lambda: self.compute("other"))
+        self.assertEqual(self.flights.stats()["timeouts"], 1)
+
+        # The leader is not affected by its follower giving up
+        self.release.set()
+        leader.join(5.0)
+        self.assertEqual(leaderResults, ["svg"])
+        self.assertEqual(self.calls, 1)
+
+
+# Streamed computations followed by concurrent requests
+class TestStream (unittest.TestCase):
+    def setUp(self):
+        self.flights = MolFlight.SingleFlight(timeout=5.0)
+        self.release = threading.Event()
+
+    # Chunks of a computation that waits for self.release after its first chunk
+    def chunks(self, count=5):
+        yield "0"
+        self.release.wait(5.0)
+        for i in range(1, count):
+            yield str(i)
+
+    # Follow the computation of <key> in another thread, appending its chunks to <results>
+    def follow(self, key, results):
+        thread = threading.Thread(target=lambda: results.append(list(self.flights.stream(key, self.chunks))))
+        thread.start()
+        return thread
+
+    # Wait for <condition>() to be true
+    def wait_until(self, condition):
+        deadline = time.monotonic() + 5.0
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def test_single_request(self):
+        self.release.set()
+        self.assertEqual(list(self.flights.stream("key", self.chunks)), ["0", "1", "2", "3", "4"])
+        self.assertEqual(self.flights.stats()["inFlight"], 0)
+
+    def test_not_buffered_without_followers(self):
+        chunks = self.flights.stream("key", self.chunks)
+        # The first chunk was produced without followers, so a new request starts its own computation
+        self.assertEqual(self.flights.stats()["inFlight"], 0)
+        self.release.set()
+        self.assertEqual(list(chunks), ["0", "1", "2", "3", "4"])
+
+    def test_followers_share_chunks(self):
+        gate = threading.Event()
+        def gated():
+            gate.wait(5.0)
+            yield from self.chunks()
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(list(self.flights.stream("key", gated))))
+        leader.start()
+        self.wait_until(lambda: self.flights.stats()["inFlight"] == 1)
+        followers = [self.follow("key", results) for _ in range(3)]
+        self.wait_until(lambda: self.flights.stats()["coalesced"] == 3)
+        gate.set()
+        self.release.set()
+        for thread in [leader] + followers:
+            thread.join(5.0)
+
+        self.assertEqual(results, [["0", "1", "2", "3", "4"]] * 4)
+        self.assertEqual(self.flights.stats()["leaders"], 1)
+
+    def test_leader_stops_reading(self):
+        gate = threading.Event()
+        def gated():
+            gate.wait(5.0)
+            yield from self.chunks()
+
+        leaderChunks = []
+        def lead():
+            chunks = self.flights.stream("key", gated)
+            leaderChunks.append(next(chunks))
+            chunks.close()
+        leader = threading.Thread(target=lead)
+        leader.start()
+        self.wait_until(lambda: self.flights.stats()["inFlight"] == 1)
+        results = []
+        follower = self.follow("key", results)
+        self.wait_until(lambda: self.flights.stats()["coalesced"] == 1)
+        gate.set()
+        self.release.set()
+        leader.join(5.0)
+        follower.join(5.0)
+
+        # The computation is finished for the follower after the leader went away
+        self.assertEqual(leaderChunks, ["0"])
+        self.assertEqual(results, [["0", "1", "2", "3", "4"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
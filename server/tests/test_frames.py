@@ -0,0 +1,151 @@
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolDisplay
+import MolSql
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+# Atoms (element, x, y, z) and bonds (atom index, atom index) of a small molecule
+atoms = [("O", 0.0, 0.0, 0.0), ("H", 0.9572, 0.0, 0.0), ("H", -0.2400, 0.9266, 0.0), ("C", 0.5, -1.2, 0.3)]
+bonds = [(0, 1), (0, 2), (0, 3)]
+
+# Offset in Angstroms of each atom in each frame after the first record, so every atom moves a little
+frame_moves = [0.01, 0.02, 0.03]
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create a multi-record sdf of the molecule with its atoms in the order <order> (indices into atoms), with one record
+# per frame: the atoms themselves, then the atoms moved by each of frame_moves
+def make_sdf(order):
+    newIndex = {atomIndex: i for i, atomIndex in enumerate(order)}
+    records = []
+    for move in [0.0] + frame_moves:
+        lines = ["Test", "", "", "%3d%3d  0  0  0  0  0  0  0  0999 V2000" % (len(atoms), len(bonds))]
+        for atomIndex in order:
+            element, x, y, z = atoms[atomIndex]
+            lines.append("%10.4f%10.4f%10.4f %-3s 0  0  0  0  0  0  0  0  0  0  0  0"
+                         % (x + move * (atomIndex + 1), y - move, z + move, element))
+        for a1, a2 in bonds:
+            lines.append("%3d%3d  1  0  0  0  0" % (newIndex[a1] + 1, newIndex[a2] + 1))
+        lines += ["M  END", "$$$$"]
+        records.append("\n".join(lines))
+    return "\n".join(records) + "\n"
+
+# Parse a multi-record sdf into its molecule and the frames after the first record
+def parse_sdf(sdf):
+    filePtr = io.StringIO(sdf)
+    newMol = MolDisplay.Molecule()
+    newMol.parse(filePtr)
+    return newMol, newMol.parse_frames(filePtr)
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Frames of uploads that share their structure with a molecule already in the database
+class TestAliasedFrames (unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempDir = tempfile.TemporaryDirectory()
+        # Database works on molecules.db in the current directory
+        os.chdir(self.tempDir.name)
+        self.db = MolSql.Database(reset=True)
+
+    def tearDown(self):
+        self.db.conn.close()
+        os.chdir(self.cwd)
+        self.tempDir.cleanup()
+
+    def add(self, name, sdf):
+        newMol, frames = parse_sdf(sdf)
+        aliasOf = self.db.add_molecule(name, newMol)
+        self.db.add_frames(name, frames, newMol)
+        self.db.commit_db()
+        return aliasOf
+
+    def assertFramesEqual(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for firstFrame, secondFrame in zip(first, second):
+            for firstCoords, secondCoords in zip(firstFrame, secondFrame):
+                for a, b in zip(firstCoords, secondCoords):
+                    self.assertAlmostEqual(a, b, places=4)
+
+    def test_reordered_atoms(self):
+        self.assertIsNone(self.add("Original", make_sdf([0, 1, 2, 3])))
+        self.assertEqual(self.add("Reordered", make_sdf([3, 1, 0, 2])), "Original")
+
+        # The alias shares the atoms of Original, so its frames must follow their order
+        self.assertFramesEqual(list(self.db.get_frames("Reordered")), list(self.db.get_frames("Original")))
+
+        # Each atom only moves by its frame move between frames
+        frames = list(self.db.get_frames("Reordered"))
+        for first, second in zip(frames, frames[1:]):
+            for a, b in zip(first, second):
+                self.assertLess(max(abs(p - q) for p, q in zip(a, b)), 0.1)
+
+    def test_same_order(self):
+        self.add("Original", make_sdf([0, 1, 2, 3]))
+        self.assertEqual(self.add("Copy", make_sdf([0, 1, 2, 3])), "Original")
+        self.assertFramesEqual(list(self.db.get_frames("Copy")), list(self.db.get_frames("Original")))
+
+
+# Molecules with more frames than get_frames() reads at a time
+class TestFrameBatches (unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempDir = tempfile.TemporaryDirectory()
+        os.chdir(self.tempDir.name)
+        self.db = MolSql.Database(reset=True)
+
+        newMol, _ = parse_sdf(make_sdf([0, 1, 2, 3]))
+        self.db.add_molecule("Moving", newMol)
+        # Frame n moves every atom by n / 1000 Angstroms along x
+        self.frameTotal = MolSql.frame_batch_size * 2 + 5
+        self.frames = [[(x + n / 1000.0, y, z) for _, x, y, z in atoms] for n in range(self.frameTotal)]
+        self.db.add_frames("Moving", self.frames[1:])
+        self.db.commit_db()
+
+    def tearDown(self):
+        self.db.conn.close()
+        os.chdir(self.cwd)
+        self.tempDir.cleanup()
+
+    def test_all_frames(self):
+        for start in [0, 1, MolSql.frame_batch_size, self.frameTotal - 1]:
+            frames = list(self.db.get_frames("Moving", start))
+            self.assertEqual(len(frames), self.frameTotal - start)
+            for frame, expected in zip(frames, self.frames[start:]):
+                for coords, expectedCoords in zip(frame, expected):
+                    for a, b in zip(coords, expectedCoords):
+                        self.assertAlmostEqual(a, b, places=4)
+
+    def test_no_open_read(self):
+        frames = self.db.get_frames("Moving")
+        next(frames)
+        next(frames)
+        # Another connection can only lock the database exclusively if no read is in progress
+        other = sqlite3.connect("molecules.db", timeout=0)
+        other.execute("BEGIN EXCLUSIVE;")
+        other.rollback()
+        other.close()
+        self.assertEqual(len(list(frames)), self.frameTotal - 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolDisplay
+import MolSql
+from MolExceptions import SchemaBusy
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+# Number of molecules in the database before its schema was versioned
+molecule_total = 10
+
+# Tables added by the migrations after the first one
+migrated_tables = ["Structures", "MoleculeStructure", "MoleculeStats", "Frames", "MoleculeElement", "MoleculeName"]
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create the molecule number <n>: a chain of n + 2 atoms of carbon, with an oxygen and a nitrogen at the ends
+def make_mol(n):
+    newMol = MolDisplay.Molecule()
+    elements = ["O"] + ["C"] * n + ["N"]
+    for i, element in enumerate(elements):
+        newMol.append_atom(element, i * 1.4, (i % 2) * 0.8, n * 0.01)
+    for i in range(len(elements) - 1):
+        newMol.append_bond(i, i + 1, 1)
+    return newMol
+
+# Create molecules.db as it was before the schema was versioned: only the tables of the first migration, holding
+# molecule_total molecules, at version 0
+def create_legacy_db():
+    db = MolSql.Database(reset=True)
+    for n in range(molecule_total):
+        db.add_molecule("Mol%d" % n, make_mol(n))
+    db.commit_db()
+    for table in migrated_tables:
+        db.conn.execute("DROP TABLE IF EXISTS %s;" % table)
+    db.conn.execute("PRAGMA user_version = 0;")
+    db.conn.commit()
+    db.conn.close()
+
+# Get the number of rows in each table of <tables>
+def row_counts(conn, tables):
+    return {table: conn.execute("SELECT COUNT(*) FROM %s;" % table).fetchone()[0] for table in tables}
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Migrations of a database created before the schema was versioned
+class TestMigrations (unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempDir = tempfile.TemporaryDirectory()
+        # Database works on molecules.db in the current directory
+        os.chdir(self.tempDir.name)
+        create_legacy_db()
+        self.dbs = []
+
+    def tearDown(self):
+        for db in self.dbs:
+            db.release()
+            for conn in db.pool:
+                conn.close()
+        os.chdir(self.cwd)
+        self.tempDir.cleanup()
+
+    def open_db(self, **kwargs):
+        db = MolSql.Database(**kwargs)
+        self.dbs.append(db)
+        return db
+
+    def assertMigrated(self, db):
+        self.assertEqual(db.conn.execute("PRAGMA user_version;").fetchone()[0], len(MolSql.Database.migrations))
+        counts = row_counts(db.conn, ["Structures", "MoleculeStructure", "MoleculeStats"])
+        self.assertEqual(counts, {"Structures": molecule_total, "MoleculeStructure": molecule_total,
+                                  "MoleculeStats": molecule_total})
+
+        # The backfilled tables hold the same data as for molecules added after the migrations
+        for n in range(molecule_total):
+            stats = make_mol(n).stats()
+            storedStats = db.get_stats("Mol%d" % n)
+            self.assertEqual(storedStats["atomNum"], stats["atomNum"])
+            self.assertEqual(storedStats["formula"], stats["formula"])
+            self.assertEqual(db.find_structure(make_mol(n).content_hash())[1], "Mol%d" % n)
+        self.assertEqual(len(db.search_molecules(elementRanges={"C": (5, None)})), molecule_total - 5)
+
+    def test_from_version_0(self):
+        self.assertMigrated(self.open_db())
+
+    def test_batches(self):
+        with mock.patch.object(MolSql, "migration_batch_size", 3):
+            self.assertMigrated(self.open_db())
+
+    def test_writes_between_batches(self):
+        # Another process writes to the database whenever the migration pauses between two batches
+        versions = []
+        def write(seconds):
+            other = sqlite3.connect("molecules.db", timeout=0)
+            with other:
+                other.execute("UPDATE Elements SET RADIUS = RADIUS WHERE ELEMENT_CODE = 'C';")
+            versions.append(other.execute("PRAGMA user_version;").fetchone()[0])
+            other.close()
+
+        with mock.patch.object(MolSql, "migration_batch_size", 3), mock.patch.object(MolSql.time, "sleep", write):
+            self.assertMigrated(self.open_db())
+
+        # The backfills of migrations 2, 3 and 5 each pause between their 4 batches
+        self.assertEqual(len(versions), 9)
+        self.assertTrue(all(version < len(MolSql.Database.migrations) for version in versions))
+
+    def test_resume(self):
+        # Interrupt the migration after its first batch
+        def interrupt(seconds):
+            raise KeyboardInterrupt
+        with mock.patch.object(MolSql, "migration_batch_size", 3), mock.patch.object(MolSql.time, "sleep", interrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.open_db().conn
+
+        conn = sqlite3.connect("molecules.db")
+        self.assertEqual(conn.execute("PRAGMA user_version;").fetchone()[0], 1)
+        self.assertEqual(row_counts(conn, ["MoleculeStructure"]), {"MoleculeStructure": 3})
+        conn.close()
+
+        self.assertMigrated(self.open_db())
+
+    def test_name_index_created_later(self):
+        # As left by a migration with a SQLite without FTS5
+        db = self.open_db()
+        db.conn.execute("DROP TABLE MoleculeName;")
+        db.conn.commit()
+        self.assertFalse(db.has_name_index())
+
+        db = self.open_db()
+        self.assertTrue(db.has_name_index())
+        self.assertEqual([mol["name"] for mol in db.search_molecules(name="Mol7")], ["Mol7"])
+
+    def test_schema_busy(self):
+        db = self.open_db(setup_wait=0.01)
+        # Another thread is migrating the schema
+        db.setupLock.acquire()
+        errors = []
+        def query():
+            try:
+                db.get_stats("Mol1")
+            except SchemaBusy as err:
+                errors.append(err)
+        thread = threading.Thread(target=query)
+        thread.start()
+        thread.join(5.0)
+        db.setupLock.release()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(db.get_stats("Mol1")["atomNum"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolProfile
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Starting and stopping the sampling profiler
+class TestProfiler (unittest.TestCase):
+    def setUp(self):
+        self.profiler = MolProfile.Profiler(interval=0.05)
+
+    def tearDown(self):
+        self.profiler.stop()
+
+    # Get the sampler threads that are running
+    def samplers(self):
+        return [thread for thread in threading.enumerate() if getattr(thread, "_target", None) == self.profiler.sample]
+
+    def test_stop_joins_sampler(self):
+        self.assertTrue(self.profiler.start(seconds=60))
+        sampler = self.profiler.sampler
+        self.profiler.stop()
+        self.assertFalse(sampler.is_alive())
+
+    def test_restart(self):
+        for _ in range(5):
+            self.assertTrue(self.profiler.start(seconds=60))
+            self.profiler.stop()
+        self.assertTrue(self.profiler.start(seconds=60))
+        self.assertEqual(len(self.samplers()), 1)
+
+    def test_restart_after_requests(self):
+        self.assertTrue(self.profiler.start(requests=1))
+        sampler = self.profiler.sampler
+        self.profiler.begin_request()
+        self.profiler.end_request()
+        self.assertFalse(self.profiler.active)
+
+        # The sampler of the finished profile may still be sleeping
+        self.assertTrue(self.profiler.start(requests=1))
+        self.assertFalse(sampler.is_alive())
+        self.assertEqual(len(self.samplers()), 1)
+
+    def test_already_profiling(self):
+        self.assertTrue(self.profiler.start(requests=10))
+        self.assertFalse(self.profiler.start(requests=1, seconds=1))
+        self.assertEqual(self.profiler.requestsLeft, 10)
+        self.assertIsNone(self.profiler.deadline)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolDisplay
+import MolSql
+from MolExceptions import MissingEntry
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create a chain of <length> carbon atoms with an oxygen at the end
+def make_mol(length):
+    newMol = MolDisplay.Molecule()
+    elements = ["C"] * length + ["O"]
+    for i, element in enumerate(elements):
+        newMol.append_atom(element, i * 1.4, (i % 2) * 0.8, 0.0)
+    for i in range(len(elements) - 1):
+        newMol.append_bond(i, i + 1, 1)
+    return newMol
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Removing molecules that share their atoms and bonds with aliases
+class TestRemoveAliases (unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempDir = tempfile.TemporaryDirectory()
+        # Database works on molecules.db in the current directory
+        os.chdir(self.tempDir.name)
+        self.db = MolSql.Database(reset=True)
+
+    def tearDown(self):
+        self.db.conn.close()
+        os.chdir(self.cwd)
+        self.tempDir.cleanup()
+
+    def add(self, name, newMol):
+        aliasOf = self.db.add_molecule(name, newMol)
+        self.db.commit_db()
+        return aliasOf
+
+    # Get the REFCOUNT of the structure of <newMol>, or None if it is not stored
+    def refcount(self, newMol):
+        row = self.db.conn.execute("SELECT REFCOUNT FROM Structures WHERE HASH = ?;", (newMol.content_hash(),)).fetchone()
+        return None if row is None else row[0]
+
+    def count(self, table):
+        return self.db.conn.execute("SELECT COUNT(*) FROM %s;" % table).fetchone()[0]
+
+    def assertLoads(self, name, newMol):
+        loaded = self.db.load_mol(name)
+        self.assertEqual(loaded.atom_no, newMol.atom_no)
+        self.assertEqual(loaded.bond_no, newMol.bond_no)
+        self.assertEqual(loaded.content_hash(), newMol.content_hash())
+
+    def test_aliases_share_structure(self):
+        self.assertIsNone(self.add("Original", make_mol(3)))
+        self.assertEqual(self.add("Alias", make_mol(3)), "Original")
+        self.assertEqual(self.add("Other", make_mol(3)), "Original")
+
+        self.assertEqual(self.refcount(make_mol(3)), 3)
+        # The aliases hold no atoms or bonds of their own
+        self.assertEqual(self.count("Atoms"), 4)
+        self.assertEqual(self.count("Bonds"), 3)
+
+    def test_remove_original(self):
+        self.add("Original", make_mol(3))
+        self.add("Alias", make_mol(3))
+        self.add("Other", make_mol(5))
+
+        self.db.remove_molecule("Original")
+        self.assertEqual(self.refcount(make_mol(3)), 1)
+        self.assertLoads("Alias", make_mol(3))
+        self.assertLoads("Other", make_mol(5))
+        self.assertEqual(self.db.find_structure(make_mol(3).content_hash())[1], "Alias")
+
+        # A new upload of the structure is an alias of the molecule that still holds it
+        self.assertEqual(self.add("Original", make_mol(3)), "Alias")
+        self.assertEqual(self.refcount(make_mol(3)), 2)
+        self.assertLoads("Original", make_mol(3))
+
+    def test_remove_all_aliases(self):
+        self.add("Original", make_mol(3))
+        self.add("Alias", make_mol(3))
+        self.add("Other", make_mol(5))
+
+        self.db.remove_molecule("Alias")
+        self.db.remove_molecule("Original")
+        self.assertIsNone(self.refcount(make_mol(3)))
+        self.assertEqual(self.refcount(make_mol(5)), 1)
+        # Only the atoms and bonds of Other are left
+        self.assertEqual(self.count("Atoms"), 6)
+        self.assertEqual(self.count("Bonds"), 5)
+        self.assertEqual(self.count("MoleculeAtom"), 6)
+        self.assertEqual(self.count("MoleculeStructure"), 1)
+
+        self.assertIsNone(self.add("Original", make_mol(3)))
+        self.assertLoads("Original", make_mol(3))
+
+    def test_missing(self):
+        with self.assertRaises(MissingEntry):
+            self.db.remove_molecule("Missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
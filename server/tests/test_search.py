@@ -0,0 +1,131 @@
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolDisplay
+import MolSql
+
+'''
+******************
+*   CONSTANTS
+******************
+'''
+
+# Number of molecules in the catalog searched
+molecule_total = 60
+
+# Parts of the names of the molecules
+name_parts = ["Caffeine", "Quinoline", "Ethanol", "Benzene", "Water"]
+
+# Searches as search_molecules() arguments
+searches = [
+    {},
+    {"name": "caf"},
+    {"name": "INOL"},
+    {"name": "ne"},
+    {"name": "e1"},
+    {"elementRanges": {"N": (1, None)}},
+    {"elementRanges": {"N": (0, 0)}},
+    {"elementRanges": {"C": (3, 6)}},
+    {"elementRanges": {"C": (2, None), "O": (1, 2), "S": (0, 0)}},
+    {"atomRange": (5, 10)},
+    {"atomRange": (12, None)},
+    {"name": "quin", "elementRanges": {"N": (1, None)}, "atomRange": (None, 14)},
+    {"name": "ol", "elementRanges": {"H": (0, 3)}},
+    {"elementRanges": {"C": (1, None)}, "atomRange": (4, None), "limit": 7},
+]
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create a molecule with <counts> atoms of each element code, all on a line
+def make_mol(counts):
+    newMol = MolDisplay.Molecule()
+    for code, count in counts.items():
+        for _ in range(count):
+            newMol.append_atom(code, newMol.atom_no * 1.4, 0.0, 0.0)
+    return newMol
+
+# Get the names of the molecules of <catalog> (name and element counts, by ascending ID) that match the search
+# arguments <search>, checking each molecule in turn
+def brute_force(catalog, search):
+    names = []
+    for name, counts in catalog:
+        if search.get("name") and search["name"].lower() not in name.lower():
+            continue
+        ranges = search.get("elementRanges", {})
+        if any(not (minCount or 0) <= counts.get(code, 0) <= (sys.maxsize if maxCount is None else maxCount)
+               for code, (minCount, maxCount) in ranges.items()):
+            continue
+        minAtoms, maxAtoms = search.get("atomRange", (None, None))
+        atomNum = sum(counts.values())
+        if (minAtoms is not None and atomNum < minAtoms) or (maxAtoms is not None and atomNum > maxAtoms):
+            continue
+        names.append(name)
+    return names[:search.get("limit", 100)]
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Searches of a catalog of random molecules, compared with checking every molecule
+class TestSearch (unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempDir = tempfile.TemporaryDirectory()
+        # Database works on molecules.db in the current directory
+        os.chdir(self.tempDir.name)
+        self.db = MolSql.Database(reset=True)
+
+        randomizer = random.Random(37)
+        self.catalog = []
+        for n in range(molecule_total):
+            name = "%s%d" % (name_parts[n % len(name_parts)], n)
+            counts = {code: randomizer.randint(0, 6) for code in ["C", "H", "N", "O"]}
+            counts = {code: count for code, count in counts.items() if count > 0} or {"C": 1}
+            self.db.add_molecule(name, make_mol(counts))
+            self.catalog.append((name, counts))
+        self.db.commit_db()
+
+    def tearDown(self):
+        self.db.conn.close()
+        os.chdir(self.cwd)
+        self.tempDir.cleanup()
+
+    def assertSearches(self):
+        for search in searches:
+            with self.subTest(search=search):
+                found = [mol["name"] for mol in self.db.search_molecules(**search)]
+                self.assertEqual(found, brute_force(self.catalog, search))
+
+    def test_searches(self):
+        self.assertSearches()
+
+    def test_searches_without_driver(self):
+        # Every criterion matches too many molecules to collect them, so the search walks the molecules in order
+        with mock.patch.object(MolSql, "search_probe_limit", 1):
+            self.assertSearches()
+
+    def test_searches_without_name_index(self):
+        self.db.conn.execute("DROP TABLE IF EXISTS MoleculeName;")
+        self.db.conn.commit()
+        self.assertSearches()
+
+    def test_stats(self):
+        for mol in self.db.search_molecules(name="Water"):
+            counts = dict(self.catalog)[mol["name"]]
+            self.assertEqual(mol["atomNum"], sum(counts.values()))
+            self.assertEqual(mol["bondNum"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolDisplay
+import MolSql
+import MolStore
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Create a molecule of the atoms <atoms> (element, x, y, z) bonded in a chain
+def make_mol(atoms):
+    newMol = MolDisplay.Molecule()
+    for element, x, y, z in atoms:
+        newMol.append_atom(element, x, y, z)
+    for i in range(len(atoms) - 1):
+        newMol.append_bond(i, i + 1, 1)
+    return newMol
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Copies of molecules in a store that was built before the molecules changed in the database
+class TestStaleStore (unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tempDir = tempfile.TemporaryDirectory()
+        # Database and store work on molecules.db and molecules.store in the current directory
+        os.chdir(self.tempDir.name)
+        self.db = MolSql.Database(reset=True)
+        self.db.add_molecule("Water", make_mol([("O", 0.0, 0.0, 0.0), ("H", 0.96, 0.0, 0.0), ("H", -0.24, 0.93, 0.0)]))
+        self.db.add_molecule("Ethane", make_mol([("C", 0.0, 0.0, 0.0), ("C", 1.54, 0.0, 0.0)]))
+        self.db.commit_db()
+        MolStore.build(self.db)
+
+    def tearDown(self):
+        self.db.conn.close()
+        os.chdir(self.cwd)
+        self.tempDir.cleanup()
+
+    def test_unchanged(self):
+        store = MolStore.open_store()
+        self.assertTrue(store.is_current("Water", self.db.molecule_id("Water")))
+        self.assertEqual(store.load_mol("Water").atom_no, 3)
+        store.close()
+
+    def test_removed(self):
+        self.db.remove_molecule("Water")
+        # A store opened after the change, as by a restarted server
+        store = MolStore.open_store()
+        self.assertFalse(store.is_current("Water", self.db.molecule_id("Water")))
+        self.assertTrue(store.is_current("Ethane", self.db.molecule_id("Ethane")))
+        store.close()
+
+    def test_uploaded_again(self):
+        self.db.remove_molecule("Water")
+        self.db.add_molecule("Water", make_mol([("C", 0.0, 0.0, 0.0)] * 8))
+        self.db.commit_db()
+        store = MolStore.open_store()
+        self.assertFalse(store.is_current("Water", self.db.molecule_id("Water")))
+        self.assertEqual(self.db.load_mol("Water").atom_no, 8)
+        store.close()
+
+    def test_older_version(self):
+        with open("molecules.store", "r+b") as filePtr:
+            filePtr.write(MolStore.header_format.pack(MolStore.magic, MolStore.version - 1))
+        self.assertIsNone(MolStore.open_store())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import itertools
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import MolStream
+
+'''
+******************
+*   FUNCTIONS
+******************
+'''
+
+# Apply the moves <moves> (from MolStream.reorder()) to the z-order <order>, as the client does with insertBefore
+def apply_moves(order, moves):
+    order = list(order)
+    for key, before in moves:
+        order.remove(key)
+        order.insert(len(order) if before is None else order.index(before), key)
+    return order
+
+# Get the length of the longest run of primitives of <old> that kept their order in <new>, by trying every subset
+def longest_kept(old, new):
+    for size in range(len(new), 0, -1):
+        for kept in itertools.combinations(new, size):
+            if sorted(kept, key=old.index) == list(kept):
+                return size
+    return 0
+
+'''
+******************
+*   TESTS
+******************
+'''
+
+# Moves that turn one z-order of the primitives of a molecule into another
+class TestReorder (unittest.TestCase):
+    def assertReorders(self, old, new):
+        moves = MolStream.reorder(old, new)
+        self.assertEqual(apply_moves(old, moves), new)
+        # Only the primitives outside a longest run that kept its order move
+        self.assertEqual(len(moves), len(new) - longest_kept(old, new))
+
+    def test_unchanged(self):
+        order = ["a0", "b0", "a1", "b1", "a2"]
+        self.assertEqual(MolStream.reorder(order, order), [])
+
+    def test_empty(self):
+        self.assertEqual(MolStream.reorder([], []), [])
+
+    def test_swap(self):
+        self.assertEqual(MolStream.reorder(["a0", "a1", "a2"], ["a0", "a2", "a1"]), [["a2", "a1"]])
+
+    def test_move_to_end(self):
+        self.assertEqual(MolStream.reorder(["a0", "a1", "a2"], ["a1", "a2", "a0"]), [["a0", None]])
+
+    def test_reversed(self):
+        order = ["a%d" % i for i in range(6)]
+        self.assertReorders(order, order[::-1])
+
+    def test_all_permutations(self):
+        order = ["a0", "b0", "a1", "b1", "a2"]
+        for new in itertools.permutations(order):
+            self.assertReorders(order, list(new))
+
+    def test_random(self):
+        randomizer = random.Random(35)
+        order = ["a%d" % i for i in range(10)]
+        for _ in range(200):
+            new = order[:]
+            randomizer.shuffle(new)
+            self.assertReorders(order, new)
+
+
+if __name__ == "__main__":
+    unittest.main()